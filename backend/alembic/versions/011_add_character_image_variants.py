@@ -0,0 +1,27 @@
+"""Add resized image variant URLs to characters
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('characters', sa.Column('image_variants', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('characters', sa.Column('background_image_variants', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('characters', 'background_image_variants')
+    op.drop_column('characters', 'image_variants')
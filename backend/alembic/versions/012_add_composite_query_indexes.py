@@ -0,0 +1,58 @@
+"""Add composite and partial indexes for public and overlay queries
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Characters: active roster per campaign, public lookup by slug
+    op.create_index('ix_characters_campaign_id_is_active', 'characters', ['campaign_id', 'is_active'], if_not_exists=True)
+    op.create_index('ix_characters_campaign_id_slug', 'characters', ['campaign_id', 'slug'], if_not_exists=True)
+
+    # Episodes: published list in display order (season DESC, episode_number), lookup by slug
+    op.create_index(
+        'ix_episodes_published_order', 'episodes',
+        ['campaign_id', 'is_published', sa.text('season DESC'), 'episode_number'],
+        if_not_exists=True,
+    )
+    op.create_index('ix_episodes_campaign_id_slug', 'episodes', ['campaign_id', 'slug'], if_not_exists=True)
+
+    # Active episode (latest published) for the overlay
+    op.create_index(
+        'ix_episodes_published_created_at', 'episodes',
+        ['campaign_id', sa.text('created_at DESC')],
+        postgresql_where=sa.text('is_published'),
+        if_not_exists=True,
+    )
+
+    # Episode timelines
+    op.create_index('ix_events_episode_id_timestamp', 'events', ['episode_id', 'timestamp_in_episode'], if_not_exists=True)
+
+    # Default layout per campaign (theme resolution, public layout)
+    op.create_index(
+        'ix_character_layouts_default', 'character_layouts', ['campaign_id'],
+        postgresql_where=sa.text('is_default'),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_character_layouts_default', table_name='character_layouts', if_exists=True)
+    op.drop_index('ix_events_episode_id_timestamp', table_name='events', if_exists=True)
+    op.drop_index('ix_episodes_published_created_at', table_name='episodes', if_exists=True)
+    op.drop_index('ix_episodes_campaign_id_slug', table_name='episodes', if_exists=True)
+    op.drop_index('ix_episodes_published_order', table_name='episodes', if_exists=True)
+    op.drop_index('ix_characters_campaign_id_slug', table_name='characters', if_exists=True)
+    op.drop_index('ix_characters_campaign_id_is_active', table_name='characters', if_exists=True)
@@ -0,0 +1,55 @@
+"""Store events.characters_involved as a GIN-indexed UUID array
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ALTER COLUMN ... USING cannot contain a subquery, so convert through a new column
+    op.execute("ALTER TABLE events ADD COLUMN characters_involved_ids UUID[]")
+
+    # Decode the JSON text arrays, dropping any entries that are not UUIDs
+    op.execute("""
+        UPDATE events
+        SET characters_involved_ids = ARRAY(
+            SELECT value::uuid
+            FROM json_array_elements_text(characters_involved::json) AS value
+            WHERE value ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
+        )
+        WHERE characters_involved IS NOT NULL
+          AND btrim(characters_involved) LIKE '[%';
+    """)
+
+    op.execute("ALTER TABLE events DROP COLUMN characters_involved")
+    op.execute("ALTER TABLE events RENAME COLUMN characters_involved_ids TO characters_involved")
+
+    # "Events involving character X" (characters_involved @> ARRAY[x])
+    op.create_index(
+        'ix_events_characters_involved', 'events', ['characters_involved'],
+        postgresql_using='gin',
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_characters_involved', table_name='events', if_exists=True)
+
+    op.execute("ALTER TABLE events ADD COLUMN characters_involved_text TEXT")
+    op.execute("""
+        UPDATE events
+        SET characters_involved_text = array_to_json(characters_involved)::text
+        WHERE characters_involved IS NOT NULL;
+    """)
+    op.execute("ALTER TABLE events DROP COLUMN characters_involved")
+    op.execute("ALTER TABLE events RENAME COLUMN characters_involved_text TO characters_involved")
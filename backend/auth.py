@@ -2,9 +2,29 @@
 Authentication utilities for user login and campaign token management
 """
 
+import asyncio
 import bcrypt
 import secrets
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from settings import settings
+
+
+# Dedicated, size-limited pool for bcrypt work so password hashing never
+# competes with request handlers for the shared threadpool or event loop
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+
+# Hash operations submitted but not yet finished (queued + running)
+_pending_hash_ops = 0
+_rejected_hash_ops = 0
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many hash operations are already queued (admission control)"""
 
 
 def hash_password(password: str) -> str:
@@ -17,7 +37,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=settings.PASSWORD_HASH_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -39,6 +59,65 @@ def verify_password(password: str, password_hash: str) -> bool:
         return False
 
 
+def password_needs_rehash(password_hash: str) -> bool:
+    """
+    Check whether a bcrypt hash was made with a different cost factor than
+    settings.PASSWORD_HASH_ROUNDS (e.g. after the cost was raised)
+
+    Args:
+        password_hash: Bcrypt hash ("$2b$<cost>$<salt+hash>")
+
+    Returns:
+        True if the hash should be regenerated
+    """
+    try:
+        return int(password_hash.split("$")[2]) != settings.PASSWORD_HASH_ROUNDS
+    except (IndexError, ValueError, AttributeError):
+        return False
+
+
+async def _run_hash_op(func: Callable[..., Any], *args) -> Any:
+    """
+    Run a bcrypt operation on the dedicated pool with admission control
+
+    Raises:
+        PasswordHasherBusy: If PASSWORD_HASH_MAX_PENDING operations are already pending
+    """
+    global _pending_hash_ops, _rejected_hash_ops
+
+    if _pending_hash_ops >= settings.PASSWORD_HASH_MAX_PENDING:
+        _rejected_hash_ops += 1
+        raise PasswordHasherBusy()
+
+    _pending_hash_ops += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, func, *args)
+    finally:
+        _pending_hash_ops -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """Non-blocking hash_password (runs on the password hash pool)"""
+    return await _run_hash_op(hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    """Non-blocking verify_password (runs on the password hash pool)"""
+    return await _run_hash_op(verify_password, password, password_hash)
+
+
+def password_hash_stats() -> Dict[str, int]:
+    """Metrics for the password hash pool"""
+    workers = settings.PASSWORD_HASH_WORKERS
+    return {
+        "workers": workers,
+        "pending": _pending_hash_ops,
+        "queued": max(0, _pending_hash_ops - workers),
+        "rejected": _rejected_hash_ops,
+        "max_pending": settings.PASSWORD_HASH_MAX_PENDING,
+    }
+
+
 def generate_campaign_token() -> str:
     """
     Generate a unique, cryptographically secure token for campaign admin access
@@ -0,0 +1,120 @@
+"""
+Benchmark JSON response encoding for a 100-character campaign
+
+Compares, per request:
+1. Default FastAPI path: jsonable_encoder + JSONResponse (stdlib json)
+2. FastJSONResponse (orjson, no jsonable_encoder pass)
+
+Payloads:
+- /public/campaigns/{slug}/characters (list of Character.to_dict())
+- The same rows with raw UUID/datetime values (encoded natively by orjson)
+
+Runs offline - no server or database needed.
+"""
+import json
+import time
+import uuid
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from models import Character
+from responses import FastJSONResponse
+
+CHARACTER_COUNT = 100
+ITERATIONS = 500
+
+
+def build_characters(count):
+    """Transient Character rows shaped like a real campaign"""
+    campaign_id = uuid.uuid4()
+    now = datetime.utcnow()
+    characters = []
+    for i in range(count):
+        characters.append(Character(
+            id=uuid.uuid4(),
+            campaign_id=campaign_id,
+            name=f"Character {i}",
+            slug=f"character-{i}",
+            class_name="Wizard",
+            race="Half-Elf",
+            player_name=f"Player {i}",
+            description="A wandering scholar of the arcane. " * 4,
+            backstory="Born in a small village on the coast. " * 10,
+            image_url=f"https://example.com/portraits/{i}.webp",
+            image_offset_x=0,
+            image_offset_y=0,
+            image_variants={
+                name: f"https://example.com/portraits/{i}-{name}.webp"
+                for name in ("full", "card", "thumbnail")
+            },
+            is_active=True,
+            level=5,
+            stats={"str": 10, "dex": 14, "con": 12, "int": 18, "wis": 13, "cha": 11, "hp": 32, "ac": 13},
+            color_theme_override={
+                "border_colors": ["#3b82f6", "#8b5cf6"],
+                "text_color": "#FFFFFF",
+                "badge_interior_gradient": {"type": "radial", "colors": ["#1f2937", "#111827"]},
+                "hp_color": {"border": "#ef4444", "text": "#FFFFFF"},
+                "ac_color": {"border": "#3b82f6", "text": "#FFFFFF"},
+            },
+            created_at=now,
+            updated_at=now,
+        ))
+    return characters
+
+
+def native_rows(characters):
+    """Rows with UUID/datetime objects left as-is"""
+    return [
+        {**c.to_dict(), "id": c.id, "campaign_id": c.campaign_id, "created_at": c.created_at, "updated_at": c.updated_at}
+        for c in characters
+    ]
+
+
+def measure(label, render, payload):
+    """CPU time per request in microseconds"""
+    render(payload)  # warm up
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        body = render(payload)
+    elapsed = (time.process_time() - start) / ITERATIONS * 1_000_000
+    print(f"  {label:<32} {elapsed:>10.1f} us/request  ({len(body):,} bytes)")
+    return elapsed
+
+
+def default_render(payload):
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+def fast_render(payload):
+    return FastJSONResponse(payload).body
+
+
+def run_benchmark():
+    characters = build_characters(CHARACTER_COUNT)
+    payloads = {
+        "to_dict() rows": [c.to_dict() for c in characters],
+        "native UUID/datetime rows": native_rows(characters),
+    }
+
+    print("=" * 70)
+    print(f"JSON RESPONSE ENCODING - {CHARACTER_COUNT} characters, {ITERATIONS} iterations")
+    print("=" * 70)
+
+    for name, payload in payloads.items():
+        print(f"\n[{name}]")
+        baseline = measure("jsonable_encoder + json", default_render, payload)
+        fast = measure("FastJSONResponse (orjson)", fast_render, payload)
+        print(f"  Saved: {baseline - fast:.1f} us/request ({baseline / fast:.1f}x faster)")
+
+        # Same document either way
+        assert json.loads(default_render(payload)) == json.loads(fast_render(payload))
+
+    print("\n[OK] Benchmark complete")
+    return True
+
+
+if __name__ == "__main__":
+    run_benchmark()
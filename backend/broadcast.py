@@ -0,0 +1,211 @@
+"""
+Pluggable broadcast backends for WebSocket fan-out
+- memory: deliver to sockets held by this process only (single worker)
+- postgres: relay through Postgres LISTEN/NOTIFY so every worker / Fly machine
+  sharing DATABASE_URL delivers the message to its own sockets
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import threading
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy.engine import make_url
+
+from settings import settings
+
+
+# Callback that delivers a message to the sockets held by this process
+DeliverFn = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+# NOTIFY payloads are limited to 8000 bytes. Chunks are base64 (ASCII, never escaped
+# by json.dumps), so each payload is the chunk plus a fixed ~150-byte envelope
+NOTIFY_CHUNK_SIZE = 7000
+
+logger = logging.getLogger("app")
+
+
+class BroadcastBackend:
+    """Base class - deliver locally, no cross-process relay"""
+
+    def __init__(self):
+        self.deliver: Optional[DeliverFn] = None
+
+    async def start(self, deliver: DeliverFn):
+        self.deliver = deliver
+
+    async def stop(self):
+        pass
+
+    async def publish(self, campaign_id: str, message: Dict[str, Any]):
+        await self.deliver(campaign_id, message)
+
+
+class InMemoryBroadcastBackend(BroadcastBackend):
+    """Default backend: only sockets connected to this process receive the message"""
+
+
+class PostgresBroadcastBackend(BroadcastBackend):
+    """
+    Cross-process backend using Postgres LISTEN/NOTIFY
+    Messages are delivered to local sockets immediately, then published on a
+    channel; other processes deliver them to their own sockets. Each process
+    ignores notifications it published itself.
+    """
+
+    def __init__(self, database_url: str, channel: str):
+        super().__init__()
+        # psycopg2 wants a plain postgresql:// DSN (no SQLAlchemy driver suffix)
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self.listen_conn = None
+        self.publish_conn = None
+        self.publish_lock = threading.Lock()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.reconnect_task: Optional[asyncio.Task] = None
+        self.pending_chunks: Dict[str, List[Optional[str]]] = {}
+        self.stopped = False
+
+    async def start(self, deliver: DeliverFn):
+        await super().start(deliver)
+        self.loop = asyncio.get_running_loop()
+        await self._listen()
+
+    async def stop(self):
+        self.stopped = True
+        if self.reconnect_task:
+            self.reconnect_task.cancel()
+        self._close_listener()
+        with self.publish_lock:
+            if self.publish_conn is not None:
+                self.publish_conn.close()
+                self.publish_conn = None
+
+    # --- Listening ---
+
+    async def _listen(self):
+        import psycopg2
+
+        conn = await asyncio.to_thread(psycopg2.connect, self.dsn)
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(f'LISTEN "{self.channel}"')
+        self.listen_conn = conn
+        # Notifications arrive on the socket; poll only when it is readable
+        self.loop.add_reader(conn.fileno(), self._on_readable)
+        logger.info("Listening on Postgres broadcast channel", extra={"channel": self.channel})
+
+    def _close_listener(self):
+        if self.listen_conn is None:
+            return
+        try:
+            self.loop.remove_reader(self.listen_conn.fileno())
+        except Exception:
+            pass
+        try:
+            self.listen_conn.close()
+        except Exception:
+            pass
+        self.listen_conn = None
+
+    def _on_readable(self):
+        try:
+            self.listen_conn.poll()
+        except Exception as e:
+            logger.warning("Broadcast listener connection lost: %s", e, extra={"channel": self.channel})
+            self._close_listener()
+            if not self.stopped:
+                self.reconnect_task = asyncio.create_task(self._reconnect())
+            return
+
+        while self.listen_conn.notifies:
+            notify = self.listen_conn.notifies.pop(0)
+            self._handle_notification(notify.payload)
+
+    async def _reconnect(self):
+        delay = 1
+        while not self.stopped:
+            await asyncio.sleep(delay)
+            try:
+                await self._listen()
+                return
+            except Exception as e:
+                logger.warning("Broadcast listener reconnect failed: %s", e, extra={"channel": self.channel})
+                delay = min(delay * 2, 30)
+
+    def _handle_notification(self, payload: str):
+        try:
+            envelope = json.loads(payload)
+        except json.JSONDecodeError:
+            return
+
+        # Already delivered locally when it was published
+        if envelope.get("o") == self.origin:
+            return
+
+        data = envelope["d"]
+        if envelope["n"] > 1:
+            # Reassemble chunked messages (chunks of one message share a transaction, in order)
+            chunks = self.pending_chunks.setdefault(envelope["m"], [None] * envelope["n"])
+            chunks[envelope["i"]] = data
+            if any(chunk is None for chunk in chunks):
+                return
+            data = "".join(self.pending_chunks.pop(envelope["m"]))
+
+        message = json.loads(base64.b64decode(data))
+        asyncio.create_task(self.deliver(message["campaign_id"], message["message"]))
+
+    # --- Publishing ---
+
+    async def publish(self, campaign_id: str, message: Dict[str, Any]):
+        # Local sockets first, so this process never waits on Postgres
+        await self.deliver(campaign_id, message)
+
+        data = json.dumps({"campaign_id": campaign_id, "message": message}, separators=(",", ":"))
+        data = base64.b64encode(data.encode("utf-8")).decode("ascii")
+        chunks = [data[i:i + NOTIFY_CHUNK_SIZE] for i in range(0, len(data), NOTIFY_CHUNK_SIZE)]
+        message_id = uuid.uuid4().hex
+        payloads = [
+            json.dumps({"o": self.origin, "m": message_id, "i": i, "n": len(chunks), "d": chunk}, separators=(",", ":"))
+            for i, chunk in enumerate(chunks)
+        ]
+
+        try:
+            await asyncio.to_thread(self._notify, payloads)
+        except Exception:
+            # Best effort - local clients already received the message
+            logger.exception("Broadcast NOTIFY failed", extra={"campaign_id": campaign_id, "chunks": len(payloads)})
+
+    def _notify(self, payloads: List[str]):
+        import psycopg2
+
+        with self.publish_lock:
+            for attempt in range(2):
+                try:
+                    if self.publish_conn is None or self.publish_conn.closed:
+                        self.publish_conn = psycopg2.connect(self.dsn)
+                    # One transaction: chunks are delivered together and in order
+                    with self.publish_conn:
+                        with self.publish_conn.cursor() as cur:
+                            for payload in payloads:
+                                cur.execute("SELECT pg_notify(%s, %s)", (self.channel, payload))
+                    return
+                except psycopg2.OperationalError:
+                    # Stale connection (e.g. Neon idle timeout) - reconnect once
+                    self.publish_conn = None
+                    if attempt == 1:
+                        raise
+
+
+def create_broadcast_backend() -> BroadcastBackend:
+    """Build the backend selected by settings.BROADCAST_BACKEND"""
+    if settings.BROADCAST_BACKEND == "postgres":
+        from database import DATABASE_URL
+        return PostgresBroadcastBackend(DATABASE_URL, settings.BROADCAST_CHANNEL)
+    if settings.BROADCAST_BACKEND == "memory":
+        return InMemoryBroadcastBackend()
+    raise ValueError(f"Unknown BROADCAST_BACKEND: {settings.BROADCAST_BACKEND}")
@@ -0,0 +1,89 @@
+"""
+In-process caching utilities
+Bounded TTL caches for hot lookups (e.g. admin token verification, campaign themes)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Bounded in-process cache with per-entry expiry and LRU eviction
+    Thread-safe: sync endpoints run in FastAPI's threadpool
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, replace_if: Optional[Callable[[Any], bool]] = None):
+        """
+        Store a value, evicting the least recently used entry when full
+        replace_if(current_value) is checked atomically against a live entry;
+        when it returns False the existing value is kept
+        """
+        with self._lock:
+            if replace_if is not None:
+                entry = self._data.get(key)
+                if entry is not None and entry[0] > time.monotonic() and not replace_if(entry[1]):
+                    return
+            self._data[key] = (time.monotonic() + (ttl if ttl is not None else self.ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_if(self, key: Hashable, predicate: Callable[[Any], bool]):
+        """Remove an entry only if predicate(current_value) is true, checked atomically"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and predicate(entry[1]):
+                del self._data[key]
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]):
+        """Remove every entry whose key matches the predicate"""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
@@ -15,21 +15,12 @@ from pydantic import BaseModel
 from database import get_db
 from models import Character, Campaign, User
 from image_upload import upload_character_image, delete_character_image
-from s3_client import S3Client
-from settings import settings
+from s3_client import storage_client
 
 
 # Initialize router
 router = APIRouter(prefix="/characters", tags=["characters"])
 
-# S3/R2 client for image uploads
-s3_client = S3Client(
-    account_id=settings.R2_ACCOUNT_ID,
-    access_key_id=settings.R2_ACCESS_KEY_ID,
-    secret_access_key=settings.R2_SECRET_ACCESS_KEY,
-    bucket_name=settings.R2_BUCKET_NAME,
-)
-
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -193,13 +184,13 @@ async def create_character(
 
         # Upload to R2
         try:
-            result = upload_character_image(
+            result = await upload_character_image(
                 campaign_id=str(campaign.id),
                 character_id=str(character.id),
                 file_content=file_content,
                 content_type=image.content_type,
                 filename=image.filename or "character.webp",
-                s3_client=s3_client
+                s3_client=storage_client
             )
 
             # Update character with image info
@@ -343,13 +334,13 @@ async def update_character(
 
         # Upload to R2 (will delete old image if exists)
         try:
-            result = upload_character_image(
+            result = await upload_character_image(
                 campaign_id=str(campaign.id),
                 character_id=str(character.id),
                 file_content=file_content,
                 content_type=image.content_type,
                 filename=image.filename or "character.webp",
-                s3_client=s3_client,
+                s3_client=storage_client,
                 old_r2_key=character.image_r2_key
             )
 
@@ -401,7 +392,7 @@ async def delete_character(
     # Delete image from R2 if exists
     if character.image_r2_key:
         try:
-            delete_character_image(character.image_r2_key, s3_client)
+            await delete_character_image(character.image_r2_key, storage_client)
         except Exception as e:
             # Log but don't fail the deletion
             print(f"[WARNING] Failed to delete character image: {e}")
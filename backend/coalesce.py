@@ -0,0 +1,91 @@
+"""
+Coalescing of rapid character updates into one CHARS_UPDATED broadcast
+During combat the DM can send several stat/character PATCHes a second; instead of
+broadcasting a full character per request, each campaign collects the changed fields
+for a short window and publishes them together:
+    {"type": "CHARS_UPDATED", "characters": [{"id": "...", "<field>": <value>, ...}, ...]}
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from settings import settings
+
+logger = logging.getLogger("app")
+
+
+# Publishes a message to every process (BroadcastBackend.publish)
+PublishFn = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class CharacterUpdateCoalescer:
+    """Per-campaign buffers of character field changes, flushed once per window"""
+
+    def __init__(self, publish: PublishFn, window_ms: Optional[int] = None):
+        self.publish = publish
+        self.window = (window_ms if window_ms is not None else settings.WS_COALESCE_WINDOW_MS) / 1000
+        # campaign_id -> character_id -> merged changed fields (latest value wins)
+        self.pending: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.timers: Dict[str, asyncio.Task] = {}
+        self.updates = 0
+        self.messages = 0
+
+    async def add(self, campaign_id: str, character_id: str, changes: Dict[str, Any]):
+        """Queue a character's changed fields; published when the campaign's window closes"""
+        self.updates += 1
+        self.pending.setdefault(campaign_id, {}).setdefault(character_id, {}).update(changes)
+
+        if self.window <= 0:
+            await self.flush(campaign_id)
+        elif campaign_id not in self.timers:
+            self.timers[campaign_id] = asyncio.create_task(self._flush_later(campaign_id))
+
+    async def add_batch(self, campaign_id: str, changes: Dict[str, Dict[str, Any]]):
+        """Queue several characters' changed fields and publish them now, as one message"""
+        self.updates += len(changes)
+        batch = self.pending.setdefault(campaign_id, {})
+        for character_id, fields in changes.items():
+            batch.setdefault(character_id, {}).update(fields)
+        await self.flush(campaign_id)
+
+    async def _flush_later(self, campaign_id: str):
+        await asyncio.sleep(self.window)
+        self.timers.pop(campaign_id, None)
+        try:
+            await self.flush(campaign_id)
+        except Exception:
+            logger.exception("Coalesced broadcast flush failed", extra={"campaign_id": campaign_id})
+
+    async def flush(self, campaign_id: str):
+        """
+        Publish a campaign's pending changes now
+        Called before any other broadcast for the campaign so clients never see an
+        older patch arrive after a newer message
+        """
+        timer = self.timers.pop(campaign_id, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+
+        batch = self.pending.pop(campaign_id, None)
+        if not batch:
+            return
+
+        self.messages += 1
+        await self.publish(campaign_id, {
+            "type": "CHARS_UPDATED",
+            "characters": [{"id": character_id, **fields} for character_id, fields in batch.items()],
+        })
+
+    async def flush_all(self):
+        """Publish everything still pending (e.g. on shutdown)"""
+        for campaign_id in list(self.pending):
+            await self.flush(campaign_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "window_ms": int(self.window * 1000),
+            "pending_campaigns": len(self.pending),
+            "updates": self.updates,
+            "messages": self.messages,
+        }
@@ -1,13 +1,22 @@
 """
 Database configuration and session management
+- Sync engine/sessions (psycopg2) for sync handlers, scripts and tests
+- Async engine/sessions (asyncpg) for async handlers, so queries never block the event loop
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, exc, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 from contextlib import contextmanager
 import os
+import threading
+import time
+from typing import Dict, Any, Set
 from dotenv import load_dotenv
-from models import Base
+from models import Base, Character
+from settings import settings
 
 # Load .env file
 load_dotenv()
@@ -18,18 +27,192 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable not set")
 
+
+class PoolStats:
+    """Checkout wait time and exhaustion counters for the connection pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.exhausted = 0  # Checkouts that found every connection (incl. overflow) in use
+        self.timeouts = 0  # Checkouts that gave up after DB_POOL_TIMEOUT
+        self.invalidated = 0  # Connections discarded (failed pre-ping, errors)
+
+    def record_checkout(self, wait: float, exhausted: bool):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if exhausted:
+                self.exhausted += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def record_invalidated(self):
+        with self._lock:
+            self.invalidated += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "exhausted": self.exhausted,
+                "timeouts": self.timeouts,
+                "invalidated": self.invalidated,
+            }
+
+
+pool_stats = PoolStats()
+async_pool_stats = PoolStats()
+
+
+class InstrumentedPoolMixin:
+    """Records how long each checkout waits for a connection (into the class's `stats`)"""
+
+    stats: PoolStats
+
+    def _do_get(self):
+        # max_overflow=-1 means unlimited overflow, so the pool never runs out
+        exhausted = self._max_overflow >= 0 and self.checkedout() >= self.size() + self._max_overflow
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record_timeout()
+            raise
+        self.stats.record_checkout(time.perf_counter() - start, exhausted)
+        return connection
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    stats = pool_stats
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    stats = async_pool_stats
+
+
+# Verify connections before using (skipped behind pgbouncer)
+POOL_PRE_PING = settings.DB_POOL_PRE_PING and not settings.DB_PGBOUNCER_MODE
+
 # Create engine
 engine = create_engine(
     DATABASE_URL,
     echo=os.getenv("ENV") == "development",  # Log SQL in dev mode
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=5,
-    max_overflow=10,
+    poolclass=InstrumentedQueuePool,
+    pool_pre_ping=POOL_PRE_PING,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+)
+
+
+@event.listens_for(engine, "invalidate")
+def _count_invalidated(dbapi_connection, connection_record, exception):
+    pool_stats.record_invalidated()
+
+
+def async_database_url(database_url: str):
+    """
+    asyncpg URL and connect args for DATABASE_URL
+    libpq-only query parameters (sslmode, channel_binding) are translated or dropped
+    """
+    url = make_url(database_url)
+    connect_args = {}
+
+    sslmode = url.query.get("sslmode")
+    if sslmode and sslmode != "disable":
+        connect_args["ssl"] = sslmode
+
+    url = url.set(drivername="postgresql+asyncpg").difference_update_query(["sslmode", "channel_binding"])
+
+    if settings.DB_PGBOUNCER_MODE:
+        # Transaction pooling cannot keep prepared statements between transactions
+        connect_args["statement_cache_size"] = 0
+        url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+
+    return url, connect_args
+
+
+_async_url, _async_connect_args = async_database_url(DATABASE_URL)
+
+# Async engine (same pool settings as the sync one)
+async_engine = create_async_engine(
+    _async_url,
+    echo=os.getenv("ENV") == "development",
+    connect_args=_async_connect_args,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_pre_ping=POOL_PRE_PING,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
 
+
+@event.listens_for(async_engine.sync_engine, "invalidate")
+def _count_async_invalidated(dbapi_connection, connection_record, exception):
+    async_pool_stats.record_invalidated()
+
+
+def _pool_snapshot(pool, stats: PoolStats) -> Dict[str, Any]:
+    return {
+        "size": pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "pre_ping": POOL_PRE_PING,
+        **stats.snapshot(),
+    }
+
+
+def pool_metrics() -> Dict[str, Any]:
+    """Current occupancy plus cumulative checkout stats for both pools (for /metrics)"""
+    return {
+        "sync": _pool_snapshot(engine.pool, pool_stats),
+        "async": _pool_snapshot(async_engine.sync_engine.pool, async_pool_stats),
+    }
+
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async session factory - attributes stay loaded after commit (no implicit IO on access)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+# session.info key: {character_id: set of to_dict() fields changed by this session's flushes}
+CHARACTER_CHANGES_KEY = "character_changes"
+
+
+@event.listens_for(Session, "before_flush")
+def _record_character_changes(session, flush_context, instances):
+    """Record which serialized Character fields each flush writes (from attribute history)"""
+    changes = session.info.setdefault(CHARACTER_CHANGES_KEY, {})
+    for obj in session.dirty:
+        if not isinstance(obj, Character):
+            continue
+        attrs = inspect(obj).attrs
+        fields = {field for field in Character.SERIALIZABLE_FIELDS if attrs[field].history.has_changes()}
+        if fields:
+            changes.setdefault(str(obj.id), set()).update(fields)
+
+
+def pop_character_changes(session) -> Dict[str, Set[str]]:
+    """
+    Changed Character fields recorded since the last call, by character ID
+    Works for Session and AsyncSession (both expose the sync session's info)
+    """
+    return session.info.pop(CHARACTER_CHANGES_KEY, {})
+
 
 def init_db():
     """
@@ -62,3 +245,12 @@ def get_db_context():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncSession:
+    """
+    Dependency for async FastAPI routes to get an async database session
+    Usage: async def my_route(db: AsyncSession = Depends(get_async_db)):
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -6,7 +6,6 @@ Phase 2: Episode timeline and event tracking
 import uuid
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-import json
 
 from fastapi import APIRouter, Depends, HTTPException, Header
 from sqlalchemy.orm import Session
@@ -15,6 +14,7 @@ from pydantic import BaseModel
 
 from database import get_db
 from models import Campaign, Episode, Event, User
+from responses import FastJSONResponse
 
 
 # ============================================================================
@@ -88,6 +88,20 @@ def verify_episode_ownership(episode_id: str, user: User, db: Session) -> Episod
     return episode
 
 
+def parse_character_ids(character_ids: Optional[List[str]]) -> Optional[List[uuid.UUID]]:
+    """Convert characters_involved strings to UUIDs (400 on an invalid ID)"""
+    if character_ids is None:
+        return None
+
+    parsed = []
+    for char_id_str in character_ids:
+        try:
+            parsed.append(uuid.UUID(char_id_str))
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid character ID: {char_id_str}")
+    return parsed
+
+
 # ============================================================================
 # REQUEST/RESPONSE MODELS
 # ============================================================================
@@ -187,7 +201,7 @@ def create_episode(
     return episode.to_dict()
 
 
-@router.get("/campaigns/{campaign_id}/episodes")
+@router.get("/campaigns/{campaign_id}/episodes", response_class=FastJSONResponse)
 def list_episodes(
     campaign_id: str,
     user: User = Depends(get_current_user),
@@ -205,10 +219,10 @@ def list_episodes(
         Episode.campaign_id == campaign.id
     ).order_by(Episode.season, Episode.episode_number).all()
 
-    return [ep.to_dict() for ep in episodes]
+    return FastJSONResponse([ep.to_dict() for ep in episodes])
 
 
-@router.get("/episodes/{episode_id}")
+@router.get("/episodes/{episode_id}", response_class=FastJSONResponse)
 def get_episode(
     episode_id: str,
     user: User = Depends(get_current_user),
@@ -222,7 +236,7 @@ def get_episode(
     episode = verify_episode_ownership(episode_id, user, db)
 
     # Return episode with events included
-    return episode.to_dict(include_events=True)
+    return FastJSONResponse(episode.to_dict(include_events=True))
 
 
 @router.patch("/episodes/{episode_id}")
@@ -311,11 +325,6 @@ def create_event(
     # Verify ownership
     episode = verify_episode_ownership(episode_id, user, db)
 
-    # Convert characters_involved list to JSON string
-    characters_json = None
-    if payload.characters_involved:
-        characters_json = json.dumps(payload.characters_involved)
-
     # Create event
     event = Event(
         episode_id=episode.id,
@@ -323,7 +332,7 @@ def create_event(
         description=payload.description,
         timestamp_in_episode=payload.timestamp_in_episode,
         event_type=payload.event_type,
-        characters_involved=characters_json,
+        characters_involved=parse_character_ids(payload.characters_involved),
     )
 
     db.add(event)
@@ -333,7 +342,7 @@ def create_event(
     return event.to_dict()
 
 
-@router.get("/episodes/{episode_id}/events")
+@router.get("/episodes/{episode_id}/events", response_class=FastJSONResponse)
 def list_events(
     episode_id: str,
     user: User = Depends(get_current_user),
@@ -351,7 +360,7 @@ def list_events(
         Event.episode_id == episode.id
     ).order_by(Event.timestamp_in_episode).all()
 
-    return [event.to_dict() for event in events]
+    return FastJSONResponse([event.to_dict() for event in events])
 
 
 @router.patch("/episodes/{episode_id}/events/{event_id}")
@@ -392,7 +401,7 @@ def update_event(
     if payload.event_type is not None:
         event.event_type = payload.event_type
     if payload.characters_involved is not None:
-        event.characters_involved = json.dumps(payload.characters_involved)
+        event.characters_involved = parse_character_ids(payload.characters_involved)
 
     event.updated_at = datetime.utcnow()
     db.commit()
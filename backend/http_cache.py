@@ -0,0 +1,67 @@
+"""
+HTTP caching for public read endpoints
+Strong ETags built from updated_at timestamps (plus row counts, so deletes
+are seen), 304 Not Modified handling for If-None-Match, Last-Modified and
+Cache-Control headers so browsers and a CDN can reuse responses between changes.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from responses import FastJSONResponse
+from settings import settings
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag from the values that determine a response body"""
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def _http_date(value: datetime) -> str:
+    # updated_at columns are naive UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _cache_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={settings.PUBLIC_CACHE_MAX_AGE}, "
+            f"stale-while-revalidate={settings.PUBLIC_CACHE_STALE_WHILE_REVALIDATE}"
+        ),
+    }
+    if last_modified:
+        headers["Last-Modified"] = _http_date(last_modified)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Whether the request's If-None-Match matches the current ETag
+    If-Modified-Since is deliberately ignored: deleting a row does not move
+    max(updated_at), so only the ETag (which also covers row counts) is trusted
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # Weak comparison, as required for If-None-Match
+    return "*" in candidates or etag in [tag[2:] if tag.startswith("W/") else tag for tag in candidates]
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime]) -> Response:
+    """Empty 304 carrying the same validators and Cache-Control"""
+    return Response(status_code=304, headers=_cache_headers(etag, last_modified))
+
+
+def cacheable_response(content: Any, etag: str, last_modified: Optional[datetime]) -> FastJSONResponse:
+    """JSON response with ETag, Last-Modified and Cache-Control"""
+    return FastJSONResponse(content, headers=_cache_headers(etag, last_modified))
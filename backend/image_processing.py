@@ -0,0 +1,58 @@
+"""
+Image processing for uploads
+Decodes an upload once and produces resized WebP variants at fixed widths
+"""
+
+from io import BytesIO
+from typing import Dict
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from settings import settings
+
+
+# Variant name -> max width in pixels (never upscaled)
+IMAGE_VARIANT_WIDTHS = {
+    "full": 1200,
+    "card": 480,
+    "thumbnail": 160,
+}
+
+
+def build_webp_variants(file_content: bytes) -> Dict[str, bytes]:
+    """
+    Resize an image to every variant width and encode each as WebP
+
+    Args:
+        file_content: Original image bytes (jpg, png or webp)
+
+    Returns:
+        {variant_name: webp_bytes}
+
+    Raises:
+        ValueError: If the bytes are not a decodable image
+    """
+    try:
+        image = Image.open(BytesIO(file_content))
+        image.load()
+    except (UnidentifiedImageError, OSError) as e:
+        raise ValueError(f"Invalid image file: {str(e)}")
+
+    # Respect camera orientation, then normalize the mode for WebP
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() or image.mode == "P" else "RGB")
+
+    variants = {}
+    # Largest first: each smaller variant is resized from the previous one
+    current = image
+    for name, width in sorted(IMAGE_VARIANT_WIDTHS.items(), key=lambda item: item[1], reverse=True):
+        if current.width > width:
+            height = max(1, round(current.height * width / current.width))
+            current = current.resize((width, height), Image.LANCZOS)
+
+        buffer = BytesIO()
+        current.save(buffer, format="WEBP", quality=settings.IMAGE_WEBP_QUALITY, method=4)
+        variants[name] = buffer.getvalue()
+
+    return variants
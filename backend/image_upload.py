@@ -3,12 +3,14 @@ Image upload utilities for character images
 Handles uploads to Cloudflare R2 with proper path management
 """
 
+import asyncio
 from typing import Dict, Optional
 from s3_client import S3Client
 from settings import settings
+from image_processing import build_webp_variants
 
 
-def upload_character_image(
+async def upload_character_image(
     campaign_id: str,
     character_id: str,
     file_content: bytes,
@@ -26,7 +28,7 @@ def upload_character_image(
         file_content: Image file bytes
         content_type: MIME type (e.g., "image/jpeg")
         filename: Original filename
-        s3_client: S3Client instance
+        s3_client: Storage client (S3Client or FilesystemStorageClient)
         old_r2_key: Previous R2 key to delete (if replacing image)
 
     Returns:
@@ -38,7 +40,7 @@ def upload_character_image(
     # Delete old image if exists
     if old_r2_key:
         try:
-            s3_client.delete_image(old_r2_key)
+            await s3_client.delete_image_async(old_r2_key)
         except Exception as e:
             # Log but don't fail - old image might already be deleted
             print(f"[WARNING] Failed to delete old image {old_r2_key}: {e}")
@@ -48,7 +50,7 @@ def upload_character_image(
 
     # Upload to R2
     try:
-        url = s3_client.upload_image(r2_key, file_content, content_type)
+        url = await s3_client.upload_image_async(r2_key, file_content, content_type)
     except Exception as e:
         raise Exception(f"Failed to upload character image: {str(e)}")
 
@@ -58,13 +60,13 @@ def upload_character_image(
     }
 
 
-def delete_character_image(r2_key: str, s3_client: S3Client) -> bool:
+async def delete_character_image(r2_key: str, s3_client: S3Client) -> bool:
     """
     Delete character image from R2 storage
 
     Args:
         r2_key: R2 storage key to delete
-        s3_client: S3Client instance
+        s3_client: Storage client (S3Client or FilesystemStorageClient)
 
     Returns:
         True if successful
@@ -73,6 +75,42 @@ def delete_character_image(r2_key: str, s3_client: S3Client) -> bool:
         Exception: If deletion fails
     """
     try:
-        return s3_client.delete_image(r2_key)
+        return await s3_client.delete_image_async(r2_key)
     except Exception as e:
         raise Exception(f"Failed to delete character image: {str(e)}")
+
+
+async def upload_image_variants(
+    key_prefix: str,
+    file_content: bytes,
+    s3_client: S3Client
+) -> Dict[str, Dict[str, str]]:
+    """
+    Decode an uploaded image once, resize it to the fixed WebP variants
+    (thumbnail, card, full) and upload every variant
+
+    Args:
+        key_prefix: Storage key without suffix, e.g. "campaign-slug/portraits/{character_id}"
+        file_content: Original image bytes (jpg, png or webp)
+        s3_client: Storage client (S3Client or FilesystemStorageClient)
+
+    Returns:
+        {variant_name: {"url": ..., "r2_key": ...}}
+
+    Raises:
+        ValueError: If the image cannot be decoded
+        Exception: If an upload fails
+    """
+    # Resizing is CPU-bound - keep it off the event loop
+    variants = await asyncio.to_thread(build_webp_variants, file_content)
+
+    keys = {name: f"{key_prefix}-{name}.webp" for name in variants}
+    urls = await asyncio.gather(*[
+        s3_client.upload_image_async(keys[name], data, "image/webp")
+        for name, data in variants.items()
+    ])
+
+    return {
+        name: {"url": url, "r2_key": keys[name]}
+        for name, url in zip(variants, urls)
+    }
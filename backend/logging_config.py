@@ -0,0 +1,127 @@
+"""
+Structured logging for the API
+- JSON lines with a per-request ID (X-Request-ID)
+- Level gating via settings.LOG_LEVEL
+- Non-blocking: handlers only enqueue records; a background listener thread
+  does the formatting and stdout I/O
+- Debug payload dumps are opt-in per route via settings.LOG_DEBUG_ROUTES
+"""
+
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Optional
+
+from settings import settings
+
+
+# Request ID for the current request (set by the middleware in main.py)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else was passed via `extra=`
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Renders tracebacks in StructuredQueueHandler.prepare
+_exception_formatter = logging.Formatter()
+
+
+class RequestIdFilter(logging.Filter):
+    """Attach the current request ID to every record (captured at log time, on the request's context)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including `extra=` fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that keeps the traceback as its own field
+    The stock prepare() formats the record, folding the traceback into `msg`, and clears
+    exc_info; here only the message and traceback are rendered (on the logging thread,
+    as QueueHandler does) and the rest is left for the listener's JsonFormatter
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def setup_logging() -> logging.Logger:
+    """
+    Configure the "app" logger with a QueueHandler feeding a background listener
+    Safe to call more than once
+    """
+    global _listener
+
+    logger = logging.getLogger("app")
+    logger.setLevel(settings.LOG_LEVEL.upper())
+    logger.propagate = False
+
+    if _listener is None:
+        log_queue: queue.Queue = queue.Queue(-1)
+
+        queue_handler = StructuredQueueHandler(log_queue)
+        queue_handler.addFilter(RequestIdFilter())
+        logger.addHandler(queue_handler)
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(JsonFormatter())
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+
+    return logger
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def debug_payloads_enabled(route: str) -> bool:
+    """
+    Whether full payload dumps are enabled for a route (handler name)
+    settings.LOG_DEBUG_ROUTES is a comma-separated list of handler names, or "*"
+    """
+    if not settings.LOG_DEBUG_ROUTES:
+        return False
+    if not logging.getLogger("app").isEnabledFor(logging.DEBUG):
+        return False
+    routes = {r.strip() for r in settings.LOG_DEBUG_ROUTES.split(",")}
+    return "*" in routes or route in routes
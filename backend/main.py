@@ -4,31 +4,44 @@ Multi-tenant D&D campaign companion with real-time WebSocket updates
 """
 
 import os
-import json
 import asyncio
 import uuid
 import sys
-import logging
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Set
+from typing import Optional, Dict, Any, List, Set, NamedTuple
 from io import BytesIO
 
-from fastapi import FastAPI, Depends, HTTPException, WebSocket, WebSocketDisconnect, UploadFile, File, Header, Form, Request, Path
+from fastapi import FastAPI, Depends, HTTPException, WebSocket, WebSocketDisconnect, UploadFile, File, Header, Form, Request, Path, Query
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from fastapi.staticfiles import StaticFiles
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, func, select, update, case, literal
+from sqlalchemy.dialects.postgresql import JSONB
 from pydantic import BaseModel
 
 from settings import settings
-from database import init_db, get_db, get_db_context, SessionLocal
+from database import init_db, get_db, get_async_db, get_db_context, SessionLocal, async_engine, pool_metrics, pop_character_changes
 from models import (
     Campaign, Character, Episode, Event, Roster, LayoutOverrides, User, Base, CharacterLayout
 )
-from schemas import CharacterUpdateRequest, CharacterThemeOverrideInput, CharacterLayoutCreateRequest, CharacterLayoutUpdateRequest, CharacterLayoutResponse, PresetColorScheme
+from schemas import CharacterUpdateRequest, CharacterStatsBatchRequest, CharacterThemeOverrideInput, CharacterLayoutCreateRequest, CharacterLayoutUpdateRequest, CharacterLayoutResponse, PresetColorScheme
 from presets import get_all_presets, cycle_preset
-from s3_client import S3Client
-from auth import hash_password, verify_password, generate_campaign_token
-from episodes import router as episodes_router
+from s3_client import storage_client, FilesystemStorageClient
+from auth import (
+    hash_password_async, verify_password_async, password_needs_rehash, password_hash_stats,
+    PasswordHasherBusy, generate_campaign_token
+)
+from episodes import router as episodes_router, parse_character_ids
+from image_upload import upload_image_variants
+from realtime import ConnectionManager, encode_message, PING, PONG
+from snapshots import SnapshotStore
+from coalesce import CharacterUpdateCoalescer
+from broadcast import create_broadcast_backend
+from cache import TTLCache
+from responses import FastJSONResponse
+from http_cache import make_etag, is_not_modified, not_modified_response, cacheable_response
+from logging_config import setup_logging, stop_logging, request_id_var, debug_payloads_enabled
 
 # ============================================================================
 # APP SETUP
@@ -40,9 +53,21 @@ app = FastAPI(
     description="Multi-tenant D&D campaign companion API"
 )
 
-# Configure logging
-logger = logging.getLogger("app")
-logger.setLevel(logging.DEBUG)
+# Configure logging (structured, non-blocking - see logging_config.py)
+logger = setup_logging()
+
+
+@app.middleware("http")
+async def request_id_middleware(request: Request, call_next):
+    """Tag each request with an ID (client-supplied X-Request-ID or generated) for log correlation"""
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = request_id_var.set(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        request_id_var.reset(token)
+    response.headers["X-Request-ID"] = request_id
+    return response
 
 # CORS configuration - Allow all origins for development
 app.add_middleware(
@@ -51,16 +76,12 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Request-ID"],
 )
 
-# S3/R2 client for image uploads
-s3_client = S3Client(
-    account_id=settings.R2_ACCOUNT_ID,
-    access_key_id=settings.R2_ACCESS_KEY_ID,
-    secret_access_key=settings.R2_SECRET_ACCESS_KEY,
-    bucket_name=settings.R2_BUCKET_NAME,
-    public_url=settings.R2_PUBLIC_URL,
-)
+# Local filesystem storage backend (development/tests): serve uploads directly
+if isinstance(storage_client, FilesystemStorageClient):
+    app.mount("/uploads", StaticFiles(directory=storage_client.root_dir), name="uploads")
 
 # ============================================================================
 # STARTUP & SHUTDOWN
@@ -77,13 +98,69 @@ def startup():
         raise
 
 
+@app.on_event("startup")
+async def start_broadcast_backend():
+    """Start the WebSocket broadcast backend (in-memory or Postgres LISTEN/NOTIFY)"""
+    global event_loop
+    event_loop = asyncio.get_running_loop()
+    await broadcast_backend.start(deliver_to_local_clients)
+
+
+@app.on_event("startup")
+async def start_websocket_heartbeats():
+    """Ping WebSocket clients and reap the ones that stop answering"""
+    campaign_connections.start_heartbeat()
+    overlay_connections.start_heartbeat()
+
+
+@app.on_event("shutdown")
+async def stop_websocket_heartbeats():
+    campaign_connections.stop_heartbeat()
+    overlay_connections.stop_heartbeat()
+
+
+@app.on_event("shutdown")
+async def stop_broadcast_backend():
+    """Stop the WebSocket broadcast backend"""
+    await character_updates.flush_all()
+    await broadcast_backend.stop()
+
+
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    """Close pooled asyncpg connections"""
+    await async_engine.dispose()
+
+
+@app.on_event("shutdown")
+def flush_logs():
+    """Flush queued log records"""
+    stop_logging()
+
+
 # ============================================================================
 # AUTHENTICATION & HELPERS
 # ============================================================================
 
-def verify_campaign_token(campaign_id: str = Path(...), token: str = Header(None, alias="X-Token"), db: Session = Depends(get_db), request: Request = None) -> Campaign:
+class CampaignIdentity(NamedTuple):
+    """The campaign columns admin endpoints need after token verification"""
+    id: uuid.UUID
+    slug: str
+
+
+# Verified (campaign_id, token) pairs -> CampaignIdentity
+# Invalidated by update_campaign/delete_campaign; TTL bounds staleness across workers
+campaign_token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAXSIZE, ttl=settings.TOKEN_CACHE_TTL)
+
+
+def invalidate_campaign_token_cache(campaign_uuid: uuid.UUID):
+    """Drop every cached token verification for a campaign"""
+    campaign_token_cache.delete_where(lambda key: key[0] == campaign_uuid)
+
+
+def verify_campaign_token(campaign_id: str = Path(...), token: str = Header(None, alias="X-Token"), db: Session = Depends(get_db), request: Request = None) -> CampaignIdentity:
     """
-    Verify admin token and return campaign
+    Verify admin token and return the campaign's identity (id, slug)
     Must be called on admin-only endpoints
     """
     # Skip validation for OPTIONS preflight requests
@@ -98,13 +175,53 @@ def verify_campaign_token(campaign_id: str = Path(...), token: str = Header(None
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid campaign ID format")
 
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_uuid).first()
+    cache_key = (campaign_uuid, token)
+    identity = campaign_token_cache.get(cache_key)
+    if identity is not None:
+        return identity
+
+    # Only load the columns needed to verify and identify the campaign
+    campaign = db.query(Campaign.id, Campaign.slug, Campaign.admin_token).filter(Campaign.id == campaign_uuid).first()
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found")
 
     if campaign.admin_token != token:
         raise HTTPException(status_code=403, detail="Invalid token")
 
+    identity = CampaignIdentity(id=campaign.id, slug=campaign.slug)
+    campaign_token_cache.set(cache_key, identity)
+    return identity
+
+
+class PublicCampaign(NamedTuple):
+    """The campaign columns public routes need after resolving a slug"""
+    id: uuid.UUID
+    slug: str
+    name: str
+
+
+# Slug -> PublicCampaign for public routes (misses are not cached, so new slugs resolve immediately)
+# Invalidated by update_campaign/delete_campaign; TTL bounds staleness across workers
+public_campaign_cache = TTLCache(maxsize=settings.CAMPAIGN_SLUG_CACHE_MAXSIZE, ttl=settings.CAMPAIGN_SLUG_CACHE_TTL)
+
+
+def invalidate_public_campaign_cache(slug: str):
+    """Drop a cached slug lookup"""
+    public_campaign_cache.delete(slug)
+
+
+def get_public_campaign_by_slug(slug: str, db: Session) -> PublicCampaign:
+    """Resolve a public slug to the campaign's identity (read-through cache), 404 if unknown"""
+    campaign = public_campaign_cache.get(slug)
+    if campaign is not None:
+        return campaign
+
+    row = db.query(Campaign.id, Campaign.slug, Campaign.name).filter(Campaign.slug == slug).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+
+    campaign = PublicCampaign(id=row.id, slug=row.slug, name=row.name)
+    public_campaign_cache.set(slug, campaign)
     return campaign
 
 
@@ -142,6 +259,26 @@ def healthz():
     return {"ok": True, "version": app.version}
 
 
+@app.get("/metrics")
+def metrics():
+    """Runtime metrics for this process (JSON)"""
+    return {
+        "password_hashing": password_hash_stats(),
+        "db_pool": pool_metrics(),
+        "caches": {
+            "campaign_token": campaign_token_cache.stats(),
+            "campaign_slug": public_campaign_cache.stats(),
+            "campaign_theme": campaign_theme_cache.stats(),
+            "ws_snapshots": campaign_snapshots.stats(),
+        },
+        "websockets": {
+            "campaign": campaign_connections.stats(),
+            "overlay": overlay_connections.stats(),
+            "coalescing": character_updates.stats(),
+        },
+    }
+
+
 @app.get("/version")
 def version():
     """Get API version and environment"""
@@ -224,8 +361,17 @@ def get_current_user(token: str = Header(None, alias="Authorization"), db: Sessi
     return user
 
 
+def password_hasher_busy() -> HTTPException:
+    """503 returned when the password hash pool rejects new work"""
+    return HTTPException(
+        status_code=503,
+        detail="Server is busy, please try again",
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.post("/auth/signup", status_code=201)
-def signup(payload: SignupRequest, db: Session = Depends(get_db)):
+async def signup(payload: SignupRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Create new user account with email and password
     """
@@ -238,19 +384,25 @@ def signup(payload: SignupRequest, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Password must be at least 8 characters")
 
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == payload.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == payload.email))
     if existing_user:
         raise HTTPException(status_code=409, detail="Email already registered")
 
+    # Hash on the dedicated pool (keeps bcrypt off the event loop)
+    try:
+        password_hash = await hash_password_async(payload.password)
+    except PasswordHasherBusy:
+        raise password_hasher_busy()
+
     # Create new user
     user = User(
         email=payload.email,
-        password_hash=hash_password(payload.password),
+        password_hash=password_hash,
     )
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return {
         "id": str(user.id),
@@ -260,22 +412,35 @@ def signup(payload: SignupRequest, db: Session = Depends(get_db)):
 
 
 @app.post("/auth/login", response_model=LoginResponse)
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
+async def login(payload: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Authenticate user with email and password
     Returns user_id (to use as Authorization token) and list of campaigns owned
     """
     # Find user by email
-    user = db.query(User).filter(User.email == payload.email).first()
+    user = await db.scalar(select(User).where(User.email == payload.email))
     if not user:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
-    # Verify password
-    if not verify_password(payload.password, user.password_hash):
+    # Verify password on the dedicated pool
+    try:
+        password_ok = await verify_password_async(payload.password, user.password_hash)
+    except PasswordHasherBusy:
+        raise password_hasher_busy()
+
+    if not password_ok:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
+    # Upgrade hashes made with an old cost factor (best effort - retried on next login)
+    if password_needs_rehash(user.password_hash):
+        try:
+            user.password_hash = await hash_password_async(payload.password)
+            await db.commit()
+        except PasswordHasherBusy:
+            pass
+
     # Get user's campaigns
-    campaigns = db.query(Campaign).filter(Campaign.owner_id == user.id).all()
+    campaigns = (await db.scalars(select(Campaign).where(Campaign.owner_id == user.id))).all()
     campaign_list = [
         {
             "id": str(c.id),
@@ -493,6 +658,9 @@ def update_campaign(
     campaign.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(campaign)
+    invalidate_campaign_token_cache(campaign.id)
+    invalidate_public_campaign_cache(campaign.slug)
+    campaign_snapshots.invalidate(str(campaign.id))
 
     # Return campaign with admin_token included for owner
     result = campaign.to_dict()
@@ -520,8 +688,12 @@ def delete_campaign(
     if campaign.owner_id != user.id:
         raise HTTPException(status_code=403, detail="You do not own this campaign")
 
+    slug = campaign.slug
     db.delete(campaign)
     db.commit()
+    invalidate_campaign_token_cache(campaign_uuid)
+    invalidate_public_campaign_cache(slug)
+    campaign_snapshots.discard(str(campaign_uuid))
 
     return None
 
@@ -575,42 +747,59 @@ class EpisodeUpdate(BaseModel):
     is_published: Optional[bool] = None
 
 
-@app.get("/campaigns/{campaign_id}/characters", response_model=List[Dict])
-def list_characters(campaign_id: str, db: Session = Depends(get_db)):
-    """List all characters in campaign (public)"""
-    print("\n" + "="*80)
-    print("[LIST CHARACTERS - DETAILED LOG]")
-    print("="*80)
-    print(f"Timestamp: {datetime.utcnow().isoformat()}")
-    print(f"Campaign ID: {campaign_id}")
+def parse_character_fields(fields: Optional[str]) -> Optional[tuple]:
+    """
+    Parse a comma-separated `fields` query parameter for character list endpoints
+    Returns None when not given (full serialization); "id" is always included
+    """
+    if not fields:
+        return None
+
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in Character.SERIALIZABLE_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown character fields: {', '.join(unknown)}")
+
+    return tuple(f for f in Character.SERIALIZABLE_FIELDS if f == "id" or f in requested)
+
+
+def character_query(db: Session, fields: Optional[tuple]):
+    """Character query that only loads the columns for the requested fields"""
+    query = db.query(Character)
+    if fields:
+        query = query.options(load_only(*Character.columns(fields)))
+    return query
+
+
+@app.get("/campaigns/{campaign_id}/characters", response_model=List[Dict], response_class=FastJSONResponse)
+def list_characters(campaign_id: str, fields: Optional[str] = None, db: Session = Depends(get_db)):
+    """
+    List all characters in campaign (public)
+    Optional `fields` (comma-separated) limits the keys returned and columns loaded
+    """
+    selected_fields = parse_character_fields(fields)
 
     try:
         campaign_uuid = uuid.UUID(campaign_id)
-        print(f"Campaign UUID: {campaign_uuid}")
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid campaign ID")
 
     campaign = db.query(Campaign).filter(Campaign.id == campaign_uuid).first()
     if not campaign:
-        print(f"[ERROR] Campaign not found: {campaign_uuid}")
-        print("="*80 + "\n")
+        logger.info("Campaign not found", extra={"route": "list_characters", "campaign_id": campaign_id})
         raise HTTPException(status_code=404, detail="Campaign not found")
 
-    print(f"Campaign found: {campaign.name}")
-    characters = db.query(Character).filter(Character.campaign_id == campaign_uuid).all()
-    result = [c.to_dict() for c in characters]
-    print(f"Found {len(result)} characters")
-    for char in result[:3]:  # Show first 3
-        print(f"  - {char.get('name')} (class: {char.get('class')})")
-    print("="*80 + "\n")
-    return result
+    characters = character_query(db, selected_fields).filter(Character.campaign_id == campaign_uuid).all()
+    result = [c.to_dict(selected_fields) for c in characters]
+    logger.debug("Listed characters", extra={"route": "list_characters", "campaign_id": campaign_id, "count": len(result)})
+    return FastJSONResponse(result)
 
 
 @app.post("/campaigns/{campaign_id}/characters", status_code=201)
 def create_character(
     campaign_id: str,
     payload: CharacterCreate,
-    campaign: Campaign = Depends(verify_campaign_token),
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
     db: Session = Depends(get_db)
 ):
     """Create character in campaign (admin only)"""
@@ -634,20 +823,16 @@ def create_character(
     db.commit()
     db.refresh(character)
 
-    # Broadcast to all connected clients (background task)
-    try:
-        asyncio.create_task(broadcast_to_campaign(str(campaign.id), {
-            "type": "CHAR_CREATED",
-            "character": character.to_dict()
-        }))
-    except Exception as e:
-        print(f"[BROADCAST ERROR] {str(e)}")
-        # Don't fail the request if broadcast fails
+    # Broadcast to all connected clients (background task - doesn't fail the request)
+    schedule_broadcast(str(campaign.id), {
+        "type": "CHAR_CREATED",
+        "character": character.to_dict()
+    })
 
     return character.to_dict()
 
 
-@app.get("/campaigns/{campaign_id}/characters/{char_id}")
+@app.get("/campaigns/{campaign_id}/characters/{char_id}", response_class=FastJSONResponse)
 def get_character(campaign_id: str, char_id: str, db: Session = Depends(get_db)):
     """Get character details (public)"""
     try:
@@ -663,103 +848,68 @@ def get_character(campaign_id: str, char_id: str, db: Session = Depends(get_db))
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
 
-    return character.to_dict()
+    return FastJSONResponse(character.to_dict())
 
 
 @app.patch("/campaigns/{campaign_id}/characters/{char_id}/image")
-def update_character_image(
+async def update_character_image(
     campaign_id: str,
     char_id: str,
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db),
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db),
     # Form fields for image upload
     image: Optional[UploadFile] = File(None),
 ):
-    """Upload/update character image only"""
-
-    # ===== DETAILED LOGGING =====
-    print("\n" + "="*80)
-    print("[CHARACTER IMAGE UPDATE - DETAILED LOG]")
-    print("="*80)
-    print(f"Timestamp: {datetime.utcnow().isoformat()}")
-    print(f"\nURL: PATCH /campaigns/{campaign_id}/characters/{char_id}/image")
-    print(f"Campaign ID: {campaign_id}")
-    print(f"Character ID: {char_id}")
-    print(f"\nIMAGE DATA:")
-    print(f"  Filename: {image.filename if image else 'None'}")
-    print(f"  Content-Type: {image.content_type if image else 'None'}")
-    print(f"  File size: {len(image.file.read()) if image else 0} bytes")
-    if image:
-        image.file.seek(0)  # Reset file pointer
-    # ===== END LOGGING =====
+    """Upload/update character image only (same WebP variants as the portrait upload)"""
 
     try:
         char_uuid = uuid.UUID(char_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid character ID")
 
-    character = db.query(Character).filter(
+    character = await db.scalar(select(Character).where(
         and_(Character.id == char_uuid, Character.campaign_id == campaign.id)
-    ).first()
+    ))
 
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
 
     if not image or not image.filename:
-        print("[IMAGE UPLOAD ERROR] No image provided")
         raise HTTPException(status_code=400, detail="No image provided")
 
-    try:
-        image_data = image.file.read()
-        print(f"[IMAGE UPLOAD] Read {len(image_data)} bytes from file")
-
-        # Upload to S3/R2
-        r2_key = f"characters/{campaign.id}/{character.id}/{image.filename}"
-
-        # Determine content type from filename
-        content_type = "image/jpeg"
-        if image.filename.lower().endswith('.png'):
-            content_type = "image/png"
-        elif image.filename.lower().endswith('.webp'):
-            content_type = "image/webp"
-        elif image.filename.lower().endswith('.gif'):
-            content_type = "image/gif"
-
-        print(f"[IMAGE UPLOAD] Uploading to R2 with key: {r2_key}")
-        print(f"[IMAGE UPLOAD] Content-Type: {content_type}")
+    image_data = await image.read()
 
-        public_url = s3_client.upload_image(r2_key, image_data, content_type)
-        character.image_url = public_url
-        character.image_r2_key = r2_key
-        character.updated_at = datetime.utcnow()
-
-        db.commit()
-        db.refresh(character)
+    # Resize to WebP variants and upload them to R2
+    try:
+        variants = await upload_image_variants(f"{campaign.slug}/portraits/{str(character.id)}", image_data, storage_client)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Character image upload failed", extra={"route": "update_character_image", "character_id": char_id})
+        raise HTTPException(status_code=500, detail=f"Image upload failed: {str(e)}")
 
-        print(f"[IMAGE UPLOAD SUCCESS] URL: {public_url}")
-        print("="*80 + "\n")
+    # Full variant is the canonical image; replaces any variants from an earlier upload
+    character.image_url = variants["full"]["url"]
+    character.image_r2_key = variants["full"]["r2_key"]
+    character.image_variants = {name: v["url"] for name, v in variants.items()}
+    character.updated_at = datetime.utcnow()
+    await db.commit()
+    await db.refresh(character)
 
-        # Broadcast update
-        try:
-            asyncio.create_task(broadcast_to_campaign(str(campaign.id), {
-                "type": "CHAR_UPDATED",
-                "character": character.to_dict()
-            }))
-        except Exception as e:
-            print(f"[BROADCAST ERROR] {str(e)}")
+    logger.info("Uploaded character image", extra={
+        "route": "update_character_image", "character_id": char_id,
+        "r2_key": character.image_r2_key, "bytes": len(image_data)
+    })
 
-        return character.to_dict()
-    except Exception as e:
-        print(f"[IMAGE UPLOAD ERROR] {str(e)}")
-        print("="*80 + "\n")
-        raise HTTPException(status_code=500, detail=f"Image upload failed: {str(e)}")
+    # Broadcast the changed image fields
+    return await broadcast_character_changes(str(campaign.id), character, db)
 
 
 @app.delete("/campaigns/{campaign_id}/characters/{char_id}", status_code=204)
 def delete_character(
     campaign_id: str,
     char_id: str,
-    campaign: Campaign = Depends(verify_campaign_token),
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
     db: Session = Depends(get_db)
 ):
     """Delete character (admin only)"""
@@ -779,14 +929,10 @@ def delete_character(
     db.commit()
 
     # Broadcast deletion (best effort - don't fail if broadcast fails)
-    try:
-        asyncio.create_task(broadcast_to_campaign(str(campaign.id), {
-            "type": "CHAR_DELETED",
-            "character_id": str(character.id)
-        }))
-    except RuntimeError:
-        # No running event loop - broadcast is optional, deletion succeeded
-        pass
+    schedule_broadcast(str(campaign.id), {
+        "type": "CHAR_DELETED",
+        "character_id": str(character.id)
+    })
 
     return None
 
@@ -799,7 +945,7 @@ def delete_character(
 def create_episode(
     campaign_id: str,
     payload: EpisodeCreate,
-    campaign: Campaign = Depends(verify_campaign_token),
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
     db: Session = Depends(get_db)
 ):
     """Create episode in campaign (admin only)"""
@@ -824,7 +970,7 @@ def create_episode(
     return episode.to_dict()
 
 
-@app.get("/campaigns/{campaign_id}/episodes", response_model=List[Dict])
+@app.get("/campaigns/{campaign_id}/episodes", response_model=List[Dict], response_class=FastJSONResponse)
 def list_episodes(campaign_id: str, db: Session = Depends(get_db)):
     """List all episodes in campaign (public)"""
     try:
@@ -833,10 +979,10 @@ def list_episodes(campaign_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Invalid campaign ID")
 
     episodes = db.query(Episode).filter(Episode.campaign_id == campaign_uuid).all()
-    return [ep.to_dict() for ep in episodes]
+    return FastJSONResponse([ep.to_dict() for ep in episodes])
 
 
-@app.get("/campaigns/{campaign_id}/episodes/{episode_id}")
+@app.get("/campaigns/{campaign_id}/episodes/{episode_id}", response_class=FastJSONResponse)
 def get_episode(campaign_id: str, episode_id: str, db: Session = Depends(get_db)):
     """Get episode details (public)"""
     try:
@@ -852,7 +998,7 @@ def get_episode(campaign_id: str, episode_id: str, db: Session = Depends(get_db)
     if not episode:
         raise HTTPException(status_code=404, detail="Episode not found")
 
-    return episode.to_dict()
+    return FastJSONResponse(episode.to_dict())
 
 
 @app.patch("/campaigns/{campaign_id}/episodes/{episode_id}")
@@ -860,7 +1006,7 @@ def update_episode(
     campaign_id: str,
     episode_id: str,
     payload: EpisodeUpdate,
-    campaign: Campaign = Depends(verify_campaign_token),
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
     db: Session = Depends(get_db)
 ):
     """Update episode (admin only)"""
@@ -905,7 +1051,7 @@ def update_episode(
 def delete_episode(
     campaign_id: str,
     episode_id: str,
-    campaign: Campaign = Depends(verify_campaign_token),
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
     db: Session = Depends(get_db)
 ):
     """Delete episode (admin only)"""
@@ -936,8 +1082,8 @@ async def upload_portrait(
     campaign_id: str,
     char_id: str,
     file: UploadFile = File(...),
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Upload character portrait image (admin only)"""
     try:
@@ -946,9 +1092,9 @@ async def upload_portrait(
         raise HTTPException(status_code=400, detail="Invalid character ID")
 
     # Verify character exists and belongs to campaign
-    character = db.query(Character).filter(
+    character = await db.scalar(select(Character).where(
         and_(Character.id == char_uuid, Character.campaign_id == campaign.id)
-    ).first()
+    ))
 
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
@@ -963,27 +1109,29 @@ async def upload_portrait(
     if file.content_type not in valid_types:
         raise HTTPException(status_code=400, detail="Invalid file type (jpg, png, webp only)")
 
-    # Upload to R2
+    # Resize to WebP variants and upload them to R2
     try:
-        key = f"{campaign.slug}/portraits/{str(character.id)}.webp"
-        url = s3_client.upload_image(key, contents, file.content_type)
+        variants = await upload_image_variants(f"{campaign.slug}/portraits/{str(character.id)}", contents, storage_client)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Image upload failed: {str(e)}")
 
-    # Update character
-    character.portrait_url = url
+    # Update character - full variant is the canonical image
+    url = variants["full"]["url"]
+    character.image_url = url
+    character.image_r2_key = variants["full"]["r2_key"]
+    character.image_variants = {name: v["url"] for name, v in variants.items()}
     character.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(character)
+    await db.commit()
+    await db.refresh(character)
 
-    # Broadcast update
-    await broadcast_to_campaign(str(campaign.id), {
-        "type": "CHAR_UPDATED",
-        "character": character.to_dict()
-    })
+    # Broadcast the changed image fields
+    await broadcast_character_changes(str(campaign.id), character, db)
 
     return {
         "url": url,
+        "variants": character.image_variants,
         "character_id": str(character.id),
         "message": "Portrait uploaded successfully"
     }
@@ -994,8 +1142,8 @@ async def upload_background(
     campaign_id: str,
     char_id: str,
     file: UploadFile = File(...),
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Upload character background image (admin only)"""
     try:
@@ -1004,9 +1152,9 @@ async def upload_background(
         raise HTTPException(status_code=400, detail="Invalid character ID")
 
     # Verify character exists
-    character = db.query(Character).filter(
+    character = await db.scalar(select(Character).where(
         and_(Character.id == char_uuid, Character.campaign_id == campaign.id)
-    ).first()
+    ))
 
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
@@ -1021,104 +1169,211 @@ async def upload_background(
     if file.content_type not in valid_types:
         raise HTTPException(status_code=400, detail="Invalid file type (jpg, png, webp only)")
 
-    # Upload to R2
+    # Resize to WebP variants and upload them to R2
     try:
-        key = f"{campaign.slug}/backgrounds/{str(character.id)}.webp"
-        url = s3_client.upload_image(key, contents, file.content_type)
+        variants = await upload_image_variants(f"{campaign.slug}/backgrounds/{str(character.id)}", contents, storage_client)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Image upload failed: {str(e)}")
 
-    # Update character - use correct field name
-    character.background_image_url = url
-    character.background_image_r2_key = key
+    # Update character - use correct field name, full variant is the canonical image
+    character.background_image_url = variants["full"]["url"]
+    character.background_image_r2_key = variants["full"]["r2_key"]
+    character.background_image_variants = {name: v["url"] for name, v in variants.items()}
     character.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(character)
-
-    # Broadcast update
-    await broadcast_to_campaign(str(campaign.id), {
-        "type": "CHAR_UPDATED",
-        "character": character.to_dict()
-    })
+    await db.commit()
+    await db.refresh(character)
 
-    return character.to_dict()
+    # Broadcast the changed background fields
+    return await broadcast_character_changes(str(campaign.id), character, db)
 
 
 # ============================================================================
 # WEBSOCKET - REAL-TIME UPDATES
 # ============================================================================
 
-# Store active connections per campaign
-campaign_connections: Dict[str, Set[WebSocket]] = {}
+# Store active connections per campaign (each with its own bounded send queue)
+campaign_connections = ConnectionManager()
+
+# Relays broadcasts to the other workers/machines (settings.BROADCAST_BACKEND)
+broadcast_backend = create_broadcast_backend()
+
+# Merges rapid character edits into one CHARS_UPDATED per campaign per window
+character_updates = CharacterUpdateCoalescer(broadcast_backend.publish)
+
+# Event loop the app runs on (set at startup) - sync handlers schedule broadcasts onto it
+event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def load_bootstrap_snapshot(campaign_id: str) -> Optional[Dict[str, Any]]:
+    """Campaign, characters and roster for BOOTSTRAP (None if the campaign does not exist)"""
+    campaign_uuid = uuid.UUID(campaign_id)
+    with get_db_context() as db:
+        campaign = db.query(Campaign).filter(Campaign.id == campaign_uuid).first()
+        if not campaign:
+            return None
+
+        characters = db.query(Character).filter(Character.campaign_id == campaign_uuid).all()
+        roster = db.query(Roster).filter(Roster.campaign_id == campaign_uuid).first()
+
+        return {
+            "campaign": campaign.to_dict(),
+            "characters": [c.to_dict() for c in characters],
+            "roster": roster.to_dict() if roster else {"character_ids": []},
+        }
+
+
+# Per-campaign BOOTSTRAP snapshots, sequence numbers and replay windows
+campaign_snapshots = SnapshotStore(load_bootstrap_snapshot, in_use=campaign_connections.has_connections)
+
+
+async def deliver_to_local_clients(campaign_id: str, message: Dict[str, Any]):
+    """
+    Deliver a message to the clients connected to this process
+    The message gets the campaign's next sequence number, is folded into the cached
+    snapshot and is serialized once and queued per socket, so a slow client never
+    delays other clients or the request that triggered the broadcast
+    """
+    message, text = campaign_snapshots.record(campaign_id, message)
+
+    # Clients connected with ?full=true get patches expanded to full characters
+    full_text = None
+    if message.get("type") == "CHARS_UPDATED" and campaign_connections.has_full_object_clients(campaign_id):
+        full_message = campaign_snapshots.expand(campaign_id, message)
+        if full_message is not None:
+            full_text = encode_message(full_message)
+
+    if text is not None:
+        campaign_connections.broadcast_text(campaign_id, text, full_text)
+    else:
+        campaign_connections.broadcast(campaign_id, message)
+
+    # The default layout changed on some worker: drop this worker's cached theme if it
+    # is older, before anything (the overlay snapshot below, REST overlays) resolves colors
+    if message.get("type") == "LAYOUT_THEME_UPDATED":
+        as_of = message.get("as_of")
+        invalidate_campaign_theme(uuid.UUID(campaign_id), datetime.fromisoformat(as_of) if as_of else None)
+
+    # Forward an overlay-shaped delta to overlay feed clients, in the background so the
+    # broadcasting request never waits on overlay_lock or an overlay database read
+    if overlay_connections.has_connections(campaign_id):
+        task = asyncio.create_task(broadcast_overlay_delta(campaign_id, message))
+        overlay_tasks.add(task)
+        task.add_done_callback(overlay_tasks.discard)
 
 
 async def broadcast_to_campaign(campaign_id: str, message: Dict[str, Any]):
-    """Broadcast message to all clients connected to a campaign"""
-    if campaign_id not in campaign_connections:
-        return
+    """Broadcast message to all clients connected to a campaign, in every process"""
+    # Canonical form, so path IDs in any letter case reach the same sockets and snapshot
+    campaign_id = str(uuid.UUID(campaign_id))
+    # Pending coalesced character changes go out first, keeping messages in order
+    await character_updates.flush(campaign_id)
+    await broadcast_backend.publish(campaign_id, message)
+
+
+async def broadcast_character_changes(campaign_id: str, character: Character, db: AsyncSession) -> Dict[str, Any]:
+    """
+    Queue a CHARS_UPDATED patch with the fields the last commit changed, as recorded
+    from attribute history at flush time (see database.pop_character_changes)
+    Call after commit and refresh; returns the full serialized character
+    """
+    character_dict = character.to_dict()
+    changed = pop_character_changes(db).get(character_dict["id"], set())
+    if changed:
+        await character_updates.add(campaign_id, character_dict["id"], {field: character_dict[field] for field in changed})
+    return character_dict
 
-    dead_connections = []
-    for ws in campaign_connections[campaign_id]:
-        try:
-            await ws.send_json(message)
-        except Exception:
-            dead_connections.append(ws)
 
-    # Clean up dead connections
-    for ws in dead_connections:
-        campaign_connections[campaign_id].discard(ws)
+def _log_broadcast_failure(future):
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("Broadcast failed: %s", future.exception())
+
+
+def schedule_broadcast(campaign_id: str, message: Dict[str, Any]):
+    """
+    broadcast_to_campaign for sync handlers (best effort, does not wait)
+    They run in worker threads with no event loop, so asyncio.create_task cannot be used
+    """
+    if event_loop is None:
+        return
+    future = asyncio.run_coroutine_threadsafe(broadcast_to_campaign(campaign_id, message), event_loop)
+    future.add_done_callback(_log_broadcast_failure)
 
 
 @app.websocket("/campaigns/{campaign_id}/ws")
-async def websocket_endpoint(websocket: WebSocket, campaign_id: str):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    campaign_id: str,
+    since: Optional[int] = None,
+    epoch: Optional[str] = None,
+    full: bool = False
+):
     """
     WebSocket endpoint for real-time campaign updates
     Broadcasts character updates, HP changes, events, etc.
+    Every message carries a "seq". A reconnecting client can pass ?since=<last seq>&epoch=<epoch
+    from its BOOTSTRAP> and receive RESUME followed by only the messages it missed; if those
+    are no longer buffered (or the epoch differs) it gets a full BOOTSTRAP instead
+    Character changes arrive as CHARS_UPDATED patches (only the changed fields); with
+    ?full=true each patch is replaced by the full character. Replayed messages are
+    patches, so full-object clients always start from a BOOTSTRAP
+    The server sends "ping" every WS_PING_INTERVAL; clients must answer "pong" (or send
+    anything else) within WS_IDLE_TIMEOUT or the connection is closed
     """
     try:
         campaign_uuid = uuid.UUID(campaign_id)
     except ValueError:
         await websocket.close(code=4000, reason="Invalid campaign ID")
         return
+    campaign_id = str(campaign_uuid)
 
-    # Verify campaign exists
-    with get_db_context() as db:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_uuid).first()
-        if not campaign:
-            await websocket.close(code=4004, reason="Campaign not found")
-            return
+    # Refused at the handshake, before any snapshot work
+    if not campaign_connections.has_capacity(campaign_id):
+        await websocket.close(code=1013, reason="Too many connections")
+        return
+
+    # Cached snapshot - the database is only queried on a miss or after WS_SNAPSHOT_TTL
+    stream = await campaign_snapshots.get(campaign_id)
+    if stream is None:
+        await websocket.close(code=4004, reason="Campaign not found")
+        return
 
     await websocket.accept()
 
-    # Add to campaign connections
-    if campaign_id not in campaign_connections:
-        campaign_connections[campaign_id] = set()
-    campaign_connections[campaign_id].add(websocket)
+    # No await from here to connect(): nothing can be broadcast between choosing the
+    # initial messages and registering the socket, and no other client can take the
+    # last slot (a burst arriving while the snapshot loaded all passed the first check)
+    if not campaign_connections.has_capacity(campaign_id):
+        await websocket.close(code=1013, reason="Too many connections")
+        return
 
-    # Send bootstrap event with current state
-    with get_db_context() as db:
-        characters = db.query(Character).filter(Character.campaign_id == campaign_uuid).all()
-        roster = db.query(Roster).filter(Roster.campaign_id == campaign_uuid).first()
+    replay = stream.replay_since(since) if since is not None and epoch == stream.epoch and not full else None
+    # A client that missed more than a send queue's worth is cheaper to bootstrap
+    if replay is None or len(replay) + 1 > campaign_connections.max_queue:
+        initial_texts = [stream.bootstrap_text()]
+    else:
+        resume = {"type": "RESUME", "epoch": stream.epoch, "since": since, "seq": stream.seq}
+        initial_texts = [encode_message(resume), *replay]
 
-        await websocket.send_json({
-            "type": "BOOTSTRAP",
-            "campaign": campaign.to_dict(),
-            "characters": [c.to_dict() for c in characters],
-            "roster": roster.to_dict() if roster else {"character_ids": []},
-        })
+    # Add to campaign connections; bootstrap/replay is written ahead of any broadcast
+    connection = campaign_connections.connect(campaign_id, websocket, initial_texts=initial_texts, full_objects=full)
 
-    # Handle incoming messages and pings
+    # Handle incoming messages: heartbeat replies and client keep-alive pings
     try:
         while True:
             data = await websocket.receive_text()
-            # Echo back any received messages (keep-alive)
-            if data == "ping":
-                await websocket.send_text("pong")
+            connection.touch()
+            if data == PING:
+                connection.send_text(PONG)
     except WebSocketDisconnect:
-        campaign_connections[campaign_id].discard(websocket)
+        pass
     except Exception as e:
-        print(f"[ERROR] WebSocket error: {e}")
-        campaign_connections[campaign_id].discard(websocket)
+        logger.warning("WebSocket error: %s", e)
+    finally:
+        campaign_connections.disconnect(campaign_id, websocket)
+        if not campaign_connections.has_connections(campaign_id):
+            campaign_snapshots.release(campaign_id)
 
 
 # ============================================================================
@@ -1137,8 +1392,8 @@ class EventCreate(BaseModel):
 async def create_event(
     campaign_id: str,
     payload: EventCreate,
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create event and broadcast to WebSocket clients"""
     try:
@@ -1146,11 +1401,6 @@ async def create_event(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid campaign ID")
 
-    # Convert characters_involved array to JSON string if provided
-    characters_involved_str = None
-    if payload.characters_involved:
-        characters_involved_str = json.dumps(payload.characters_involved)
-
     # Note: This endpoint creates events without an episode context
     # For episode-specific events, use POST /episodes/{episode_id}/events instead
     event = Event(
@@ -1158,11 +1408,11 @@ async def create_event(
         description=payload.description,
         timestamp_in_episode=payload.timestamp_in_episode,
         event_type=payload.event_type,
-        characters_involved=characters_involved_str,
+        characters_involved=parse_character_ids(payload.characters_involved),
     )
     db.add(event)
-    db.commit()
-    db.refresh(event)
+    await db.commit()
+    await db.refresh(event)
 
     # Broadcast to WebSocket clients
     await broadcast_to_campaign(campaign_id, {
@@ -1173,7 +1423,7 @@ async def create_event(
     return event.to_dict()
 
 
-@app.get("/campaigns/{campaign_id}/events")
+@app.get("/campaigns/{campaign_id}/events", response_class=FastJSONResponse)
 def list_events(
     campaign_id: str,
     limit: int = 100,
@@ -1189,10 +1439,46 @@ def list_events(
         Event.campaign_id == campaign_uuid
     ).order_by(Event.timestamp.desc()).limit(limit).all()
 
-    return [e.to_dict() for e in events]
+    return FastJSONResponse([e.to_dict() for e in events])
+
+
+@app.get("/campaigns/{campaign_id}/characters/{character_id}/events", response_class=FastJSONResponse)
+def list_character_events(
+    campaign_id: str,
+    character_id: str,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """
+    List events involving a character across the campaign's published episodes (public)
+    Ordered by season, episode number and timestamp; served by the GIN index on characters_involved
+    """
+    try:
+        campaign_uuid = uuid.UUID(campaign_id)
+        character_uuid = uuid.UUID(character_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid campaign or character ID")
+
+    character = db.query(Character.id).filter(
+        and_(Character.id == character_uuid, Character.campaign_id == campaign_uuid)
+    ).first()
+    if not character:
+        raise HTTPException(status_code=404, detail="Character not found")
+
+    events = db.query(Event).join(Episode, Episode.id == Event.episode_id).filter(
+        and_(
+            Event.characters_involved.contains([character_uuid]),
+            Episode.campaign_id == campaign_uuid,
+            Episode.is_published == True
+        )
+    ).order_by(
+        Episode.season.asc(), Episode.episode_number.asc(), Event.timestamp_in_episode.asc()
+    ).limit(limit).all()
+
+    return FastJSONResponse([e.to_dict() for e in events])
 
 
-@app.get("/episodes/{episode_id}/events")
+@app.get("/episodes/{episode_id}/events", response_class=FastJSONResponse)
 def list_episode_events(
     episode_id: str,
     token: str = Header(None, alias="X-Token"),
@@ -1225,7 +1511,7 @@ def list_episode_events(
         Event.episode_id == ep_uuid
     ).order_by(Event.created_at.desc()).all()
 
-    return [e.to_dict() for e in events]
+    return FastJSONResponse([e.to_dict() for e in events])
 
 
 @app.post("/episodes/{episode_id}/events", status_code=201)
@@ -1233,7 +1519,7 @@ async def create_episode_event(
     episode_id: str,
     payload: EventCreate,
     token: str = Header(None, alias="X-Token"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create an event in an episode (requires campaign authorization)"""
     try:
@@ -1245,23 +1531,18 @@ async def create_episode_event(
         raise HTTPException(status_code=401, detail="Missing X-Token header")
 
     # Get the episode to verify it exists
-    episode = db.query(Episode).filter(Episode.id == ep_uuid).first()
+    episode = await db.scalar(select(Episode).where(Episode.id == ep_uuid))
     if not episode:
         raise HTTPException(status_code=404, detail="Episode not found")
 
     # Verify the user has access to this episode's campaign
-    campaign = db.query(Campaign).filter(Campaign.id == episode.campaign_id).first()
+    campaign = await db.scalar(select(Campaign).where(Campaign.id == episode.campaign_id))
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found")
 
     if campaign.admin_token != token:
         raise HTTPException(status_code=403, detail="Invalid admin token")
 
-    # Convert characters_involved array to JSON string if provided (always JSON, even if empty)
-    characters_involved_str = None
-    if payload.characters_involved is not None:
-        characters_involved_str = json.dumps(payload.characters_involved)
-
     # Create the event
     event = Event(
         episode_id=ep_uuid,
@@ -1269,11 +1550,11 @@ async def create_episode_event(
         description=payload.description,
         timestamp_in_episode=payload.timestamp_in_episode,
         event_type=payload.event_type,
-        characters_involved=characters_involved_str,
+        characters_involved=parse_character_ids(payload.characters_involved),
     )
     db.add(event)
-    db.commit()
-    db.refresh(event)
+    await db.commit()
+    await db.refresh(event)
 
     # Broadcast to WebSocket clients
     await broadcast_to_campaign(str(episode.campaign_id), {
@@ -1290,7 +1571,7 @@ async def update_episode_event(
     event_id: str,
     payload: EventCreate,
     token: str = Header(None, alias="X-Token"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an event in an episode (requires campaign authorization)"""
     try:
@@ -1303,12 +1584,12 @@ async def update_episode_event(
         raise HTTPException(status_code=401, detail="Missing X-Token header")
 
     # Get the episode to verify it exists
-    episode = db.query(Episode).filter(Episode.id == ep_uuid).first()
+    episode = await db.scalar(select(Episode).where(Episode.id == ep_uuid))
     if not episode:
         raise HTTPException(status_code=404, detail="Episode not found")
 
     # Get the event to verify it exists
-    event = db.query(Event).filter(Event.id == ev_uuid).first()
+    event = await db.scalar(select(Event).where(Event.id == ev_uuid))
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -1317,7 +1598,7 @@ async def update_episode_event(
         raise HTTPException(status_code=400, detail="Event does not belong to this episode")
 
     # Verify the user has access to this episode's campaign
-    campaign = db.query(Campaign).filter(Campaign.id == episode.campaign_id).first()
+    campaign = await db.scalar(select(Campaign).where(Campaign.id == episode.campaign_id))
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found")
 
@@ -1334,11 +1615,11 @@ async def update_episode_event(
     if payload.event_type is not None:
         event.event_type = payload.event_type
     if payload.characters_involved is not None:
-        # Handle empty arrays - always serialize to JSON, even if empty list
-        event.characters_involved = json.dumps(payload.characters_involved)
+        # An empty list clears the involved characters
+        event.characters_involved = parse_character_ids(payload.characters_involved)
 
-    db.commit()
-    db.refresh(event)
+    await db.commit()
+    await db.refresh(event)
 
     # Broadcast to WebSocket clients
     await broadcast_to_campaign(str(episode.campaign_id), {
@@ -1354,7 +1635,7 @@ async def delete_episode_event(
     episode_id: str,
     event_id: str,
     token: str = Header(None, alias="X-Token"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete an event from an episode (requires campaign authorization)"""
     try:
@@ -1367,12 +1648,12 @@ async def delete_episode_event(
         raise HTTPException(status_code=401, detail="Missing X-Token header")
 
     # Get the episode to verify it exists
-    episode = db.query(Episode).filter(Episode.id == ep_uuid).first()
+    episode = await db.scalar(select(Episode).where(Episode.id == ep_uuid))
     if not episode:
         raise HTTPException(status_code=404, detail="Episode not found")
 
     # Get the event to verify it exists
-    event = db.query(Event).filter(Event.id == ev_uuid).first()
+    event = await db.scalar(select(Event).where(Event.id == ev_uuid))
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -1381,7 +1662,7 @@ async def delete_episode_event(
         raise HTTPException(status_code=400, detail="Event does not belong to this episode")
 
     # Verify the user has access to this episode's campaign
-    campaign = db.query(Campaign).filter(Campaign.id == episode.campaign_id).first()
+    campaign = await db.scalar(select(Campaign).where(Campaign.id == episode.campaign_id))
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found")
 
@@ -1389,8 +1670,8 @@ async def delete_episode_event(
         raise HTTPException(status_code=403, detail="Invalid admin token")
 
     # Delete the event
-    db.delete(event)
-    db.commit()
+    await db.delete(event)
+    await db.commit()
 
     # Broadcast to WebSocket clients
     await broadcast_to_campaign(str(episode.campaign_id), {
@@ -1428,8 +1709,8 @@ def get_roster(campaign_id: str, db: Session = Depends(get_db)):
 async def update_roster(
     campaign_id: str,
     payload: RosterUpdate,
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update active roster (admin only)"""
     # Convert string IDs to UUIDs
@@ -1440,7 +1721,7 @@ async def update_roster(
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid character ID: {char_id_str}")
 
-    roster = db.query(Roster).filter(Roster.campaign_id == campaign.id).first()
+    roster = await db.scalar(select(Roster).where(Roster.campaign_id == campaign.id))
     if not roster:
         roster = Roster(campaign_id=campaign.id, character_ids=char_uuids)
         db.add(roster)
@@ -1448,8 +1729,8 @@ async def update_roster(
         roster.character_ids = char_uuids
         roster.updated_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(roster)
+    await db.commit()
+    await db.refresh(roster)
 
     # Broadcast update
     await broadcast_to_campaign(campaign_id, {
@@ -1474,38 +1755,33 @@ def get_color_presets():
 async def create_character_layout(
     campaign_id: str,
     payload: CharacterLayoutCreateRequest,
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new character layout for a campaign (admin only)"""
-    print(f"\n=== CREATE CHARACTER LAYOUT ===")
-    print(f"Campaign ID: {campaign_id}")
-    print(f"Payload: name={payload.name}, is_default={payload.is_default}, card_type={payload.card_type}")
+    if debug_payloads_enabled("create_character_layout"):
+        logger.debug("Create character layout payload", extra={
+            "route": "create_character_layout", "campaign_id": campaign_id, "payload": payload.model_dump()
+        })
 
     try:
         campaign_uuid = uuid.UUID(campaign_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid campaign ID")
 
-    print(f"Campaign UUID validated: {campaign_uuid}")
-    print(f"Verified campaign ID: {campaign.id}")
-
     # Verify campaign ownership
     if campaign.id != campaign_uuid:
         raise HTTPException(status_code=403, detail="Not authorized to modify this campaign")
 
-    print(f"Campaign ownership verified")
-
     # If this layout is set as default, unset other defaults
     if payload.is_default:
-        print(f"Setting as default, unsetting other defaults...")
-        db.query(CharacterLayout).filter(
-            and_(CharacterLayout.campaign_id == campaign_uuid, CharacterLayout.is_default == True)
-        ).update({"is_default": False})
-        db.commit()
-        print(f"Other defaults unset")
-
-    print(f"Creating layout object...")
+        await db.execute(
+            update(CharacterLayout).where(
+                and_(CharacterLayout.campaign_id == campaign_uuid, CharacterLayout.is_default == True)
+            ).values(is_default=False)
+        )
+        await db.commit()
+
     # Convert Pydantic models to dicts for JSON serialization (recursively)
     stats_config_list = payload.stats_config or [
         {"key": "str", "label": "STR", "visible": True, "order": 0},
@@ -1541,25 +1817,33 @@ async def create_character_layout(
         color_preset=payload.color_preset,
     )
 
-    print(f"Layout object created: {layout.id if hasattr(layout, 'id') else 'no ID yet'}")
-    print(f"Adding to session...")
     db.add(layout)
-    print(f"Committing transaction...")
-    db.commit()
-    print(f"Transaction committed. Layout ID: {layout.id}")
-    print(f"Refreshing layout...")
-    db.refresh(layout)
-    print(f"Layout refreshed")
+    await db.commit()
+    await db.refresh(layout)
 
     result = layout.to_dict()
-    print(f"Returning layout dict: {result}")
+    logger.info("Created character layout", extra={
+        "route": "create_character_layout", "campaign_id": campaign_id,
+        "layout_id": str(layout.id), "is_default": layout.is_default
+    })
+
+    # A new default layout changes the resolved campaign theme
+    if layout.is_default:
+        theme = build_campaign_theme(layout)
+        store_campaign_theme(campaign_uuid, theme)
+        await broadcast_to_campaign(str(campaign_uuid), {
+            "type": "LAYOUT_THEME_UPDATED",
+            "layout_id": str(layout.id),
+            "as_of": theme.as_of.isoformat()
+        })
+
     return result
 
 
 @app.get("/campaigns/{campaign_id}/character-layouts")
 def list_character_layouts(
     campaign_id: str,
-    campaign: Campaign = Depends(verify_campaign_token),
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
     db: Session = Depends(get_db)
 ):
     """List all character layouts for a campaign (admin only)"""
@@ -1582,7 +1866,7 @@ def list_character_layouts(
 def get_character_layout(
     campaign_id: str,
     layout_id: str,
-    campaign: Campaign = Depends(verify_campaign_token),
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
     db: Session = Depends(get_db)
 ):
     """Get a specific character layout (admin only)"""
@@ -1610,8 +1894,8 @@ async def upload_layout_background(
     campaign_id: str,
     layout_id: str,
     file: UploadFile = File(...),
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Upload background image for character layout (admin only)"""
     try:
@@ -1620,9 +1904,9 @@ async def upload_layout_background(
         raise HTTPException(status_code=400, detail="Invalid layout ID")
 
     # Verify layout exists and belongs to campaign
-    layout = db.query(CharacterLayout).filter(
+    layout = await db.scalar(select(CharacterLayout).where(
         and_(CharacterLayout.id == layout_uuid, CharacterLayout.campaign_id == campaign.id)
-    ).first()
+    ))
 
     if not layout:
         raise HTTPException(status_code=404, detail="Layout not found")
@@ -1640,15 +1924,15 @@ async def upload_layout_background(
     # Upload to R2
     try:
         key = f"{campaign.slug}/layouts/{str(layout.id)}-background.webp"
-        url = s3_client.upload_image(key, contents, file.content_type)
+        url = await storage_client.upload_image_async(key, contents, file.content_type)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Image upload failed: {str(e)}")
 
     # Update layout
     layout.background_image_url = url
     layout.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(layout)
+    await db.commit()
+    await db.refresh(layout)
 
     return {
         "url": url,
@@ -1662,16 +1946,14 @@ async def update_character_layout(
     campaign_id: str,
     layout_id: str,
     payload: CharacterLayoutUpdateRequest,
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a character layout (admin only)"""
-    # DEBUG: Log incoming payload
-    print(f"\n[update_character_layout] ===== INCOMING PAYLOAD =====")
-    print(f"[update_character_layout] payload.stats_config is None: {payload.stats_config is None}")
-    print(f"[update_character_layout] payload.stats_config value: {payload.stats_config}")
-    print(f"[update_character_layout] Full payload dict: {payload.model_dump()}")
-    print(f"[update_character_layout] =============================\n")
+    if debug_payloads_enabled("update_character_layout"):
+        logger.debug("Update character layout payload", extra={
+            "route": "update_character_layout", "layout_id": layout_id, "payload": payload.model_dump()
+        })
 
     try:
         campaign_uuid = uuid.UUID(campaign_id)
@@ -1682,21 +1964,26 @@ async def update_character_layout(
     if campaign.id != campaign_uuid:
         raise HTTPException(status_code=403, detail="Not authorized to modify this campaign")
 
-    layout = db.query(CharacterLayout).filter(
+    layout = await db.scalar(select(CharacterLayout).where(
         and_(CharacterLayout.id == layout_uuid, CharacterLayout.campaign_id == campaign_uuid)
-    ).first()
+    ))
 
     if not layout:
         raise HTTPException(status_code=404, detail="Layout not found")
 
+    # Remember whether this layout drives the campaign theme before the update
+    was_default = layout.is_default
+
     # Handle updates
     if payload.name is not None:
         layout.name = payload.name
     if payload.is_default is not None:
         if payload.is_default:
-            db.query(CharacterLayout).filter(
-                and_(CharacterLayout.campaign_id == campaign_uuid, CharacterLayout.is_default == True, CharacterLayout.id != layout_uuid)
-            ).update({"is_default": False})
+            await db.execute(
+                update(CharacterLayout).where(
+                    and_(CharacterLayout.campaign_id == campaign_uuid, CharacterLayout.is_default == True, CharacterLayout.id != layout_uuid)
+                ).values(is_default=False)
+            )
         layout.is_default = payload.is_default
     if payload.card_type is not None:
         layout.card_type = payload.card_type
@@ -1713,7 +2000,6 @@ async def update_character_layout(
                 stats_config_dicts.append(s.dict(exclude_none=False))
             else:
                 stats_config_dicts.append(s)
-        print(f"[update_character_layout] Saving stats_config to database: {stats_config_dicts}")
         layout.stats_config = stats_config_dicts
     if payload.stats_to_display is not None:
         layout.stats_to_display = payload.stats_to_display
@@ -1753,8 +2039,21 @@ async def update_character_layout(
         layout.color_preset = payload.color_preset
 
     layout.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(layout)
+    await db.commit()
+    await db.refresh(layout)
+
+    if was_default or layout.is_default:
+        # Rebuild the cached theme before overlays re-read it
+        if layout.is_default:
+            theme = build_campaign_theme(layout)
+        else:
+            theme = build_campaign_theme(None, as_of=layout.updated_at)
+        store_campaign_theme(campaign_uuid, theme)
+        await broadcast_to_campaign(str(campaign_uuid), {
+            "type": "LAYOUT_THEME_UPDATED",
+            "layout_id": str(layout.id),
+            "as_of": theme.as_of.isoformat()
+        })
 
     return layout.to_dict()
 
@@ -1763,8 +2062,8 @@ async def update_character_layout(
 async def delete_character_layout(
     campaign_id: str,
     layout_id: str,
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a character layout (admin only)"""
     try:
@@ -1776,28 +2075,119 @@ async def delete_character_layout(
     if campaign.id != campaign_uuid:
         raise HTTPException(status_code=403, detail="Not authorized to modify this campaign")
 
-    layout = db.query(CharacterLayout).filter(
+    layout = await db.scalar(select(CharacterLayout).where(
         and_(CharacterLayout.id == layout_uuid, CharacterLayout.campaign_id == campaign_uuid)
-    ).first()
+    ))
 
     if not layout:
         raise HTTPException(status_code=404, detail="Layout not found")
 
-    db.delete(layout)
-    db.commit()
+    was_default = layout.is_default
+    await db.delete(layout)
+    await db.commit()
+
+    if was_default:
+        # No default layout any more: the system default applies
+        theme = build_campaign_theme(None, as_of=datetime.utcnow())
+        store_campaign_theme(campaign_uuid, theme)
+        await broadcast_to_campaign(str(campaign_uuid), {
+            "type": "LAYOUT_THEME_UPDATED",
+            "layout_id": str(layout_uuid),
+            "as_of": theme.as_of.isoformat()
+        })
 
     return {"message": "Layout deleted successfully"}
 
 
-@app.patch("/campaigns/{campaign_id}/characters/{character_id}/stats")
-async def update_character_stats(
+# Stat keys accepted by the stat-only endpoints
+ALLOWED_STAT_KEYS = {"str", "dex", "con", "int", "wis", "cha", "hp", "ac"}
+
+
+# Registered before PATCH /characters/{character_id} so "stats:batch" is not taken for an ID
+@app.patch("/campaigns/{campaign_id}/characters/stats:batch")
+async def update_character_stats_batch(
     campaign_id: str,
-    character_id: str,
-    stats: Dict[str, Any],
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    payload: CharacterStatsBatchRequest,
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Update character stats (admin only)"""
+    """
+    Update the stats of several characters in one transaction (admin only)
+    Each update sets `stats` values (null removes the stat) and/or adds `deltas`
+    (e.g. {"hp": -8} for an AoE); all rows are written by a single UPDATE and
+    broadcast as one CHARS_UPDATED
+    """
+    try:
+        campaign_uuid = uuid.UUID(campaign_id)
+        character_uuids = [uuid.UUID(item.character_id) for item in payload.updates]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid campaign or character ID")
+
+    if campaign.id != campaign_uuid:
+        raise HTTPException(status_code=403, detail="Not authorized to modify this campaign")
+
+    if len(set(character_uuids)) != len(character_uuids):
+        raise HTTPException(status_code=400, detail="Each character may appear only once")
+
+    # Lock the rows so concurrent deltas are not lost
+    rows = (await db.execute(
+        select(Character.id, Character.stats).where(
+            and_(Character.campaign_id == campaign_uuid, Character.id.in_(character_uuids))
+        ).with_for_update()
+    )).all()
+    current_stats = {row.id: row.stats or {} for row in rows}
+
+    missing = [str(cid) for cid in character_uuids if cid not in current_stats]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Characters not found: {', '.join(missing)}")
+
+    new_stats = {}
+    for character_uuid, item in zip(character_uuids, payload.updates):
+        stats = dict(current_stats[character_uuid])
+        for key, value in item.stats.items():
+            if key not in ALLOWED_STAT_KEYS:
+                continue
+            if value is None:
+                stats.pop(key, None)
+            else:
+                stats[key] = value
+        for key, delta in item.deltas.items():
+            if key in ALLOWED_STAT_KEYS:
+                value = stats.get(key)
+                stats[key] = (value if isinstance(value, int) else 0) + delta
+        new_stats[character_uuid] = stats
+
+    updated_at = datetime.utcnow()
+    await db.execute(
+        update(Character)
+        .where(Character.id.in_(character_uuids))
+        .values(
+            stats=case({cid: literal(stats, JSONB) for cid, stats in new_stats.items()}, value=Character.id),
+            updated_at=updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+    # One combined broadcast, sent now rather than after the coalescing window
+    changes = {
+        str(cid): {"stats": stats, "updated_at": updated_at.isoformat()}
+        for cid, stats in new_stats.items()
+    }
+    await character_updates.add_batch(str(campaign.id), changes)
+
+    return {"characters": [{"id": cid, **fields} for cid, fields in changes.items()]}
+
+
+@app.patch("/campaigns/{campaign_id}/characters/{character_id}/stats")
+async def update_character_stats(
+    campaign_id: str,
+    character_id: str,
+    stats: Dict[str, Any],
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Update character stats (admin only)"""
     try:
         campaign_uuid = uuid.UUID(campaign_id)
         character_uuid = uuid.UUID(character_id)
@@ -1807,22 +2197,22 @@ async def update_character_stats(
     if campaign.id != campaign_uuid:
         raise HTTPException(status_code=403, detail="Not authorized to modify this campaign")
 
-    character = db.query(Character).filter(
+    character = await db.scalar(select(Character).where(
         and_(Character.id == character_uuid, Character.campaign_id == campaign_uuid)
-    ).first()
+    ))
 
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
 
     # Update stats - validate only known stat keys
-    allowed_stats = {"str", "dex", "con", "int", "wis", "cha", "hp", "ac"}
-    character.stats = {k: v for k, v in stats.items() if k in allowed_stats}
+    character.stats = {k: v for k, v in stats.items() if k in ALLOWED_STAT_KEYS}
     character.updated_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(character)
+    await db.commit()
+    await db.refresh(character)
 
-    return character.to_dict()
+    # Broadcast the changed fields (coalesced with other updates in the window)
+    return await broadcast_character_changes(str(campaign.id), character, db)
 
 
 @app.patch("/campaigns/{campaign_id}/characters/{character_id}")
@@ -1830,20 +2220,14 @@ async def update_character(
     campaign_id: str,
     character_id: str,
     payload: CharacterUpdateRequest,
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update character info and stats (admin only)"""
-
-    # DEBUG: Log incoming payload
-    print("\n" + "="*80)
-    print("[UPDATE CHARACTER - DEBUG]")
-    print("="*80)
-    print(f"Character ID: {character_id}")
-    print(f"Payload dict: {payload.model_dump()}")
-    print(f"Image offsets - X: {payload.image_offset_x}, Y: {payload.image_offset_y}")
-    print(f"Background offsets - X: {payload.background_image_offset_x}, Y: {payload.background_image_offset_y}")
-    print("="*80 + "\n")
+    if debug_payloads_enabled("update_character"):
+        logger.debug("Update character payload", extra={
+            "route": "update_character", "character_id": character_id, "payload": payload.model_dump()
+        })
 
     try:
         campaign_uuid = uuid.UUID(campaign_id)
@@ -1854,9 +2238,9 @@ async def update_character(
     if campaign.id != campaign_uuid:
         raise HTTPException(status_code=403, detail="Not authorized to modify this campaign")
 
-    character = db.query(Character).filter(
+    character = await db.scalar(select(Character).where(
         and_(Character.id == character_uuid, Character.campaign_id == campaign_uuid)
-    ).first()
+    ))
 
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
@@ -1902,17 +2286,11 @@ async def update_character(
         character.color_theme_override = payload.color_theme_override
 
     character.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(character)
+    await db.commit()
+    await db.refresh(character)
 
-    # DEBUG: Log what was saved
-    print("\n" + "="*80)
-    print("[UPDATE CHARACTER - SAVED VALUES]")
-    print("="*80)
-    print(f"Image offsets - X: {character.image_offset_x}, Y: {character.image_offset_y}")
-    print("="*80 + "\n")
-
-    return character.to_dict()
+    # Broadcast the changed fields (coalesced with other updates in the window)
+    return await broadcast_character_changes(str(campaign.id), character, db)
 
 
 @app.post("/campaigns/{campaign_id}/characters/{character_id}/color-theme")
@@ -1920,8 +2298,8 @@ async def set_character_color_override(
     campaign_id: str,
     character_id: str,
     payload: CharacterThemeOverrideInput,
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Set character color theme override (admin only)"""
     try:
@@ -1933,9 +2311,9 @@ async def set_character_color_override(
     if campaign.id != campaign_uuid:
         raise HTTPException(status_code=403, detail="Not authorized to modify this campaign")
 
-    character = db.query(Character).filter(
+    character = await db.scalar(select(Character).where(
         and_(Character.id == character_uuid, Character.campaign_id == campaign_uuid)
-    ).first()
+    ))
 
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
@@ -1943,8 +2321,14 @@ async def set_character_color_override(
     # Set color theme override
     character.color_theme_override = payload.dict()
     character.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(character)
+    await db.commit()
+    await db.refresh(character)
+
+    # Broadcast update (resolved colors changed)
+    await broadcast_to_campaign(str(campaign.id), {
+        "type": "CHAR_UPDATED",
+        "character": character.to_dict()
+    })
 
     return {"message": "Color theme override set", "character": character.to_dict()}
 
@@ -1953,8 +2337,8 @@ async def set_character_color_override(
 async def clear_character_color_override(
     campaign_id: str,
     character_id: str,
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Clear character color theme override to use campaign default (admin only)"""
     try:
@@ -1966,9 +2350,9 @@ async def clear_character_color_override(
     if campaign.id != campaign_uuid:
         raise HTTPException(status_code=403, detail="Not authorized to modify this campaign")
 
-    character = db.query(Character).filter(
+    character = await db.scalar(select(Character).where(
         and_(Character.id == character_uuid, Character.campaign_id == campaign_uuid)
-    ).first()
+    ))
 
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
@@ -1976,8 +2360,14 @@ async def clear_character_color_override(
     # Clear color theme override (set to None)
     character.color_theme_override = None
     character.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(character)
+    await db.commit()
+    await db.refresh(character)
+
+    # Broadcast update (resolved colors changed)
+    await broadcast_to_campaign(str(campaign.id), {
+        "type": "CHAR_UPDATED",
+        "character": character.to_dict()
+    })
 
     return {"message": "Color theme override cleared, using campaign default", "character": character.to_dict()}
 
@@ -1986,7 +2376,7 @@ async def clear_character_color_override(
 async def get_resolved_character_colors(
     campaign_id: str,
     character_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get resolved colors for character (character override if set, else campaign layout) - Public endpoint"""
     try:
@@ -1995,13 +2385,18 @@ async def get_resolved_character_colors(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid campaign or character ID")
 
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_uuid).first()
+    campaign = await db.scalar(select(Campaign.id).where(Campaign.id == campaign_uuid))
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found")
 
-    character = db.query(Character).filter(
-        and_(Character.id == character_uuid, Character.campaign_id == campaign_uuid)
-    ).first()
+    # Only the override is needed to resolve colors
+    character = await db.scalar(
+        select(Character).options(
+            load_only(Character.id, Character.color_theme_override)
+        ).where(
+            and_(Character.id == character_uuid, Character.campaign_id == campaign_uuid)
+        )
+    )
 
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
@@ -2014,35 +2409,12 @@ async def get_resolved_character_colors(
             "colors": character.color_theme_override
         }
 
-    # Otherwise, get campaign's default layout colors
-    layout = db.query(CharacterLayout).filter(
-        and_(CharacterLayout.campaign_id == campaign_uuid, CharacterLayout.is_default == True)
-    ).first()
-
-    if layout:
-        return {
-            "character_id": str(character.id),
-            "source": "campaign_default",
-            "colors": {
-                "border_colors": layout.border_colors,
-                "text_color": layout.text_color,
-                "badge_interior_gradient": layout.badge_interior_gradient,
-                "hp_color": layout.hp_color,
-                "ac_color": layout.ac_color
-            }
-        }
-
-    # Fallback: return Option A (Gold & Warmth) preset if no default layout
+    # Otherwise the campaign's default layout colors, or Option A (Gold & Warmth) if no default layout
+    theme = await get_campaign_theme_async(campaign_uuid, db)
     return {
         "character_id": str(character.id),
-        "source": "system_default",
-        "colors": {
-            "border_colors": ["#FFD700", "#FFA500", "#FF8C00", "#DC7F2E"],
-            "text_color": "#FFFFFF",
-            "badge_interior_gradient": {"type": "radial", "colors": ["#FFE4B5", "#DAA520"]},
-            "hp_color": {"border": "#FF0000", "interior_gradient": {"type": "radial", "colors": ["#FF6B6B", "#CC0000"]}},
-            "ac_color": {"border": "#808080", "interior_gradient": {"type": "radial", "colors": ["#A9A9A9", "#696969"]}}
-        }
+        "source": theme.source,
+        "colors": theme.colors
     }
 
 
@@ -2078,13 +2450,13 @@ async def update_layout(
     campaign_id: str,
     tier: str,
     payload: LayoutUpdate,
-    campaign: Campaign = Depends(verify_campaign_token),
-    db: Session = Depends(get_db)
+    campaign: CampaignIdentity = Depends(verify_campaign_token),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update layout overrides for tier (admin only)"""
-    layout = db.query(LayoutOverrides).filter(
+    layout = await db.scalar(select(LayoutOverrides).where(
         and_(LayoutOverrides.campaign_id == campaign.id, LayoutOverrides.tier == tier)
-    ).first()
+    ))
 
     if not layout:
         layout = LayoutOverrides(campaign_id=campaign.id, tier=tier)
@@ -2096,8 +2468,8 @@ async def update_layout(
         layout.chips = payload.chips
 
     layout.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(layout)
+    await db.commit()
+    await db.refresh(layout)
 
     # Broadcast update
     await broadcast_to_campaign(campaign_id, {
@@ -2113,91 +2485,193 @@ async def update_layout(
 # PUBLIC ENDPOINTS (Phase 3 Tier 3: Campaign Website Pages)
 # ============================================================================
 
-@app.get("/public/campaigns")
-def get_all_public_campaigns(db: Session = Depends(get_db)):
+def campaigns_with_counts_query(db: Session):
+    """
+    Build a query returning (Campaign, character_count, episode_count) rows.
+    Counts come from grouped subqueries joined once, instead of two count()
+    round trips per campaign:
+    - character_count: active characters
+    - episode_count: published episodes
+    """
+    char_counts = db.query(
+        Character.campaign_id.label("campaign_id"),
+        func.count(Character.id).label("character_count")
+    ).filter(Character.is_active == True).group_by(Character.campaign_id).subquery()
+
+    ep_counts = db.query(
+        Episode.campaign_id.label("campaign_id"),
+        func.count(Episode.id).label("episode_count")
+    ).filter(Episode.is_published == True).group_by(Episode.campaign_id).subquery()
+
+    return db.query(
+        Campaign,
+        func.coalesce(char_counts.c.character_count, 0),
+        func.coalesce(ep_counts.c.episode_count, 0),
+    ).outerjoin(
+        char_counts, char_counts.c.campaign_id == Campaign.id
+    ).outerjoin(
+        ep_counts, ep_counts.c.campaign_id == Campaign.id
+    )
+
+
+def campaign_with_counts_query(db: Session):
+    """
+    Single-campaign form of campaigns_with_counts_query (filter it to one campaign)
+    The counts are correlated subqueries scoped to Campaign.id, so only that campaign's
+    characters and episodes are counted - the grouped form aggregates every tenant
+    before the campaign filter applies
+    """
+    character_count = select(func.count(Character.id)).where(
+        and_(Character.campaign_id == Campaign.id, Character.is_active == True)
+    ).correlate(Campaign).scalar_subquery()
+
+    episode_count = select(func.count(Episode.id)).where(
+        and_(Episode.campaign_id == Campaign.id, Episode.is_published == True)
+    ).correlate(Campaign).scalar_subquery()
+
+    return db.query(Campaign, character_count, episode_count)
+
+
+def encode_campaign_cursor(campaign: Campaign) -> str:
+    """Build an opaque pagination cursor from a campaign's (created_at, id) sort key"""
+    return f"{campaign.created_at.isoformat()}|{campaign.id}"
+
+
+def decode_campaign_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Parse a cursor produced by encode_campaign_cursor"""
+    try:
+        created_at_str, id_str = cursor.split("|", 1)
+        return (datetime.fromisoformat(created_at_str), uuid.UUID(id_str))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@app.get("/public/campaigns", response_class=FastJSONResponse)
+def get_all_public_campaigns(
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
     """
     Get all public campaigns with character and episode counts (public - no auth required)
     Returns: List of campaigns with character_count and episode_count
+
+    Optional keyset pagination: pass `limit` to page the results. When more
+    campaigns remain, the cursor for the next page is returned in the
+    X-Next-Cursor response header; pass it back as `cursor`.
     """
-    campaigns = db.query(Campaign).all()
+    if limit is not None and (limit < 1 or limit > 100):
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 100")
+
+    query = campaigns_with_counts_query(db)
+
+    if cursor:
+        cursor_created_at, cursor_id = decode_campaign_cursor(cursor)
+        query = query.filter(or_(
+            Campaign.created_at > cursor_created_at,
+            and_(Campaign.created_at == cursor_created_at, Campaign.id > cursor_id)
+        ))
+
+    query = query.order_by(Campaign.created_at.asc(), Campaign.id.asc())
+
+    next_cursor = None
+    if limit is not None:
+        # Fetch one extra row to know whether another page exists
+        rows = query.limit(limit + 1).all()
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_campaign_cursor(rows[-1][0])
+    else:
+        rows = query.all()
 
     result = []
-    for campaign in campaigns:
-        active_chars = db.query(Character).filter(
-            and_(Character.campaign_id == campaign.id, Character.is_active == True)
-        ).count()
-        published_eps = db.query(Episode).filter(
-            and_(Episode.campaign_id == campaign.id, Episode.is_published == True)
-        ).count()
-
+    for campaign, active_chars, published_eps in rows:
         campaign_dict = campaign.to_dict()
         campaign_dict['character_count'] = active_chars
         campaign_dict['episode_count'] = published_eps
         result.append(campaign_dict)
 
-    return result
+    response = FastJSONResponse(result)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
 
 
-@app.get("/public/campaigns/{slug}")
-def get_public_campaign(slug: str, db: Session = Depends(get_db)):
+@app.get("/public/campaigns/{slug}", response_class=FastJSONResponse)
+def get_public_campaign(slug: str, request: Request, db: Session = Depends(get_db)):
     """
     Get campaign details by slug (public - no auth required)
     Returns: Campaign object with stats
+    Cacheable: ETag from the campaign's updated_at and its counts
     """
-    campaign = db.query(Campaign).filter(Campaign.slug == slug).first()
-    if not campaign:
+    # Campaign, active character count and published episode count in one query
+    row = campaign_with_counts_query(db).filter(Campaign.slug == slug).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Campaign not found")
 
-    # Count active characters and published episodes
-    active_chars = db.query(Character).filter(
-        and_(Character.campaign_id == campaign.id, Character.is_active == True)
-    ).count()
-    published_eps = db.query(Episode).filter(
-        and_(Episode.campaign_id == campaign.id, Episode.is_published == True)
-    ).count()
+    campaign, active_chars, published_eps = row
 
-    return {
+    etag = make_etag("campaign", campaign.id, campaign.updated_at, active_chars, published_eps)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, campaign.updated_at)
+
+    return cacheable_response({
         **campaign.to_dict(),
         "character_count": active_chars,
         "episode_count": published_eps
-    }
+    }, etag, campaign.updated_at)
 
 
-@app.get("/public/campaigns/{slug}/characters")
-def get_public_characters(slug: str, db: Session = Depends(get_db)):
+@app.get("/public/campaigns/{slug}/characters", response_class=FastJSONResponse)
+def get_public_characters(slug: str, request: Request, fields: Optional[str] = None, db: Session = Depends(get_db)):
     """
     Get all active characters for a campaign (public - no auth required)
     Returns: List[Character] with color_theme_override
+    Optional `fields` (comma-separated) limits the keys returned and columns loaded,
+    e.g. the character grid can skip description and backstory
+    Cacheable: ETag from max(updated_at) and count of the active characters
     """
-    campaign = db.query(Campaign).filter(Campaign.slug == slug).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
+    selected_fields = parse_character_fields(fields)
 
-    characters = db.query(Character).filter(
-        and_(Character.campaign_id == campaign.id, Character.is_active == True)
-    ).all()
+    campaign = get_public_campaign_by_slug(slug, db)
+
+    active_filter = and_(Character.campaign_id == campaign.id, Character.is_active == True)
+
+    # Validate with an aggregate before loading any rows
+    last_modified, count = db.query(func.max(Character.updated_at), func.count(Character.id)).filter(active_filter).one()
+    etag = make_etag("characters", campaign.id, last_modified, count, selected_fields)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, last_modified)
 
-    return [c.to_dict() for c in characters]
+    characters = character_query(db, selected_fields).filter(active_filter).all()
 
+    return cacheable_response([c.to_dict(selected_fields) for c in characters], etag, last_modified)
 
-@app.get("/public/campaigns/{slug}/layout")
-def get_public_campaign_layout(slug: str, db: Session = Depends(get_db)):
+
+@app.get("/public/campaigns/{slug}/layout", response_class=FastJSONResponse)
+def get_public_campaign_layout(slug: str, request: Request, db: Session = Depends(get_db)):
     """
     Get default campaign character layout for public display (public - no auth required)
     Returns: CharacterLayout object with styling configuration
+    Cacheable: ETag from the default layout's id and updated_at
     """
-    campaign = db.query(Campaign).filter(Campaign.slug == slug).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
+    campaign = get_public_campaign_by_slug(slug, db)
+
+    default_filter = and_(CharacterLayout.campaign_id == campaign.id, CharacterLayout.is_default == True)
+
+    # Validate with the layout's version before loading it
+    version = db.query(CharacterLayout.id, CharacterLayout.updated_at).filter(default_filter).first()
+    last_modified = version.updated_at if version else None
+    etag = make_etag("layout", campaign.id, *(version or ("none",)))
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, last_modified)
 
     # Get the default layout for the campaign
-    layout = db.query(CharacterLayout).filter(
-        and_(CharacterLayout.campaign_id == campaign.id, CharacterLayout.is_default == True)
-    ).first()
+    layout = db.query(CharacterLayout).filter(default_filter).first()
 
     if not layout:
         # If no default layout exists, return a minimal response
-        return {
+        return cacheable_response({
             "id": None,
             "campaign_id": str(campaign.id),
             "name": "Default",
@@ -2206,20 +2680,18 @@ def get_public_campaign_layout(slug: str, db: Session = Depends(get_db)):
             "border_colors": ["#3b82f6"],
             "badge_colors": ["#3b82f6"],
             "text_color": "#1f2937",
-        }
+        }, etag, last_modified)
 
-    return layout.to_dict()
+    return cacheable_response(layout.to_dict(), etag, last_modified)
 
 
-@app.get("/public/campaigns/{slug}/characters/{character_slug}")
+@app.get("/public/campaigns/{slug}/characters/{character_slug}", response_class=FastJSONResponse)
 def get_public_character(slug: str, character_slug: str, db: Session = Depends(get_db)):
     """
     Get character details by slug (public - no auth required)
     Returns: Character object with full details and color_theme_override
     """
-    campaign = db.query(Campaign).filter(Campaign.slug == slug).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
+    campaign = get_public_campaign_by_slug(slug, db)
 
     character = db.query(Character).filter(
         and_(
@@ -2232,35 +2704,40 @@ def get_public_character(slug: str, character_slug: str, db: Session = Depends(g
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
 
-    return character.to_dict()
+    return FastJSONResponse(character.to_dict())
 
 
-@app.get("/public/campaigns/{slug}/episodes")
-def get_public_episodes(slug: str, db: Session = Depends(get_db)):
+@app.get("/public/campaigns/{slug}/episodes", response_class=FastJSONResponse)
+def get_public_episodes(slug: str, request: Request, db: Session = Depends(get_db)):
     """
     Get all published episodes for a campaign (public - no auth required)
     Returns: List[Episode] ordered by season/episode number
+    Cacheable: ETag from max(updated_at) and count of the published episodes
     """
-    campaign = db.query(Campaign).filter(Campaign.slug == slug).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
+    campaign = get_public_campaign_by_slug(slug, db)
+
+    published_filter = and_(Episode.campaign_id == campaign.id, Episode.is_published == True)
 
-    episodes = db.query(Episode).filter(
-        and_(Episode.campaign_id == campaign.id, Episode.is_published == True)
-    ).order_by(Episode.season.desc(), Episode.episode_number.asc()).all()
+    # Validate with an aggregate before loading any rows
+    last_modified, count = db.query(func.max(Episode.updated_at), func.count(Episode.id)).filter(published_filter).one()
+    etag = make_etag("episodes", campaign.id, last_modified, count)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, last_modified)
+
+    episodes = db.query(Episode).filter(published_filter).order_by(
+        Episode.season.desc(), Episode.episode_number.asc()
+    ).all()
 
-    return [e.to_dict() for e in episodes]
+    return cacheable_response([e.to_dict() for e in episodes], etag, last_modified)
 
 
-@app.get("/public/campaigns/{slug}/episodes/{episode_slug}")
+@app.get("/public/campaigns/{slug}/episodes/{episode_slug}", response_class=FastJSONResponse)
 def get_public_episode(slug: str, episode_slug: str, db: Session = Depends(get_db)):
     """
     Get episode details by slug with all events (public - no auth required)
     Returns: Episode object with events included
     """
-    campaign = db.query(Campaign).filter(Campaign.slug == slug).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
+    campaign = get_public_campaign_by_slug(slug, db)
 
     episode = db.query(Episode).filter(
         and_(
@@ -2273,10 +2750,10 @@ def get_public_episode(slug: str, episode_slug: str, db: Session = Depends(get_d
     if not episode:
         raise HTTPException(status_code=404, detail="Episode not found")
 
-    return episode.to_dict(include_events=True)
+    return FastJSONResponse(episode.to_dict(include_events=True))
 
 
-@app.get("/public/episodes/{episode_id}/events")
+@app.get("/public/episodes/{episode_id}/events", response_class=FastJSONResponse)
 def get_public_episode_events(episode_id: str, db: Session = Depends(get_db)):
     """
     Get all events for an episode (public - no auth required)
@@ -2296,31 +2773,22 @@ def get_public_episode_events(episode_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=403, detail="Episode is not published")
 
     events = db.query(Event).filter(Event.episode_id == episode_uuid).all()
-    return [e.to_dict() for e in events]
+    return FastJSONResponse([e.to_dict() for e in events])
 
 
 # ============================================================================
 # PHASE 4: HELPER FUNCTIONS FOR OVERLAY ENDPOINTS
 # ============================================================================
 
-def resolve_character_colors(character: Character, campaign: Campaign, db: Session) -> tuple[Dict[str, Any], str]:
+def resolve_campaign_colors(layout: Optional[CharacterLayout]) -> tuple[Dict[str, Any], str]:
     """
-    Resolve character colors using three-tier fallback logic:
-    1. Character's color_theme_override (if set)
+    Resolve the campaign-level colors (tiers 2 and 3 of the fallback logic):
     2. Campaign's default color theme from CharacterLayout (if exists)
     3. System default (Option A - Gold & Warmth preset)
 
     Returns: (resolved_colors_dict, source_string)
     """
-    # Tier 1: Character override
-    if character.color_theme_override:
-        return (character.color_theme_override, "character_override")
-
     # Tier 2: Campaign default layout
-    layout = db.query(CharacterLayout).filter(
-        and_(CharacterLayout.campaign_id == campaign.id, CharacterLayout.is_default == True)
-    ).first()
-
     if layout:
         campaign_colors = {
             "border_colors": layout.border_colors,
@@ -2343,36 +2811,126 @@ def resolve_character_colors(character: Character, campaign: Campaign, db: Sessi
     return (system_default, "system_default")
 
 
-# ============================================================================
-# PHASE 4: LIVE STREAM OVERLAY ENDPOINTS (PUBLIC - NO AUTH REQUIRED)
-# ============================================================================
+class CampaignTheme(NamedTuple):
+    """Resolved campaign-level colors (tiers 2 and 3) and the layout version they came from"""
+    colors: Dict[str, Any]
+    source: str
+    layout_id: Optional[uuid.UUID]
+    as_of: datetime  # Default layout's updated_at (or when the default was removed)
 
-@app.get("/campaigns/{campaign_id}/overlay/config")
-def get_overlay_config(campaign_id: str, db: Session = Depends(get_db)):
-    """Get overlay configuration for campaign (PUBLIC - no auth required)"""
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid campaign ID format")
 
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_uuid).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
+# campaign_id -> CampaignTheme, refreshed by the character layout endpoints when the
+# default layout changes; other workers drop entries older than the as_of carried by
+# LAYOUT_THEME_UPDATED; TTL bounds staleness if a broadcast is lost
+campaign_theme_cache = TTLCache(maxsize=settings.THEME_CACHE_MAXSIZE, ttl=settings.THEME_CACHE_TTL)
 
-    # Get default color theme from campaign layout
-    default_layout = db.query(CharacterLayout).filter(
+# Only the columns a theme is built from
+THEME_LAYOUT_COLUMNS = (
+    CharacterLayout.id, CharacterLayout.updated_at, CharacterLayout.border_colors, CharacterLayout.text_color,
+    CharacterLayout.badge_interior_gradient, CharacterLayout.hp_color, CharacterLayout.ac_color,
+)
+
+
+def build_campaign_theme(layout: Optional[CharacterLayout], as_of: Optional[datetime] = None) -> CampaignTheme:
+    """Snapshot the resolved colors for a default layout (or the system default when None)"""
+    colors, source = resolve_campaign_colors(layout)
+    if layout:
+        return CampaignTheme(colors, source, layout.id, layout.updated_at)
+    return CampaignTheme(colors, source, None, as_of or datetime.min)
+
+
+def store_campaign_theme(campaign_uuid: uuid.UUID, theme: CampaignTheme):
+    """Cache a theme unless a newer version is already cached (guards against slow readers)"""
+    campaign_theme_cache.set(campaign_uuid, theme, replace_if=lambda current: theme.as_of >= current.as_of)
+
+
+def invalidate_campaign_theme(campaign_uuid: uuid.UUID, as_of: Optional[datetime]):
+    """Drop a cached theme older than as_of (any cached theme when as_of is unknown)"""
+    campaign_theme_cache.delete_if(campaign_uuid, lambda current: as_of is None or current.as_of < as_of)
+
+
+def get_campaign_theme(campaign_uuid: uuid.UUID, db: Session) -> CampaignTheme:
+    """Resolved campaign theme, loading the default layout only on a cache miss"""
+    theme = campaign_theme_cache.get(campaign_uuid)
+    if theme is not None:
+        return theme
+
+    layout = db.query(CharacterLayout).options(load_only(*THEME_LAYOUT_COLUMNS)).filter(
         and_(CharacterLayout.campaign_id == campaign_uuid, CharacterLayout.is_default == True)
     ).first()
+    theme = build_campaign_theme(layout)
+    store_campaign_theme(campaign_uuid, theme)
+    return theme
 
-    default_color_theme = None
-    if default_layout:
-        default_color_theme = {
-            "border_colors": default_layout.border_colors,
-            "text_color": default_layout.text_color,
-            "badge_interior_gradient": default_layout.badge_interior_gradient,
-            "hp_color": default_layout.hp_color,
-            "ac_color": default_layout.ac_color
-        }
+
+async def get_campaign_theme_async(campaign_uuid: uuid.UUID, db: AsyncSession) -> CampaignTheme:
+    """get_campaign_theme for async handlers"""
+    theme = campaign_theme_cache.get(campaign_uuid)
+    if theme is not None:
+        return theme
+
+    layout = await db.scalar(select(CharacterLayout).options(load_only(*THEME_LAYOUT_COLUMNS)).where(
+        and_(CharacterLayout.campaign_id == campaign_uuid, CharacterLayout.is_default == True)
+    ))
+    theme = build_campaign_theme(layout)
+    store_campaign_theme(campaign_uuid, theme)
+    return theme
+
+
+def resolve_character_colors(character: Character, campaign: Campaign, db: Session) -> tuple[Dict[str, Any], str]:
+    """
+    Resolve character colors using three-tier fallback logic:
+    1. Character's color_theme_override (if set)
+    2. Campaign's default color theme from CharacterLayout (if exists)
+    3. System default (Option A - Gold & Warmth preset)
+
+    Returns: (resolved_colors_dict, source_string)
+    """
+    # Tier 1: Character override
+    if character.color_theme_override:
+        return (character.color_theme_override, "character_override")
+
+    theme = get_campaign_theme(campaign.id, db)
+    return (theme.colors, theme.source)
+
+
+def resolve_characters_colors(
+    characters: List[Character],
+    theme: CampaignTheme
+) -> Dict[uuid.UUID, tuple[Dict[str, Any], str]]:
+    """
+    Batched version of resolve_character_colors for a whole roster.
+    Uses an already-resolved campaign theme so no queries are issued per character.
+
+    Returns: {character_id: (resolved_colors_dict, source_string)}
+    """
+    campaign_colors = (theme.colors, theme.source)
+    return {
+        char.id: (char.color_theme_override, "character_override") if char.color_theme_override else campaign_colors
+        for char in characters
+    }
+
+
+def load_overlay_campaign(campaign_uuid: uuid.UUID, db: Session) -> tuple[Optional[Campaign], Optional[Roster], Optional[CampaignTheme]]:
+    """
+    Load a campaign together with its active roster in a single query (outer join,
+    so a missing roster comes back as None) plus its cached campaign theme
+
+    Returns: (campaign, roster, theme) - campaign is None if not found
+    """
+    row = db.query(Campaign, Roster).outerjoin(
+        Roster, Roster.campaign_id == Campaign.id
+    ).filter(Campaign.id == campaign_uuid).first()
+
+    if not row:
+        return (None, None, None)
+    return (row[0], row[1], get_campaign_theme(campaign_uuid, db))
+
+
+def build_overlay_config(campaign: Campaign, theme: CampaignTheme) -> Dict[str, Any]:
+    """Build the overlay config payload (shape of GET /overlay/config)"""
+    # Only a campaign default layout is reported; the system default is left to the client
+    default_color_theme = theme.colors if theme.layout_id else None
 
     return {
         "campaign_id": str(campaign.id),
@@ -2383,29 +2941,20 @@ def get_overlay_config(campaign_id: str, db: Session = Depends(get_db)):
     }
 
 
-@app.get("/campaigns/{campaign_id}/overlay/character/{character_id}")
-def get_overlay_character(campaign_id: str, character_id: str, db: Session = Depends(get_db)):
-    """Get character with resolved colors for overlay (PUBLIC - no auth required)"""
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-        char_uuid = uuid.UUID(character_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid campaign or character ID format")
-
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_uuid).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
+# Columns read by the overlay character/roster builders (skips description, backstory, ...)
+OVERLAY_CHARACTER_FIELDS = (
+    "id", "campaign_id", "name", "slug", "class_name", "race", "player_name",
+    "image_url", "image_variants", "level", "is_active", "stats", "color_theme_override",
+)
 
-    character = db.query(Character).filter(
-        and_(Character.id == char_uuid, Character.campaign_id == campaign_uuid)
-    ).first()
 
-    if not character:
-        raise HTTPException(status_code=404, detail="Character not found")
+def overlay_character_query(db: Session):
+    """Character query projected to the overlay columns"""
+    return db.query(Character).options(load_only(*Character.columns(OVERLAY_CHARACTER_FIELDS)))
 
-    # Resolve colors with three-tier fallback
-    resolved_colors, color_source = resolve_character_colors(character, campaign, db)
 
+def build_overlay_character(character: Character, resolved_colors: Dict[str, Any], color_source: str) -> Dict[str, Any]:
+    """Build a single overlay character (shape of GET /overlay/character/{id})"""
     return {
         "id": str(character.id),
         "campaign_id": str(character.campaign_id),
@@ -2415,6 +2964,7 @@ def get_overlay_character(campaign_id: str, character_id: str, db: Session = Dep
         "race": character.race,
         "player_name": character.player_name,
         "image_url": character.image_url,
+        "image_variants": character.image_variants or {},
         "level": character.level,
         "is_active": character.is_active,
         "stats": character.stats or {},
@@ -2423,35 +2973,29 @@ def get_overlay_character(campaign_id: str, character_id: str, db: Session = Dep
     }
 
 
-@app.get("/campaigns/{campaign_id}/overlay/roster")
-def get_overlay_roster(campaign_id: str, db: Session = Depends(get_db)):
-    """Get character roster for overlay (PUBLIC - no auth required)"""
-    try:
-        campaign_uuid = uuid.UUID(campaign_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid campaign ID format")
-
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_uuid).first()
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
-
-    # Get all characters
-    characters = db.query(Character).filter(Character.campaign_id == campaign_uuid).all()
-
-    # Get active roster
-    roster = db.query(Roster).filter(Roster.campaign_id == campaign_uuid).first()
+def build_overlay_roster(
+    campaign: Campaign,
+    characters: List[Character],
+    roster: Optional[Roster],
+    theme: CampaignTheme
+) -> Dict[str, Any]:
+    """Build the overlay roster payload (shape of GET /overlay/roster)"""
     active_roster_ids = [str(cid) for cid in roster.character_ids] if roster and roster.character_ids else []
 
+    # Resolve colors for every character in memory (no per-character layout query)
+    colors_by_id = resolve_characters_colors(characters, theme)
+
     # Build character list with resolved colors
     character_list = []
     for char in characters:
-        resolved_colors, color_source = resolve_character_colors(char, campaign, db)
+        resolved_colors, color_source = colors_by_id[char.id]
         character_list.append({
             "id": str(char.id),
             "name": char.name,
             "slug": char.slug,
             "class_name": char.class_name,
             "image_url": char.image_url,
+            "image_variants": char.image_variants or {},
             "level": char.level,
             "is_active": char.is_active,
             "resolved_colors": resolved_colors,
@@ -2465,7 +3009,148 @@ def get_overlay_roster(campaign_id: str, db: Session = Depends(get_db)):
     }
 
 
-@app.get("/campaigns/{campaign_id}/episodes/{episode_id}/overlay/events")
+def build_overlay_events(events: List[Event], db: Session) -> List[Dict[str, Any]]:
+    """
+    Build overlay-shaped events with character names resolved.
+    All referenced characters are fetched with a single IN query.
+    """
+    # characters_involved is a native UUID array - collect every referenced ID
+    referenced_uuids = {cid for event in events for cid in event.characters_involved or []}
+
+    # Resolve all character names with a single IN query
+    names_by_id = {}
+    if referenced_uuids:
+        names_by_id = {
+            str(char_id): name
+            for char_id, name in db.query(Character.id, Character.name).filter(Character.id.in_(referenced_uuids))
+        }
+
+    # Build event list with character names
+    return [build_overlay_event(event.to_dict(), names_by_id) for event in events]
+
+
+def build_overlay_event(event: Dict[str, Any], names_by_id: Dict[str, str]) -> Dict[str, Any]:
+    """Build a single overlay event from a serialized event (Event.to_dict())"""
+    character_ids = event["characters_involved"]
+    return {
+        "id": event["id"],
+        "episode_id": event["episode_id"],
+        "name": event["name"],
+        "description": event["description"],
+        "timestamp_in_episode": event["timestamp_in_episode"],
+        "event_type": event["event_type"],
+        "characters_involved": character_ids,
+        "character_names": [names_by_id[cid] for cid in character_ids if cid in names_by_id],
+        "created_at": event["created_at"]
+    }
+
+
+def build_overlay_episode_events(episode: Episode, db: Session) -> Dict[str, Any]:
+    """Build the episode timeline payload (shape of GET /episodes/{id}/overlay/events)"""
+    # Get all events for episode
+    events = db.query(Event).filter(Event.episode_id == episode.id).order_by(Event.timestamp_in_episode.asc()).all()
+
+    return {
+        "episode_id": str(episode.id),
+        "episode_name": episode.name,
+        "episode_number": episode.episode_number,
+        "season": episode.season,
+        "events": build_overlay_events(events, db)
+    }
+
+
+def get_active_episode(campaign_uuid: uuid.UUID, db: Session) -> Optional[Episode]:
+    """Get the active/featured episode for a campaign (most recent published episode)"""
+    return db.query(Episode).filter(
+        and_(Episode.campaign_id == campaign_uuid, Episode.is_published == True)
+    ).order_by(Episode.created_at.desc()).first()
+
+
+def build_overlay_active_episode(episode: Episode, event_count: int) -> Dict[str, Any]:
+    """Build the active episode payload (shape of GET /overlay/active-episode)"""
+    return {
+        "id": str(episode.id),
+        "campaign_id": str(episode.campaign_id),
+        "name": episode.name,
+        "slug": episode.slug,
+        "episode_number": episode.episode_number,
+        "season": episode.season,
+        "description": episode.description,
+        "air_date": episode.air_date,
+        "runtime": episode.runtime,
+        "is_published": episode.is_published,
+        "event_count": event_count
+    }
+
+
+# ============================================================================
+# PHASE 4: LIVE STREAM OVERLAY ENDPOINTS (PUBLIC - NO AUTH REQUIRED)
+# ============================================================================
+
+@app.get("/campaigns/{campaign_id}/overlay/config", response_class=FastJSONResponse)
+def get_overlay_config(campaign_id: str, db: Session = Depends(get_db)):
+    """Get overlay configuration for campaign (PUBLIC - no auth required)"""
+    try:
+        campaign_uuid = uuid.UUID(campaign_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid campaign ID format")
+
+    campaign = db.query(Campaign).filter(Campaign.id == campaign_uuid).first()
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+
+    # Default color theme from the campaign layout (cached per campaign)
+    theme = get_campaign_theme(campaign_uuid, db)
+
+    return FastJSONResponse(build_overlay_config(campaign, theme))
+
+
+@app.get("/campaigns/{campaign_id}/overlay/character/{character_id}", response_class=FastJSONResponse)
+def get_overlay_character(campaign_id: str, character_id: str, db: Session = Depends(get_db)):
+    """Get character with resolved colors for overlay (PUBLIC - no auth required)"""
+    try:
+        campaign_uuid = uuid.UUID(campaign_id)
+        char_uuid = uuid.UUID(character_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid campaign or character ID format")
+
+    campaign = db.query(Campaign).filter(Campaign.id == campaign_uuid).first()
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+
+    character = overlay_character_query(db).filter(
+        and_(Character.id == char_uuid, Character.campaign_id == campaign_uuid)
+    ).first()
+
+    if not character:
+        raise HTTPException(status_code=404, detail="Character not found")
+
+    # Resolve colors with three-tier fallback
+    resolved_colors, color_source = resolve_character_colors(character, campaign, db)
+
+    return FastJSONResponse(build_overlay_character(character, resolved_colors, color_source))
+
+
+@app.get("/campaigns/{campaign_id}/overlay/roster", response_class=FastJSONResponse)
+def get_overlay_roster(campaign_id: str, db: Session = Depends(get_db)):
+    """Get character roster for overlay (PUBLIC - no auth required)"""
+    try:
+        campaign_uuid = uuid.UUID(campaign_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid campaign ID format")
+
+    # Campaign, active roster and default layout in one query
+    campaign, roster, theme = load_overlay_campaign(campaign_uuid, db)
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+
+    # Get all characters
+    characters = overlay_character_query(db).filter(Character.campaign_id == campaign_uuid).all()
+
+    return FastJSONResponse(build_overlay_roster(campaign, characters, roster, theme))
+
+
+@app.get("/campaigns/{campaign_id}/episodes/{episode_id}/overlay/events", response_class=FastJSONResponse)
 def get_overlay_episode_events(campaign_id: str, episode_id: str, db: Session = Depends(get_db)):
     """Get episode events timeline for overlay (PUBLIC - no auth required)"""
     try:
@@ -2485,54 +3170,10 @@ def get_overlay_episode_events(campaign_id: str, episode_id: str, db: Session =
     if not episode:
         raise HTTPException(status_code=404, detail="Episode not found")
 
-    # Get all events for episode
-    events = db.query(Event).filter(Event.episode_id == episode_uuid).order_by(Event.timestamp_in_episode.asc()).all()
-
-    # Build event list with character names
-    event_list = []
-    for event in events:
-        character_ids = []
-        character_names = []
-
-        if event.characters_involved:
-            try:
-                character_ids = json.loads(event.characters_involved) if isinstance(event.characters_involved, str) else event.characters_involved
-
-                # Resolve character names
-                if character_ids:
-                    for char_id_str in character_ids:
-                        try:
-                            char_uuid = uuid.UUID(char_id_str)
-                            char = db.query(Character).filter(Character.id == char_uuid).first()
-                            if char:
-                                character_names.append(char.name)
-                        except (ValueError, AttributeError):
-                            continue
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-        event_list.append({
-            "id": str(event.id),
-            "episode_id": str(event.episode_id),
-            "name": event.name,
-            "description": event.description,
-            "timestamp_in_episode": event.timestamp_in_episode,
-            "event_type": event.event_type,
-            "characters_involved": character_ids,
-            "character_names": character_names,
-            "created_at": event.created_at.isoformat() if event.created_at else None
-        })
-
-    return {
-        "episode_id": str(episode.id),
-        "episode_name": episode.name,
-        "episode_number": episode.episode_number,
-        "season": episode.season,
-        "events": event_list
-    }
+    return FastJSONResponse(build_overlay_episode_events(episode, db))
 
 
-@app.get("/campaigns/{campaign_id}/overlay/active-episode")
+@app.get("/campaigns/{campaign_id}/overlay/active-episode", response_class=FastJSONResponse)
 def get_overlay_active_episode(campaign_id: str, db: Session = Depends(get_db)):
     """Get active/featured episode for overlay (PUBLIC - no auth required)"""
     try:
@@ -2545,9 +3186,7 @@ def get_overlay_active_episode(campaign_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Campaign not found")
 
     # Get most recent published episode
-    episode = db.query(Episode).filter(
-        and_(Episode.campaign_id == campaign_uuid, Episode.is_published == True)
-    ).order_by(Episode.created_at.desc()).first()
+    episode = get_active_episode(campaign_uuid, db)
 
     if not episode:
         raise HTTPException(status_code=404, detail="No published episodes found")
@@ -2555,21 +3194,275 @@ def get_overlay_active_episode(campaign_id: str, db: Session = Depends(get_db)):
     # Count events in episode
     event_count = db.query(Event).filter(Event.episode_id == episode.id).count()
 
+    return FastJSONResponse(build_overlay_active_episode(episode, event_count))
+
+
+# ============================================================================
+# PHASE 4: OVERLAY WEBSOCKET FEED (PUBLIC - NO AUTH REQUIRED)
+# ============================================================================
+# Push-based replacement for polling the overlay REST endpoints.
+# On connect the client receives one OVERLAY_SNAPSHOT with the same payloads
+# as /overlay/config, /overlay/roster, /overlay/active-episode and the active
+# episode's /overlay/events. Afterwards every broadcast_to_campaign() message
+# is translated into an overlay-shaped delta (resolved colors and character
+# names already applied):
+#   ROSTER_UPDATED   {"active_roster_ids": [...]}
+#   CHAR_CREATED / CHAR_UPDATED   {"character": <overlay character>}
+#   CHARS_UPDATED    {"characters": [{"id": "...", <changed overlay fields>}]}
+#                    (resolved_colors/color_source included when the override changed)
+#   CHAR_DELETED     {"character_id": "..."}
+#   EVENT / EVENT_UPDATED   {"event": <overlay event>}
+#   EVENT_DELETED    {"event_id": "..."}
+#   OVERLAY_SNAPSHOT (re-sent when the campaign's default layout/theme changes)
+# Clients may send "ping" (answered with "pong") or "snapshot" to request a
+# fresh snapshot. The server also sends "ping" every WS_PING_INTERVAL seconds;
+# a client that sends nothing (not even "pong") for WS_IDLE_TIMEOUT seconds is
+# closed with 1001. Past WS_MAX_CONNECTIONS_PER_CAMPAIGN new sockets are
+# refused with 1013.
+
+# Store active overlay connections per campaign
+overlay_connections = ConnectionManager()
+
+
+def build_overlay_snapshot(campaign_uuid: uuid.UUID, db: Session) -> Optional[Dict[str, Any]]:
+    """
+    Build the full overlay state for a campaign in one pass
+    Returns None if the campaign does not exist
+    """
+    campaign, roster, theme = load_overlay_campaign(campaign_uuid, db)
+    if not campaign:
+        return None
+
+    characters = overlay_character_query(db).filter(Character.campaign_id == campaign_uuid).all()
+
+    active_episode = None
+    episode_events = None
+    episode = get_active_episode(campaign_uuid, db)
+    if episode:
+        episode_events = build_overlay_episode_events(episode, db)
+        active_episode = build_overlay_active_episode(episode, len(episode_events["events"]))
+
     return {
-        "id": str(episode.id),
-        "campaign_id": str(episode.campaign_id),
-        "name": episode.name,
-        "slug": episode.slug,
-        "episode_number": episode.episode_number,
-        "season": episode.season,
-        "description": episode.description,
-        "air_date": episode.air_date,
-        "runtime": episode.runtime,
-        "is_published": episode.is_published,
-        "event_count": event_count
+        "type": "OVERLAY_SNAPSHOT",
+        "config": build_overlay_config(campaign, theme),
+        "roster": build_overlay_roster(campaign, characters, roster, theme),
+        "active_episode": active_episode,
+        "events": episode_events,
     }
 
 
+def load_campaign_theme(campaign_uuid: uuid.UUID) -> CampaignTheme:
+    """get_campaign_theme with its own session (synchronous - run in a worker thread)"""
+    with get_db_context() as db:
+        return get_campaign_theme(campaign_uuid, db)
+
+
+async def overlay_campaign_theme(campaign_uuid: uuid.UUID) -> CampaignTheme:
+    """Cached campaign theme, loaded in a worker thread only on a cache miss"""
+    theme = campaign_theme_cache.get(campaign_uuid)
+    if theme is None:
+        theme = await asyncio.to_thread(load_campaign_theme, campaign_uuid)
+    return theme
+
+
+def load_character_names(character_ids: List[str]) -> Dict[str, str]:
+    """Character names by ID (synchronous - run in a worker thread)"""
+    with get_db_context() as db:
+        return {
+            str(char_id): name
+            for char_id, name in db.query(Character.id, Character.name).filter(
+                Character.id.in_([uuid.UUID(cid) for cid in character_ids])
+            )
+        }
+
+
+async def build_overlay_character_patches(campaign_id: str, patches: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Overlay version of CHARS_UPDATED: only the changed fields the overlay displays
+    Returns None if no patch touches an overlay field
+    """
+    overlay_patches = []
+    for patch in patches:
+        overlay_patch = {
+            field: value for field, value in patch.items()
+            if field in OVERLAY_CHARACTER_FIELDS and field != "color_theme_override"
+        }
+        if "color_theme_override" in patch:
+            override = patch["color_theme_override"]
+            if override:
+                overlay_patch["resolved_colors"], overlay_patch["color_source"] = (override, "character_override")
+            else:
+                theme = await overlay_campaign_theme(uuid.UUID(campaign_id))
+                overlay_patch["resolved_colors"], overlay_patch["color_source"] = (theme.colors, theme.source)
+        if len(overlay_patch) > 1:
+            overlay_patches.append(overlay_patch)
+
+    if not overlay_patches:
+        return None
+    return {"type": "CHARS_UPDATED", "characters": overlay_patches}
+
+
+async def build_overlay_delta(campaign_id: str, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Translate a campaign broadcast message into its overlay-shaped delta
+    Built from the serialized rows the message already carries; the database is only
+    read (in a worker thread) on a theme cache miss, for character names missing from
+    the campaign snapshot, and for the full snapshot re-sent after a theme change
+    Returns None for message types the overlay does not display
+    """
+    message_type = message.get("type")
+
+    if message_type == "ROSTER_UPDATED":
+        return {
+            "type": "ROSTER_UPDATED",
+            "active_roster_ids": message["roster"].get("character_ids", []),
+        }
+
+    if message_type in ("CHAR_CREATED", "CHAR_UPDATED"):
+        character = message["character"]
+        if character["color_theme_override"]:
+            resolved_colors, color_source = (character["color_theme_override"], "character_override")
+        else:
+            theme = await overlay_campaign_theme(uuid.UUID(character["campaign_id"]))
+            resolved_colors, color_source = (theme.colors, theme.source)
+        overlay_character = {
+            field: character[field] for field in OVERLAY_CHARACTER_FIELDS if field != "color_theme_override"
+        }
+        overlay_character["resolved_colors"] = resolved_colors
+        overlay_character["color_source"] = color_source
+        return {"type": message_type, "character": overlay_character}
+
+    if message_type == "CHARS_UPDATED":
+        return await build_overlay_character_patches(campaign_id, message["characters"])
+
+    if message_type == "CHAR_DELETED":
+        return {"type": "CHAR_DELETED", "character_id": message["character_id"]}
+
+    if message_type in ("EVENT", "EVENT_UPDATED"):
+        event = message["event"]
+        character_ids = event["characters_involved"]
+        names_by_id = campaign_snapshots.character_names(campaign_id, character_ids) if character_ids else {}
+        if names_by_id is None:
+            names_by_id = await asyncio.to_thread(load_character_names, character_ids)
+        return {"type": message_type, "event": build_overlay_event(event, names_by_id)}
+
+    if message_type == "EVENT_DELETED":
+        return {"type": "EVENT_DELETED", "event_id": message["event_id"]}
+
+    if message_type == "LAYOUT_THEME_UPDATED":
+        return await asyncio.to_thread(load_overlay_snapshot, uuid.UUID(campaign_id))
+
+    return None
+
+
+def load_overlay_snapshot(campaign_uuid: uuid.UUID) -> Optional[Dict[str, Any]]:
+    """build_overlay_snapshot with its own session (synchronous - run in a worker thread)"""
+    with get_db_context() as db:
+        return build_overlay_snapshot(campaign_uuid, db)
+
+
+# Per-campaign locks: deltas may wait on a worker thread but must reach clients in
+# broadcast order, and never between a new client's snapshot and its registration
+overlay_locks: Dict[str, asyncio.Lock] = {}
+
+# Overlay fan-out tasks started by deliver_to_local_clients (kept so they are not
+# garbage collected mid-flight); they queue on overlay_lock in creation order
+overlay_tasks: Set[asyncio.Task] = set()
+
+
+def overlay_lock(campaign_id: str) -> asyncio.Lock:
+    lock = overlay_locks.get(campaign_id)
+    if lock is None:
+        lock = overlay_locks[campaign_id] = asyncio.Lock()
+    return lock
+
+
+def discard_overlay_lock(campaign_id: str):
+    """Forget a campaign's lock once it is free and no overlay client is connected"""
+    lock = overlay_locks.get(campaign_id)
+    if lock is not None and not lock.locked() and not overlay_connections.has_connections(campaign_id):
+        del overlay_locks[campaign_id]
+
+
+async def broadcast_overlay_delta(campaign_id: str, message: Dict[str, Any]):
+    """Send the overlay-shaped version of a campaign broadcast to overlay clients"""
+    async with overlay_lock(campaign_id):
+        try:
+            delta = await build_overlay_delta(campaign_id, message)
+        except Exception as e:
+            logger.warning("Overlay broadcast failed: %s", e)
+            delta = None
+
+        if delta is not None:
+            overlay_connections.broadcast(campaign_id, delta)
+
+    # The last overlay client may have left while this delta was being built
+    discard_overlay_lock(campaign_id)
+
+
+@app.websocket("/campaigns/{campaign_id}/overlay/ws")
+async def overlay_websocket_endpoint(websocket: WebSocket, campaign_id: str):
+    """
+    WebSocket feed for the live stream overlay (PUBLIC - no auth required)
+    Sends an OVERLAY_SNAPSHOT on connect, then overlay-shaped deltas
+    Same heartbeat as the campaign feed: answer the server's "ping" with "pong"
+    """
+    try:
+        campaign_uuid = uuid.UUID(campaign_id)
+    except ValueError:
+        await websocket.close(code=4000, reason="Invalid campaign ID")
+        return
+
+    campaign_id = str(campaign_uuid)
+
+    if not overlay_connections.has_capacity(campaign_id):
+        await websocket.close(code=1013, reason="Too many connections")
+        return
+
+    # Deltas for this campaign wait until the socket is registered, so none is lost
+    # between loading the snapshot and connect()
+    async with overlay_lock(campaign_id):
+        snapshot = await asyncio.to_thread(load_overlay_snapshot, campaign_uuid)
+
+        if snapshot is None:
+            await websocket.close(code=4004, reason="Campaign not found")
+            return
+
+        await websocket.accept()
+
+        # Checked again with no await before connect(): connections that arrived while
+        # the snapshot was loading all passed the first check
+        if not overlay_connections.has_capacity(campaign_id):
+            await websocket.close(code=1013, reason="Too many connections")
+            return
+
+        # Add to overlay connections; snapshot is written ahead of any delta
+        connection = overlay_connections.connect(campaign_id, websocket, initial_message=snapshot)
+
+    try:
+        # Handle incoming messages: keep-alive pings and snapshot requests
+        while True:
+            data = await websocket.receive_text()
+            connection.touch()
+            if data == PING:
+                connection.send_text(PONG)
+            elif data == "snapshot":
+                async with overlay_lock(campaign_id):
+                    snapshot = await asyncio.to_thread(load_overlay_snapshot, campaign_uuid)
+                    if snapshot is not None:
+                        connection.send_json(snapshot)
+                if snapshot is None:
+                    connection.close(code=4004, reason="Campaign not found")
+                    break
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.warning("Overlay WebSocket error: %s", e)
+    finally:
+        overlay_connections.disconnect(campaign_id, websocket)
+        discard_overlay_lock(campaign_id)
+
+
 # ============================================================================
 # INCLUDE EPISODE & EVENT ROUTERS
 # ============================================================================
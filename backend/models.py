@@ -3,13 +3,12 @@ SQLAlchemy ORM Models for Mythweaver Studio
 Multi-tenant architecture - all entities scoped by campaign
 """
 
-from sqlalchemy import Column, String, Integer, Float, DateTime, Boolean, UUID, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, Float, DateTime, Boolean, UUID, ForeignKey, Text, Index
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY, UUID as PG_UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
-import json
 
 Base = declarative_base()
 
@@ -101,6 +100,8 @@ class Character(Base):
     image_offset_y = Column(Integer, default=0, nullable=False)  # Portrait image vertical offset (-100 to 100)
     background_image_url = Column(String(500), nullable=True)  # Background image URL (public R2 URL)
     background_image_r2_key = Column(String(255), nullable=True)  # R2 storage key for background deletion
+    image_variants = Column(JSONB, nullable=True)  # Resized portrait URLs: {thumbnail, card, full}
+    background_image_variants = Column(JSONB, nullable=True)  # Resized background URLs: {thumbnail, card, full}
 
     # Status & Metadata
     is_active = Column(Boolean, default=True)
@@ -120,28 +121,39 @@ class Character(Base):
     # Relationships
     campaign = relationship("Campaign", back_populates="characters")
 
-    def to_dict(self):
-        return {
-            "id": str(self.id),
-            "campaign_id": str(self.campaign_id),
-            "name": self.name,
-            "slug": self.slug,
-            "class_name": self.class_name,
-            "race": self.race,
-            "player_name": self.player_name,
-            "description": self.description,
-            "backstory": self.backstory,
-            "image_url": self.image_url,
-            "image_offset_x": self.image_offset_x,
-            "image_offset_y": self.image_offset_y,
-            "background_image_url": self.background_image_url,
-            "level": self.level,
-            "is_active": self.is_active,
-            "stats": self.stats or {},
-            "color_theme_override": self.color_theme_override,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    # Keys emitted by to_dict(), in order - each maps to the column of the same name
+    SERIALIZABLE_FIELDS = (
+        "id", "campaign_id", "name", "slug", "class_name", "race", "player_name",
+        "description", "backstory", "image_url", "image_variants", "image_offset_x",
+        "image_offset_y", "background_image_url", "background_image_variants", "level",
+        "is_active", "stats", "color_theme_override", "created_at", "updated_at",
+    )
+
+    # JSONB columns serialized as {} when NULL
+    EMPTY_DICT_FIELDS = ("image_variants", "background_image_variants", "stats")
+
+    @classmethod
+    def columns(cls, fields):
+        """Mapped columns for a list of field names (for load_only)"""
+        return [getattr(cls, field) for field in fields]
+
+    def to_dict(self, fields=None):
+        """
+        Serialize the character
+        `fields` limits the output to those keys; only their columns are read,
+        so it is safe on rows loaded with load_only(*Character.columns(fields))
+        """
+        return {field: self._serialize_field(field) for field in (fields or self.SERIALIZABLE_FIELDS)}
+
+    def _serialize_field(self, field):
+        value = getattr(self, field)
+        if field in ("id", "campaign_id"):
+            return str(value)
+        if field in ("created_at", "updated_at"):
+            return value.isoformat() if value else None
+        if field in self.EMPTY_DICT_FIELDS:
+            return value or {}
+        return value
 
 
 class Episode(Base):
@@ -213,7 +225,7 @@ class Event(Base):
 
     # Categories
     event_type = Column(String(50), nullable=True)  # e.g., "combat", "roleplay", "discovery"
-    characters_involved = Column(Text, nullable=True)  # JSON array of character IDs
+    characters_involved = Column(ARRAY(PG_UUID(as_uuid=True)), nullable=True)  # Character IDs (GIN indexed)
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -223,15 +235,6 @@ class Event(Base):
     episode = relationship("Episode", back_populates="events")
 
     def to_dict(self):
-        # Parse characters_involved JSON string back to array
-        # Handle None, empty string, and JSON string (including "[]")
-        characters_array = []
-        if self.characters_involved is not None:
-            try:
-                characters_array = json.loads(self.characters_involved)
-            except (json.JSONDecodeError, TypeError):
-                characters_array = []
-
         return {
             "id": str(self.id),
             "episode_id": str(self.episode_id),
@@ -239,7 +242,7 @@ class Event(Base):
             "description": self.description,
             "timestamp_in_episode": self.timestamp_in_episode,
             "event_type": self.event_type,
-            "characters_involved": characters_array,
+            "characters_involved": [str(cid) for cid in self.characters_involved or []],
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -390,3 +393,25 @@ class CharacterLayout(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+# Composite/partial indexes matching the hot query shapes (migration 012)
+Index("ix_characters_campaign_id_is_active", Character.campaign_id, Character.is_active)
+Index("ix_characters_campaign_id_slug", Character.campaign_id, Character.slug)
+Index(
+    "ix_episodes_published_order",
+    Episode.campaign_id, Episode.is_published, Episode.season.desc(), Episode.episode_number,
+)
+Index("ix_episodes_campaign_id_slug", Episode.campaign_id, Episode.slug)
+Index(
+    "ix_episodes_published_created_at",
+    Episode.campaign_id, Episode.created_at.desc(),
+    postgresql_where=Episode.is_published == True,
+)
+Index("ix_events_episode_id_timestamp", Event.episode_id, Event.timestamp_in_episode)
+Index("ix_events_characters_involved", Event.characters_involved, postgresql_using="gin")  # migration 013
+Index(
+    "ix_character_layouts_default",
+    CharacterLayout.campaign_id,
+    postgresql_where=CharacterLayout.is_default == True,
+)
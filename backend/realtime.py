@@ -0,0 +1,276 @@
+"""
+Real-time WebSocket connection management
+Per-connection bounded send queues so one slow client never stalls a broadcast,
+a server-driven heartbeat that reaps silent (half-open) sockets, and a per-campaign
+connection cap
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from fastapi import WebSocket
+
+from settings import settings
+
+
+# Slow-consumer policies (applied when a connection's send queue is full)
+DROP_OLDEST = "drop_oldest"    # Discard the oldest queued message to make room
+DROP_NEWEST = "drop_newest"    # Discard the message being broadcast
+DISCONNECT = "disconnect"      # Close the connection
+
+# Heartbeat: the server sends PING every WS_PING_INTERVAL; clients answer PONG.
+# Any message from the client counts as proof of life.
+PING = "ping"
+PONG = "pong"
+
+
+def encode_message(message: Dict[str, Any]) -> str:
+    """Serialize a message once (same encoding as WebSocket.send_json)"""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class ClientConnection:
+    """
+    A single WebSocket client with its own bounded outbound queue
+    All sends go through the queue and are written by one writer task,
+    so the socket is never written to concurrently. Initial frames (bootstrap,
+    resume replay) are written first and are never subject to the slow-consumer policy
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_close: Callable[["ClientConnection"], None],
+        max_queue: int,
+        send_timeout: float,
+        policy: str,
+        full_objects: bool = False,
+        initial_texts: Iterable[str] = (),
+    ):
+        self.websocket = websocket
+        # Wants full objects instead of field-level patches (see broadcast_text)
+        self.full_objects = full_objects
+        self.on_close = on_close
+        self.send_timeout = send_timeout
+        self.policy = policy
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.closed = False
+        self.last_seen = time.monotonic()
+        self.initial_texts = list(initial_texts)
+        self.writer_task = asyncio.create_task(self._writer())
+
+    def touch(self):
+        """Record that the client is alive (call on every received message)"""
+        self.last_seen = time.monotonic()
+
+    def send_text(self, text: str) -> bool:
+        """
+        Queue a pre-serialized message without waiting
+        Returns False if the message was dropped or the connection was closed
+        """
+        if self.closed:
+            return False
+
+        if self.queue.full():
+            if self.policy == DISCONNECT:
+                self.close()
+                return False
+            if self.policy == DROP_NEWEST:
+                self.dropped += 1
+                return False
+            # DROP_OLDEST: make room for the newest message
+            self.queue.get_nowait()
+            self.dropped += 1
+
+        self.queue.put_nowait(text)
+        return True
+
+    def send_json(self, message: Dict[str, Any]) -> bool:
+        """Queue a message that has not been serialized yet"""
+        return self.send_text(encode_message(message))
+
+    async def _writer(self):
+        """Drain the queue to the socket; a failed or timed-out send closes the connection"""
+        try:
+            initial_texts, self.initial_texts = self.initial_texts, []
+            for text in initial_texts:
+                await asyncio.wait_for(self.websocket.send_text(text), timeout=self.send_timeout)
+            while True:
+                text = await self.queue.get()
+                await asyncio.wait_for(self.websocket.send_text(text), timeout=self.send_timeout)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            self.close()
+
+    def close(self, code: int = 1013, reason: str = "Slow consumer"):
+        """Stop the writer, close the socket (best effort) and unregister"""
+        if self.closed:
+            return
+        self.closed = True
+
+        if self.writer_task is not asyncio.current_task():
+            self.writer_task.cancel()
+
+        async def _close_socket():
+            try:
+                await asyncio.wait_for(self.websocket.close(code=code, reason=reason), timeout=self.send_timeout)
+            except Exception:
+                pass
+
+        asyncio.create_task(_close_socket())
+        self.on_close(self)
+
+
+class ConnectionManager:
+    """Tracks WebSocket clients per campaign and fans messages out to their queues"""
+
+    def __init__(
+        self,
+        max_queue: Optional[int] = None,
+        send_timeout: Optional[float] = None,
+        policy: Optional[str] = None,
+        ping_interval: Optional[float] = None,
+        idle_timeout: Optional[float] = None,
+        max_per_campaign: Optional[int] = None,
+    ):
+        self.max_queue = max_queue or settings.WS_SEND_QUEUE_SIZE
+        self.send_timeout = send_timeout or settings.WS_SEND_TIMEOUT
+        self.policy = policy or settings.WS_SLOW_CONSUMER_POLICY
+        self.ping_interval = ping_interval or settings.WS_PING_INTERVAL
+        self.idle_timeout = idle_timeout or settings.WS_IDLE_TIMEOUT
+        self.max_per_campaign = max_per_campaign or settings.WS_MAX_CONNECTIONS_PER_CAMPAIGN
+        self.connections: Dict[str, Dict[WebSocket, ClientConnection]] = {}
+        self.heartbeat_task: Optional[asyncio.Task] = None
+        self.reaped = 0  # Connections closed for missing heartbeats
+        self.rejected = 0  # Connections refused by the per-campaign cap
+
+    def connect(
+        self,
+        campaign_id: str,
+        websocket: WebSocket,
+        initial_message: Optional[Dict[str, Any]] = None,
+        initial_texts: Iterable[str] = (),
+        full_objects: bool = False,
+    ) -> ClientConnection:
+        """
+        Register an accepted WebSocket and start its writer task
+        The optional initial message (or pre-serialized texts) is written before any
+        broadcast reaches the client and is never dropped by the slow-consumer policy
+        """
+        if initial_message is not None:
+            initial_texts = [encode_message(initial_message), *initial_texts]
+        connection = ClientConnection(
+            websocket,
+            on_close=lambda conn: self._remove(campaign_id, conn),
+            max_queue=self.max_queue,
+            send_timeout=self.send_timeout,
+            policy=self.policy,
+            full_objects=full_objects,
+            initial_texts=initial_texts,
+        )
+        self.connections.setdefault(campaign_id, {})[websocket] = connection
+        return connection
+
+    def disconnect(self, campaign_id: str, websocket: WebSocket):
+        """Unregister a WebSocket (e.g. after WebSocketDisconnect)"""
+        connection = self.connections.get(campaign_id, {}).get(websocket)
+        if connection:
+            connection.closed = True
+            connection.writer_task.cancel()
+            self._remove(campaign_id, connection)
+
+    def _remove(self, campaign_id: str, connection: ClientConnection):
+        campaign_sockets = self.connections.get(campaign_id)
+        if not campaign_sockets:
+            return
+        campaign_sockets.pop(connection.websocket, None)
+        if not campaign_sockets:
+            del self.connections[campaign_id]
+
+    def has_connections(self, campaign_id: str) -> bool:
+        return bool(self.connections.get(campaign_id))
+
+    def has_full_object_clients(self, campaign_id: str) -> bool:
+        return any(conn.full_objects for conn in self.connections.get(campaign_id, {}).values())
+
+    def has_capacity(self, campaign_id: str) -> bool:
+        """Whether another client may join the campaign (counts refusals)"""
+        if len(self.connections.get(campaign_id, {})) < self.max_per_campaign:
+            return True
+        self.rejected += 1
+        return False
+
+    def start_heartbeat(self):
+        """Start the ping/reap loop (needs a running event loop)"""
+        if self.heartbeat_task is None:
+            self.heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    def stop_heartbeat(self):
+        if self.heartbeat_task is not None:
+            self.heartbeat_task.cancel()
+            self.heartbeat_task = None
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            self.sweep()
+
+    def sweep(self) -> int:
+        """
+        Close connections silent for longer than idle_timeout and ping the rest
+        Returns the number of connections reaped
+        """
+        now = time.monotonic()
+        reaped = 0
+        for campaign_sockets in list(self.connections.values()):
+            for connection in list(campaign_sockets.values()):
+                if now - connection.last_seen > self.idle_timeout:
+                    connection.close(code=1001, reason="Idle timeout")
+                    reaped += 1
+                else:
+                    connection.send_text(PING)
+        self.reaped += reaped
+        return reaped
+
+    def stats(self) -> Dict[str, Any]:
+        """Live connection counts (for /metrics)"""
+        by_campaign = {campaign_id: len(sockets) for campaign_id, sockets in self.connections.items()}
+        return {
+            "connections": sum(by_campaign.values()),
+            "campaigns": len(by_campaign),
+            "by_campaign": by_campaign,
+            "max_per_campaign": self.max_per_campaign,
+            "ping_interval": self.ping_interval,
+            "idle_timeout": self.idle_timeout,
+            "reaped": self.reaped,
+            "rejected": self.rejected,
+        }
+
+    def broadcast(self, campaign_id: str, message: Dict[str, Any]) -> int:
+        """
+        Serialize a message once and queue it on every connection of a campaign
+        Never waits on a socket; returns the number of connections it was queued for
+        """
+        if not self.connections.get(campaign_id):
+            return 0
+        return self.broadcast_text(campaign_id, encode_message(message))
+
+    def broadcast_text(self, campaign_id: str, text: str, full_text: Optional[str] = None) -> int:
+        """
+        Queue an already serialized message on every connection of a campaign
+        Connections that opted into full objects get `full_text` instead, if given
+        """
+        campaign_sockets = self.connections.get(campaign_id)
+        if not campaign_sockets:
+            return 0
+
+        delivered = 0
+        # Copy: a DISCONNECT policy may remove connections while iterating
+        for connection in list(campaign_sockets.values()):
+            if connection.send_text(full_text if full_text is not None and connection.full_objects else text):
+                delivered += 1
+        return delivered
@@ -0,0 +1,35 @@
+"""
+Fast JSON responses for read-heavy endpoints
+Encodes with orjson, which handles UUIDs, datetimes and JSONB values (dicts/lists)
+natively. Endpoints opt in by returning FastJSONResponse(content) directly,
+which skips FastAPI's jsonable_encoder pass and the stdlib json module.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(value: Any) -> Any:
+    """Fallback for types orjson doesn't encode natively"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes"""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,16 +1,37 @@
 """
 S3/R2 Client for image uploads
-Handles file uploads to Cloudflare R2
+Handles file uploads to Cloudflare R2 (or any S3-compatible endpoint),
+with a filesystem backend for local development and tests.
+
+One shared client (`storage_client`) is created per process; it keeps a
+pooled HTTP connection set and exposes non-blocking async methods that run
+the blocking boto3 calls on a dedicated worker pool.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from settings import settings
+
 
 class S3Client:
     """Client for uploading images to Cloudflare R2"""
 
-    def __init__(self, account_id: str, access_key_id: str, secret_access_key: str, bucket_name: str, public_url: str = None):
+    def __init__(
+        self,
+        account_id: str,
+        access_key_id: str,
+        secret_access_key: str,
+        bucket_name: str,
+        public_url: str = None,
+        endpoint_url: str = None,
+        max_pool_connections: int = 10,
+    ):
         """
         Initialize R2 client
 
@@ -20,23 +41,44 @@ class S3Client:
             secret_access_key: R2 API Token Secret Access Key
             bucket_name: R2 Bucket name
             public_url: Public base URL for accessing uploaded files (e.g., https://pub-xxx.r2.dev)
+            endpoint_url: S3 endpoint override (e.g., a local S3-compatible server); defaults to R2
+            max_pool_connections: Size of the HTTP connection pool and upload worker pool
         """
         self.bucket_name = bucket_name
         self.account_id = account_id
         self.public_url = public_url
+        self.endpoint_url = endpoint_url or f'https://{account_id}.r2.cloudflarestorage.com'
 
-        # Create S3 client configured for R2
+        # Create S3 client configured for R2 (boto3 clients are thread-safe and share the pool)
         self.client = boto3.client(
             's3',
-            endpoint_url=f'https://{account_id}.r2.cloudflarestorage.com',
+            endpoint_url=self.endpoint_url,
             aws_access_key_id=access_key_id,
             aws_secret_access_key=secret_access_key,
-            region_name='auto'
+            region_name='auto',
+            config=Config(
+                max_pool_connections=max_pool_connections,
+                retries={"max_attempts": 3, "mode": "standard"},
+            ),
         )
 
+        # Blocking boto3 calls run here, never on the event loop
+        self._executor = ThreadPoolExecutor(max_workers=max_pool_connections, thread_name_prefix="storage")
+
+    def get_public_url(self, key: str) -> str:
+        """Public URL for an object key"""
+        if self.public_url:
+            # Use public development URL if provided
+            return f"{self.public_url}/{key}"
+        if self.endpoint_url != f'https://{self.account_id}.r2.cloudflarestorage.com':
+            # Custom S3-compatible endpoint: path-style URL
+            return f"{self.endpoint_url}/{self.bucket_name}/{key}"
+        # Fallback to private endpoint URL
+        return f"https://{self.bucket_name}.{self.account_id}.r2.cloudflarestorage.com/{key}"
+
     def upload_image(self, key: str, file_content: bytes, content_type: str) -> str:
         """
-        Upload image to R2
+        Upload image to R2 (blocking - use upload_image_async from async code)
 
         Args:
             key: S3 key (path in bucket) e.g. "campaign-slug/portraits/char-id.webp"
@@ -56,22 +98,14 @@ class S3Client:
                 Body=file_content,
                 ContentType=content_type,
             )
-
-            # Return public URL
-            if self.public_url:
-                # Use public development URL if provided
-                url = f"{self.public_url}/{key}"
-            else:
-                # Fallback to private endpoint URL
-                url = f"https://{self.bucket_name}.{self.account_id}.r2.cloudflarestorage.com/{key}"
-            return url
+            return self.get_public_url(key)
 
         except ClientError as e:
             raise Exception(f"Failed to upload image to R2: {str(e)}")
 
     def delete_image(self, key: str) -> bool:
         """
-        Delete image from R2
+        Delete image from R2 (blocking - use delete_image_async from async code)
 
         Args:
             key: S3 key (path in bucket)
@@ -87,3 +121,83 @@ class S3Client:
             return True
         except ClientError as e:
             raise Exception(f"Failed to delete image from R2: {str(e)}")
+
+    async def upload_image_async(self, key: str, file_content: bytes, content_type: str) -> str:
+        """Non-blocking upload_image"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.upload_image, key, file_content, content_type)
+
+    async def delete_image_async(self, key: str) -> bool:
+        """Non-blocking delete_image"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.delete_image, key)
+
+
+class FilesystemStorageClient:
+    """
+    Stores images on local disk with the same interface as S3Client
+    Used for local development and tests (served by main.py under /uploads)
+    """
+
+    def __init__(self, root_dir: str, public_url: str):
+        """
+        Args:
+            root_dir: Directory that holds uploaded files
+            public_url: Base URL the directory is served from
+        """
+        self.root_dir = os.path.abspath(root_dir)
+        self.public_url = public_url.rstrip("/")
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root_dir, key))
+        if not path.startswith(self.root_dir + os.sep):
+            raise Exception(f"Invalid storage key: {key}")
+        return path
+
+    def get_public_url(self, key: str) -> str:
+        return f"{self.public_url}/{key}"
+
+    def upload_image(self, key: str, file_content: bytes, content_type: str) -> str:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(file_content)
+        return self.get_public_url(key)
+
+    def delete_image(self, key: str) -> bool:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+        return True
+
+    async def upload_image_async(self, key: str, file_content: bytes, content_type: str) -> str:
+        return await asyncio.to_thread(self.upload_image, key, file_content, content_type)
+
+    async def delete_image_async(self, key: str) -> bool:
+        return await asyncio.to_thread(self.delete_image, key)
+
+
+def create_storage_client():
+    """Build the storage client selected by settings.STORAGE_BACKEND"""
+    if settings.STORAGE_BACKEND == "filesystem":
+        return FilesystemStorageClient(
+            root_dir=settings.STORAGE_LOCAL_DIR,
+            public_url=settings.STORAGE_LOCAL_PUBLIC_URL or f"{settings.BACKEND_BASE_URL}/uploads",
+        )
+    if settings.STORAGE_BACKEND == "r2":
+        return S3Client(
+            account_id=settings.R2_ACCOUNT_ID,
+            access_key_id=settings.R2_ACCESS_KEY_ID,
+            secret_access_key=settings.R2_SECRET_ACCESS_KEY,
+            bucket_name=settings.R2_BUCKET_NAME,
+            public_url=settings.R2_PUBLIC_URL,
+            endpoint_url=settings.R2_ENDPOINT_URL or None,
+            max_pool_connections=settings.STORAGE_MAX_POOL_CONNECTIONS,
+        )
+    raise ValueError(f"Unknown STORAGE_BACKEND: {settings.STORAGE_BACKEND}")
+
+
+# Shared client for the whole process
+storage_client = create_storage_client()
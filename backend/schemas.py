@@ -136,6 +136,18 @@ class CharacterUpdateRequest(BaseModel):
         }
 
 
+class CharacterStatsBatchItem(BaseModel):
+    """Stat changes for one character in a batch update"""
+    character_id: str
+    stats: Dict[str, Optional[int]] = Field(default_factory=dict, description="Values to set; null removes the stat")
+    deltas: Dict[str, int] = Field(default_factory=dict, description="Amounts to add to the current values")
+
+
+class CharacterStatsBatchRequest(BaseModel):
+    """Stat changes for several characters, applied in one transaction"""
+    updates: List[CharacterStatsBatchItem] = Field(..., min_length=1)
+
+
 class CharacterResponse(BaseModel):
     """Character response with all fields"""
     id: str
@@ -6,6 +6,12 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = ""
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a connection before failing
+    DB_POOL_RECYCLE: int = 240  # Seconds; below Neon's 5 minute idle timeout (-1 disables)
+    DB_POOL_PRE_PING: bool = True  # Round trip per checkout to detect dead connections
+    DB_PGBOUNCER_MODE: bool = False  # Behind pgbouncer: no pre-ping, pgbouncer owns server connection health
 
     # Neon API (for future use)
     NEON_API_KEY: str = ""
@@ -18,17 +24,64 @@ class Settings(BaseSettings):
     CORS_ORIGINS: str = "http://localhost:3000,http://127.0.0.1:3000,http://localhost:3001,http://127.0.0.1:3001"
 
     # WebSocket
-    WS_PING_INTERVAL: int = 25
+    WS_PING_INTERVAL: int = 25  # Seconds between server pings
+    WS_IDLE_TIMEOUT: int = 60  # Close connections that sent nothing (not even a pong) for this long
+    WS_MAX_CONNECTIONS_PER_CAMPAIGN: int = 500  # Per campaign and per feed, in each process
+    WS_SEND_QUEUE_SIZE: int = 100  # Max queued outbound messages per connection
+    WS_SEND_TIMEOUT: float = 10.0  # Seconds a single send may take before the client is dropped
+    WS_SLOW_CONSUMER_POLICY: str = "drop_oldest"  # "drop_oldest", "drop_newest" or "disconnect"
+    WS_SNAPSHOT_TTL: int = 300  # Seconds before a cached BOOTSTRAP snapshot is reloaded from the database
+    WS_REPLAY_BUFFER: int = 500  # Recent messages kept per campaign for "deltas since N" resume
+    WS_COALESCE_WINDOW_MS: int = 100  # Character changes within this window go out as one CHARS_UPDATED (0 = no delay)
+
+    # Broadcast backend: "memory" (single process) or "postgres" (LISTEN/NOTIFY across workers/machines)
+    BROADCAST_BACKEND: str = "memory"
+    BROADCAST_CHANNEL: str = "campaign_broadcast"
 
     # Authentication - Global admin token for creating campaigns
     ADMIN_TOKEN: str = "change_me_in_production"
 
+    # Password hashing (bcrypt)
+    PASSWORD_HASH_ROUNDS: int = 12  # Raising this rehashes passwords on next login
+    PASSWORD_HASH_WORKERS: int = 2  # Dedicated hashing threads
+    PASSWORD_HASH_MAX_PENDING: int = 16  # Queued + running operations before rejecting with 503
+
+    # Admin token verification cache (campaign_id, token) -> campaign identity
+    TOKEN_CACHE_TTL: int = 60  # Seconds
+    TOKEN_CACHE_MAXSIZE: int = 1024
+
+    # Public slug -> campaign lookups (per process)
+    CAMPAIGN_SLUG_CACHE_TTL: int = 60  # Seconds
+    CAMPAIGN_SLUG_CACHE_MAXSIZE: int = 1024
+
+    # Resolved campaign color theme snapshots (refreshed on default layout changes)
+    THEME_CACHE_TTL: int = 300  # Seconds
+    THEME_CACHE_MAXSIZE: int = 1024
+
     # Cloudflare R2 - Image storage
     R2_ACCOUNT_ID: str = ""
     R2_ACCESS_KEY_ID: str = ""
     R2_SECRET_ACCESS_KEY: str = ""
     R2_BUCKET_NAME: str = "critical-role-companion-images"
     R2_PUBLIC_URL: str = "https://pub-855f8edfc401414b8f96c13867dff69d.r2.dev"
+    R2_ENDPOINT_URL: str = ""  # Override for a local S3-compatible server (defaults to R2)
+
+    # Image storage backend: "r2" (S3-compatible) or "filesystem" (local dev/tests)
+    STORAGE_BACKEND: str = "r2"
+    STORAGE_MAX_POOL_CONNECTIONS: int = 10
+    STORAGE_LOCAL_DIR: str = "uploads"
+    STORAGE_LOCAL_PUBLIC_URL: str = ""  # Defaults to {BACKEND_BASE_URL}/uploads
+
+    # Uploaded images are re-encoded as WebP variants (thumbnail, card, full)
+    IMAGE_WEBP_QUALITY: int = 82
+
+    # HTTP caching for public campaign pages (seconds)
+    PUBLIC_CACHE_MAX_AGE: int = 30
+    PUBLIC_CACHE_STALE_WHILE_REVALIDATE: int = 60
+
+    # Logging (JSON lines on stdout)
+    LOG_LEVEL: str = "INFO"
+    LOG_DEBUG_ROUTES: str = ""  # Comma-separated handler names (or "*") whose request payloads are dumped at DEBUG
 
     class Config:
         env_file = ".env"
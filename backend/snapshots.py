@@ -0,0 +1,237 @@
+"""
+Per-campaign BOOTSTRAP snapshots for the campaign WebSocket
+The snapshot (campaign, characters, roster) is loaded once, kept current by folding
+in every broadcast message, and serialized once per change - so a burst of viewers
+connecting at stream start costs one set of queries, not one per socket.
+Every message gets a sequence number, and a window of recent serialized messages is
+kept so a reconnecting client can resume with "deltas since N" instead of a bootstrap.
+A stream is forgotten once its campaign has had no clients for WS_SNAPSHOT_TTL.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from realtime import encode_message
+from settings import settings
+
+
+# Loads {"campaign": ..., "characters": [...], "roster": ...}, or None if the campaign
+# does not exist. Synchronous - runs in a worker thread.
+SnapshotLoader = Callable[[str], Optional[Dict[str, Any]]]
+
+# Whether a campaign still has connected clients (ConnectionManager.has_connections)
+InUseCheck = Callable[[str], bool]
+
+
+class CampaignStream:
+    """Snapshot, sequence counter and replay window for one campaign"""
+
+    def __init__(self, replay_size: int):
+        # Sequence numbers are only comparable within one epoch (one process, one stream)
+        self.epoch = uuid.uuid4().hex
+        self.seq = 0
+        self.replay: Deque[Tuple[int, str]] = deque(maxlen=replay_size)
+
+        self.campaign: Optional[Dict[str, Any]] = None
+        self.characters: Dict[str, Dict[str, Any]] = {}
+        self.roster: Optional[Dict[str, Any]] = None
+        self.loaded_at: Optional[float] = None  # None until loaded, or after invalidation
+        self.generation = 0  # Bumped by invalidate() so an in-flight load is not trusted as fresh
+        self.loading: Optional[asyncio.Future] = None
+        self.pending: List[Dict[str, Any]] = []  # Messages seen while a load was in flight
+        self.expiry: Optional[asyncio.TimerHandle] = None  # Set while the campaign has no clients
+
+        self._bootstrap: Optional[Tuple[int, str]] = None  # (seq, serialized BOOTSTRAP)
+
+    def apply(self, message: Dict[str, Any]):
+        """Fold a broadcast message into the snapshot"""
+        if self.loading is not None:
+            # Re-applied once the load finishes (the load may predate this change)
+            self.pending.append(message)
+        if self.loaded_at is None and self.campaign is None:
+            return
+
+        message_type = message.get("type")
+        if message_type in ("CHAR_CREATED", "CHAR_UPDATED"):
+            character = message["character"]
+            self.characters[character["id"]] = character
+        elif message_type == "CHARS_UPDATED":
+            # Patches carry only the changed fields
+            for patch in message["characters"]:
+                character = self.characters.get(patch["id"])
+                if character is not None:
+                    self.characters[patch["id"]] = {**character, **patch}
+        elif message_type == "CHAR_DELETED":
+            self.characters.pop(message["character_id"], None)
+        elif message_type == "ROSTER_UPDATED":
+            self.roster = message["roster"]
+
+    def bootstrap_text(self) -> str:
+        """Serialized BOOTSTRAP for the current sequence number (encoded once per change)"""
+        if self._bootstrap is None or self._bootstrap[0] != self.seq:
+            self._bootstrap = (self.seq, encode_message({
+                "type": "BOOTSTRAP",
+                "seq": self.seq,
+                "epoch": self.epoch,
+                "campaign": self.campaign,
+                "characters": list(self.characters.values()),
+                "roster": self.roster,
+            }))
+        return self._bootstrap[1]
+
+    def replay_since(self, since: int) -> Optional[List[str]]:
+        """Serialized messages after `since`, or None if they are not all still buffered"""
+        if since > self.seq:
+            return None
+        if since == self.seq:
+            return []
+        if not self.replay or self.replay[0][0] > since + 1:
+            return None
+        return [text for seq, text in self.replay if seq > since]
+
+
+class SnapshotStore:
+    """Campaign streams, created on first connect and fed by every local broadcast"""
+
+    def __init__(
+        self,
+        loader: SnapshotLoader,
+        ttl: Optional[int] = None,
+        replay_size: Optional[int] = None,
+        in_use: Optional[InUseCheck] = None,
+    ):
+        self.loader = loader
+        # Safety net: reload from the database periodically even if every change was seen;
+        # also how long a stream outlives its campaign's last client
+        self.ttl = ttl if ttl is not None else settings.WS_SNAPSHOT_TTL
+        self.replay_size = replay_size or settings.WS_REPLAY_BUFFER
+        self.in_use = in_use or (lambda campaign_id: False)
+        self.streams: Dict[str, CampaignStream] = {}
+        self.loads = 0
+        self.expired = 0
+
+    def record(self, campaign_id: str, message: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Assign the next sequence number and fold the message into the snapshot
+        Returns (message with "seq", serialized message); campaigns nobody has
+        connected to are not tracked and get (message, None)
+        """
+        stream = self.streams.get(campaign_id)
+        if stream is None:
+            return message, None
+
+        stream.seq += 1
+        message = {**message, "seq": stream.seq}
+        text = encode_message(message)
+        stream.replay.append((stream.seq, text))
+        stream.apply(message)
+        return message, text
+
+    def expand(self, campaign_id: str, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        A recorded CHARS_UPDATED with each patch replaced by the full character from the
+        snapshot (for clients that want full objects); None if a character is not known
+        """
+        stream = self.streams.get(campaign_id)
+        if stream is None:
+            return None
+        characters = [stream.characters.get(patch["id"]) for patch in message["characters"]]
+        if any(character is None for character in characters):
+            return None
+        return {**message, "characters": characters}
+
+    def character_names(self, campaign_id: str, character_ids: List[str]) -> Optional[Dict[str, str]]:
+        """Names of the given characters from the snapshot; None if any of them is not known"""
+        stream = self.streams.get(campaign_id)
+        if stream is None or stream.campaign is None:
+            return None
+        characters = [stream.characters.get(character_id) for character_id in character_ids]
+        if any(character is None for character in characters):
+            return None
+        return {character["id"]: character["name"] for character in characters}
+
+    def invalidate(self, campaign_id: str):
+        """Reload the snapshot on the next connect (sequence and replay window are kept)"""
+        stream = self.streams.get(campaign_id)
+        if stream is not None:
+            stream.generation += 1
+            stream.loaded_at = None
+
+    def discard(self, campaign_id: str):
+        """Forget a campaign entirely (e.g. after it is deleted)"""
+        stream = self.streams.pop(campaign_id, None)
+        if stream is not None and stream.expiry is not None:
+            stream.expiry.cancel()
+
+    def release(self, campaign_id: str):
+        """
+        Call when a campaign's last client disconnects: its stream (snapshot and replay
+        window) is forgotten after `ttl` unless a client connects again - long enough
+        for reconnecting clients to resume
+        """
+        stream = self.streams.get(campaign_id)
+        if stream is not None and stream.expiry is None:
+            stream.expiry = asyncio.get_running_loop().call_later(self.ttl, self._expire, campaign_id, stream)
+
+    def _expire(self, campaign_id: str, stream: CampaignStream):
+        stream.expiry = None
+        if self.streams.get(campaign_id) is not stream or stream.loading is not None or self.in_use(campaign_id):
+            return
+        del self.streams[campaign_id]
+        self.expired += 1
+
+    async def get(self, campaign_id: str) -> Optional[CampaignStream]:
+        """Stream with a loaded, fresh snapshot, or None if the campaign does not exist"""
+        stream = self.streams.get(campaign_id)
+        if stream is None:
+            stream = self.streams[campaign_id] = CampaignStream(self.replay_size)
+        elif stream.expiry is not None:
+            stream.expiry.cancel()
+            stream.expiry = None
+
+        if stream.loaded_at is not None and time.monotonic() - stream.loaded_at < self.ttl:
+            return stream
+
+        # Concurrent connects share one load
+        if stream.loading is None:
+            stream.loading = asyncio.ensure_future(self._load(campaign_id, stream))
+        # Shielded: one client disconnecting mid-load must not cancel it for the others
+        found = await asyncio.shield(stream.loading)
+        return stream if found else None
+
+    async def _load(self, campaign_id: str, stream: CampaignStream) -> bool:
+        generation = stream.generation
+        try:
+            snapshot = await asyncio.to_thread(self.loader, campaign_id)
+        except BaseException:
+            stream.pending = []
+            raise
+        finally:
+            stream.loading = None
+
+        pending, stream.pending = stream.pending, []
+        if snapshot is None:
+            if self.streams.get(campaign_id) is stream:
+                del self.streams[campaign_id]
+            return False
+
+        stream.campaign = snapshot["campaign"]
+        stream.characters = {c["id"]: c for c in snapshot["characters"]}
+        stream.roster = snapshot["roster"]
+        stream.loaded_at = time.monotonic() if stream.generation == generation else None
+        stream._bootstrap = None
+        for message in pending:
+            stream.apply(message)
+
+        self.loads += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "streams": len(self.streams),
+            "loads": self.loads,
+            "expired": self.expired,
+        }
@@ -0,0 +1,114 @@
+"""
+Test character event lookup (GET /campaigns/{id}/characters/{cid}/events)
+
+Tests:
+1. Events store characters_involved as a list of UUID strings
+2. Only events involving the character are returned, in timeline order
+3. Events in unpublished episodes are excluded
+4. Invalid character IDs in characters_involved return 400
+"""
+import random
+import string
+import uuid
+
+import requests
+
+BASE_URL = "http://localhost:8001"
+
+
+def test_character_events():
+    print("\n" + "="*70)
+    print("TESTING CHARACTER EVENT LOOKUP")
+    print("="*70)
+
+    # Setup: Create test data
+    print("\n[Setup] Creating test user, campaign, characters, and episodes...")
+    rand_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    email = f"charevents{rand_str}@example.com"
+
+    signup = requests.post(f'{BASE_URL}/auth/signup', json={'email': email, 'password': 'testpass123'})
+    user_id = signup.json()['id']
+
+    campaign = requests.post(
+        f'{BASE_URL}/campaigns',
+        json={'slug': f'charevents-{rand_str}', 'name': 'Character Events Campaign'},
+        headers={'Authorization': user_id}
+    )
+    campaign_id = campaign.json()['id']
+    admin_token = campaign.json()['admin_token']
+
+    hero_id, rogue_id = [
+        requests.post(
+            f'{BASE_URL}/campaigns/{campaign_id}/characters',
+            json={'name': name},
+            headers={'X-Token': admin_token}
+        ).json()['id']
+        for name in ('Event Hero', 'Event Rogue')
+    ]
+
+    published, draft = [
+        requests.post(
+            f'{BASE_URL}/campaigns/{campaign_id}/episodes',
+            json={'name': name, 'slug': name.lower(), 'season': 1, 'episode_number': number, 'is_published': is_published},
+            headers={'X-Token': admin_token}
+        ).json()['id']
+        for name, number, is_published in (('Published', 1, True), ('Draft', 2, False))
+    ]
+    print(f"[OK] Campaign created: {campaign_id}")
+
+    def create_event(episode_id, name, timestamp, characters):
+        return requests.post(
+            f'{BASE_URL}/episodes/{episode_id}/events',
+            json={'name': name, 'timestamp_in_episode': timestamp, 'characters_involved': characters},
+            headers={'X-Token': admin_token}
+        )
+
+    # Test 1: Round trip
+    print("\n[1] Creating events...")
+    late = create_event(published, 'Both fight', 600, [hero_id, rogue_id])
+    create_event(published, 'Rogue sneaks', 300, [rogue_id])
+    create_event(published, 'Hero arrives', 60, [hero_id])
+    create_event(draft, 'Unaired scene', 30, [hero_id])
+    if late.status_code != 201 or late.json()['characters_involved'] != [hero_id, rogue_id]:
+        print(f"[FAIL] Unexpected event: {late.status_code} {late.text}")
+        return False
+    print(f"[OK] characters_involved: {late.json()['characters_involved']}")
+
+    # Test 2 & 3: Lookup
+    print("\n[2] Listing events for the hero...")
+    response = requests.get(f'{BASE_URL}/campaigns/{campaign_id}/characters/{hero_id}/events')
+    names = [e['name'] for e in response.json()]
+    if response.status_code != 200 or names != ['Hero arrives', 'Both fight']:
+        print(f"[FAIL] Unexpected events: {response.status_code} {names}")
+        return False
+    print(f"[OK] Events: {names} (draft episode excluded)")
+
+    missing = requests.get(f'{BASE_URL}/campaigns/{campaign_id}/characters/{uuid.uuid4()}/events')
+    if missing.status_code != 404:
+        print(f"[FAIL] Expected 404 for unknown character, got {missing.status_code}")
+        return False
+    print("[OK] 404 for unknown character")
+
+    # Test 4: Invalid IDs
+    print("\n[4] Creating an event with an invalid character ID...")
+    bad = create_event(published, 'Bad IDs', 900, ['not-a-uuid'])
+    if bad.status_code != 400:
+        print(f"[FAIL] Expected 400, got {bad.status_code}")
+        return False
+    print(f"[OK] 400: {bad.json()['detail']}")
+
+    print("\n" + "="*70)
+    print("ALL CHARACTER EVENT TESTS PASSED")
+    print("="*70)
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = test_character_events()
+        exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n[ERROR] Test failed with exception: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
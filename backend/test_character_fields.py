@@ -0,0 +1,93 @@
+"""
+Test column-projected character list endpoints (?fields=)
+
+Tests:
+1. Without fields, the full character shape is returned
+2. fields=name,slug returns only id, name and slug
+3. The public list honours fields the same way
+4. Unknown fields return 400
+"""
+import random
+import string
+
+import requests
+
+BASE_URL = "http://localhost:8001"
+
+
+def test_character_fields():
+    print("\n" + "="*70)
+    print("TESTING CHARACTER FIELD PROJECTION")
+    print("="*70)
+
+    # Setup: Create test data
+    print("\n[Setup] Creating test user, campaign, and character...")
+    rand_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    email = f"fieldstest{rand_str}@example.com"
+    slug = f'fieldstest-{rand_str}'
+
+    signup = requests.post(f'{BASE_URL}/auth/signup', json={'email': email, 'password': 'testpass123'})
+    user_id = signup.json()['id']
+
+    campaign = requests.post(
+        f'{BASE_URL}/campaigns',
+        json={'slug': slug, 'name': 'Fields Test Campaign'},
+        headers={'Authorization': user_id}
+    )
+    campaign_id = campaign.json()['id']
+    admin_token = campaign.json()['admin_token']
+
+    requests.post(
+        f'{BASE_URL}/campaigns/{campaign_id}/characters',
+        json={'name': 'Projected Hero', 'description': 'Long text', 'backstory': 'Longer text'},
+        headers={'X-Token': admin_token}
+    )
+    print(f"[OK] Campaign created: {campaign_id}")
+
+    # Test 1: Full shape by default
+    print("\n[1] Listing characters without fields...")
+    full = requests.get(f'{BASE_URL}/campaigns/{campaign_id}/characters').json()
+    if 'backstory' not in full[0] or 'description' not in full[0]:
+        print(f"[FAIL] Full shape missing text fields: {sorted(full[0].keys())}")
+        return False
+    print(f"[OK] {len(full[0])} keys returned")
+
+    # Test 2: Projected admin list
+    print("\n[2] Listing characters with fields=name,slug...")
+    projected = requests.get(f'{BASE_URL}/campaigns/{campaign_id}/characters', params={'fields': 'name,slug'}).json()
+    if sorted(projected[0].keys()) != ['id', 'name', 'slug']:
+        print(f"[FAIL] Unexpected keys: {sorted(projected[0].keys())}")
+        return False
+    print(f"[OK] Keys: {sorted(projected[0].keys())}")
+
+    # Test 3: Projected public list
+    print("\n[3] Public list with fields=name,image_url,stats...")
+    public = requests.get(f'{BASE_URL}/public/campaigns/{slug}/characters', params={'fields': 'name,image_url,stats'}).json()
+    if sorted(public[0].keys()) != ['id', 'image_url', 'name', 'stats']:
+        print(f"[FAIL] Unexpected keys: {sorted(public[0].keys())}")
+        return False
+    print(f"[OK] Keys: {sorted(public[0].keys())}")
+
+    # Test 4: Unknown field
+    print("\n[4] Requesting an unknown field...")
+    bad = requests.get(f'{BASE_URL}/public/campaigns/{slug}/characters', params={'fields': 'name,admin_token'})
+    if bad.status_code != 400:
+        print(f"[FAIL] Expected 400, got {bad.status_code}")
+        return False
+    print(f"[OK] 400: {bad.json()['detail']}")
+
+    print("\n" + "="*70)
+    print("ALL CHARACTER FIELD TESTS PASSED")
+    print("="*70)
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = test_character_fields()
+        exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n[ERROR] Test failed with exception: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
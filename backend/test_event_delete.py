@@ -5,6 +5,7 @@ import requests
 import random
 import string
 import json
+import uuid
 
 BASE_URL = "http://localhost:8001"
 
@@ -58,7 +59,7 @@ def test_event_delete():
         'description': 'This event will be deleted',
         'timestamp_in_episode': 1200,
         'event_type': 'combat',
-        'characters_involved': ['char1']
+        'characters_involved': [str(uuid.uuid4())]
     }
     
     create_resp = requests.post(
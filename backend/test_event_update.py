@@ -5,6 +5,7 @@ import requests
 import random
 import string
 import json
+import uuid
 
 BASE_URL = "http://localhost:8001"
 
@@ -58,7 +59,7 @@ def test_event_update():
         'description': 'Original description',
         'timestamp_in_episode': 1200,
         'event_type': 'combat',
-        'characters_involved': ['char1', 'char2']
+        'characters_involved': [str(uuid.uuid4()), str(uuid.uuid4())]
     }
     
     create_resp = requests.post(
@@ -85,7 +86,7 @@ def test_event_update():
         'description': 'Updated description',
         'timestamp_in_episode': 1500,
         'event_type': 'dialogue',
-        'characters_involved': ['char3']
+        'characters_involved': [str(uuid.uuid4())]
     }
 
     print(f"\nPayload: {json.dumps(update_payload, indent=2)}")
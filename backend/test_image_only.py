@@ -96,6 +96,12 @@ def test_image_upload():
             print(f"[OK] Image uploaded successfully!")
             print(f"    Image URL: {updated.get('image_url', 'N/A')}")
 
+            variants = updated.get('image_variants') or {}
+            if set(variants) == {'thumbnail', 'card', 'full'} and variants['full'] == updated.get('image_url'):
+                print(f"[OK] WebP variants stored: {sorted(variants)}")
+            else:
+                print(f"[ERROR] Unexpected image_variants: {variants}")
+
             # Verify
             fetch = requests.get(
                 f"{BASE_URL}/campaigns/{campaign_id}/characters/{character_id}",
@@ -0,0 +1,122 @@
+"""
+Test the push-based overlay WebSocket feed
+
+Tests:
+1. Connecting to /campaigns/{id}/overlay/ws returns an OVERLAY_SNAPSHOT
+2. Snapshot roster matches GET /overlay/roster
+3. Updating character stats pushes a CHARS_UPDATED patch with only the changed fields
+4. Updating the roster pushes a ROSTER_UPDATED delta
+"""
+import asyncio
+import json
+import random
+import string
+
+import requests
+import websockets
+
+BASE_URL = "http://localhost:8001"
+WS_URL = BASE_URL.replace("http://", "ws://")
+
+
+async def receive_until(ws, message_type, timeout=5):
+    """Receive messages until one of the given type arrives"""
+    while True:
+        raw = await asyncio.wait_for(ws.recv(), timeout=timeout)
+        if raw in ("ping", "pong"):
+            continue
+        message = json.loads(raw)
+        if message.get("type") == message_type:
+            return message
+
+
+async def run_feed_checks(campaign_id, admin_token, character_id):
+    async with websockets.connect(f"{WS_URL}/campaigns/{campaign_id}/overlay/ws") as ws:
+        # Test 1: Snapshot on connect
+        print("\n[1] Waiting for OVERLAY_SNAPSHOT...")
+        snapshot = await receive_until(ws, "OVERLAY_SNAPSHOT")
+        print(f"[OK] Snapshot keys: {sorted(snapshot.keys())}")
+
+        # Test 2: Snapshot roster matches REST roster
+        print("\n[2] Comparing snapshot roster with GET /overlay/roster...")
+        rest_roster = requests.get(f"{BASE_URL}/campaigns/{campaign_id}/overlay/roster").json()
+        if snapshot["roster"] != rest_roster:
+            print(f"[ERROR] Roster mismatch:\n  ws:   {snapshot['roster']}\n  rest: {rest_roster}")
+            return False
+        print("[OK] Roster matches")
+
+        # Test 3: Stats update pushes CHARS_UPDATED
+        print("\n[3] Updating stats, expecting CHARS_UPDATED...")
+        response = requests.patch(
+            f"{BASE_URL}/campaigns/{campaign_id}/characters/{character_id}/stats",
+            json={"hp": 17, "ac": 15},
+            headers={"X-Token": admin_token}
+        )
+        print(f"Status Code: {response.status_code}")
+        delta = await receive_until(ws, "CHARS_UPDATED")
+        patch = delta["characters"][0]
+        if patch["id"] != character_id or patch["stats"].get("hp") != 17 or "name" in patch:
+            print(f"[ERROR] Unexpected delta: {delta}")
+            return False
+        print(f"[OK] CHARS_UPDATED fields={sorted(patch)} hp={patch['stats']['hp']}")
+
+        # Test 4: Roster update pushes ROSTER_UPDATED
+        print("\n[4] Updating roster, expecting ROSTER_UPDATED...")
+        response = requests.patch(
+            f"{BASE_URL}/campaigns/{campaign_id}/roster",
+            json={"character_ids": [character_id]},
+            headers={"X-Token": admin_token}
+        )
+        print(f"Status Code: {response.status_code}")
+        delta = await receive_until(ws, "ROSTER_UPDATED")
+        if delta["active_roster_ids"] != [character_id]:
+            print(f"[ERROR] Unexpected delta: {delta}")
+            return False
+        print(f"[OK] ROSTER_UPDATED {delta['active_roster_ids']}")
+
+    return True
+
+
+def test_overlay_feed():
+    print("\n" + "="*70)
+    print("TESTING OVERLAY WEBSOCKET FEED")
+    print("="*70)
+
+    # Setup: Create test data
+    print("\n[Setup] Creating test user, campaign, and character...")
+    rand_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    email = f"overlaytest{rand_str}@example.com"
+
+    signup = requests.post(f'{BASE_URL}/auth/signup', json={'email': email, 'password': 'testpass123'})
+    user_id = signup.json()['id']
+    print(f"[OK] User created: {user_id}")
+
+    campaign = requests.post(
+        f'{BASE_URL}/campaigns',
+        json={'slug': f'overlaytest-{rand_str}', 'name': 'Overlay Test Campaign'},
+        headers={'Authorization': user_id}
+    )
+    campaign_id = campaign.json()['id']
+    admin_token = campaign.json()['admin_token']
+    print(f"[OK] Campaign created: {campaign_id}")
+
+    character = requests.post(
+        f'{BASE_URL}/campaigns/{campaign_id}/characters',
+        json={'name': 'Overlay Hero', 'stats': {'hp': 20, 'ac': 14}},
+        headers={'X-Token': admin_token}
+    )
+    character_id = character.json()['id']
+    print(f"[OK] Character created: {character_id}")
+
+    return asyncio.run(run_feed_checks(campaign_id, admin_token, character_id))
+
+
+if __name__ == "__main__":
+    try:
+        success = test_overlay_feed()
+        exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n[ERROR] Test failed with exception: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
@@ -0,0 +1,111 @@
+"""
+Test HTTP caching on public campaign routes
+
+Tests:
+1. Public routes return ETag, Last-Modified and Cache-Control
+2. Repeating a request with If-None-Match returns 304 with an empty body
+3. Updating a character changes the /characters ETag
+4. Deleting a character changes the /characters ETag
+"""
+import random
+import string
+
+import requests
+
+BASE_URL = "http://localhost:8001"
+
+
+def test_public_caching():
+    print("\n" + "="*70)
+    print("TESTING PUBLIC ROUTE HTTP CACHING")
+    print("="*70)
+
+    # Setup: Create test data
+    print("\n[Setup] Creating test user, campaign, and characters...")
+    rand_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    email = f"cachetest{rand_str}@example.com"
+    slug = f'cachetest-{rand_str}'
+
+    signup = requests.post(f'{BASE_URL}/auth/signup', json={'email': email, 'password': 'testpass123'})
+    user_id = signup.json()['id']
+
+    campaign = requests.post(
+        f'{BASE_URL}/campaigns',
+        json={'slug': slug, 'name': 'Cache Test Campaign'},
+        headers={'Authorization': user_id}
+    )
+    campaign_id = campaign.json()['id']
+    admin_token = campaign.json()['admin_token']
+
+    character_ids = []
+    for name in ('Cached Hero', 'Cached Rogue'):
+        character = requests.post(
+            f'{BASE_URL}/campaigns/{campaign_id}/characters',
+            json={'name': name},
+            headers={'X-Token': admin_token}
+        )
+        character_ids.append(character.json()['id'])
+    print(f"[OK] Campaign created: {campaign_id}")
+
+    characters_url = f'{BASE_URL}/public/campaigns/{slug}/characters'
+
+    # Test 1 & 2: Validators and 304 on every public route
+    for path in ('', '/characters', '/layout', '/episodes'):
+        url = f'{BASE_URL}/public/campaigns/{slug}{path}'
+        print(f"\n[1] GET {url}")
+        first = requests.get(url)
+        etag = first.headers.get('ETag')
+        if first.status_code != 200 or not etag or 'Cache-Control' not in first.headers:
+            print(f"[FAIL] Missing cache headers: {dict(first.headers)}")
+            return False
+        print(f"[OK] ETag {etag}, Cache-Control: {first.headers['Cache-Control']}")
+
+        print("[2] Repeating with If-None-Match...")
+        second = requests.get(url, headers={'If-None-Match': etag})
+        if second.status_code != 304 or second.content:
+            print(f"[FAIL] Expected empty 304, got {second.status_code}")
+            return False
+        print("[OK] 304 Not Modified")
+
+    # Test 3: Update invalidates
+    print("\n[3] Updating a character...")
+    etag = requests.get(characters_url).headers['ETag']
+    requests.patch(
+        f'{BASE_URL}/campaigns/{campaign_id}/characters/{character_ids[0]}',
+        json={'level': 7},
+        headers={'X-Token': admin_token}
+    )
+    after_update = requests.get(characters_url, headers={'If-None-Match': etag})
+    if after_update.status_code != 200 or after_update.headers['ETag'] == etag:
+        print(f"[FAIL] ETag did not change after update ({after_update.status_code})")
+        return False
+    print(f"[OK] New ETag {after_update.headers['ETag']}")
+
+    # Test 4: Delete invalidates (max(updated_at) alone would miss this)
+    print("\n[4] Deleting the other character...")
+    etag = after_update.headers['ETag']
+    requests.delete(
+        f'{BASE_URL}/campaigns/{campaign_id}/characters/{character_ids[1]}',
+        headers={'X-Token': admin_token}
+    )
+    after_delete = requests.get(characters_url, headers={'If-None-Match': etag})
+    if after_delete.status_code != 200 or len(after_delete.json()) != 1:
+        print(f"[FAIL] Stale response after delete ({after_delete.status_code})")
+        return False
+    print(f"[OK] New ETag {after_delete.headers['ETag']}")
+
+    print("\n" + "="*70)
+    print("ALL PUBLIC CACHING TESTS PASSED")
+    print("="*70)
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        success = test_public_caching()
+        exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n[ERROR] Test failed with exception: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
@@ -0,0 +1,208 @@
+"""
+Test that public and overlay queries are served by indexes (migration 012)
+
+Seeds a campaign with characters, episodes, events and layouts, then runs
+EXPLAIN on each public/overlay query and asserts no sequential scans remain.
+enable_seqscan is turned off so the planner only falls back to a Seq Scan when no
+index can serve the query (tiny seeded tables would otherwise always be seq scanned).
+With seq scans off, reading a whole index is the planner's fallback instead, so
+single-campaign queries must also have an Index Cond on every index scan.
+Where main.py has a query builder, the builder itself is explained.
+
+Requires a migrated database (DATABASE_URL) - no server needed.
+"""
+
+import json
+import os
+import random
+import string
+import sys
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import and_, func, select, text
+
+from database import SessionLocal
+from main import campaigns_with_counts_query, campaign_with_counts_query, overlay_character_query
+from models import User, Campaign, Character, Episode, Event, Roster, CharacterLayout
+from auth import hash_password, generate_campaign_token
+
+CHARACTER_COUNT = 50
+EPISODE_COUNT = 20
+EVENTS_PER_EPISODE = 10
+
+
+def seed(db):
+    """Create a user and a populated campaign, returning (campaign, character, episode, user)"""
+    rand_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+
+    user = User(email=f"plans{rand_str}@example.com", password_hash=hash_password("testpass123"))
+    db.add(user)
+    db.flush()
+
+    campaign = Campaign(
+        owner_id=user.id,
+        name="Query Plan Campaign",
+        slug=f"plans-{rand_str}",
+        admin_token=generate_campaign_token(),
+    )
+    db.add(campaign)
+    db.flush()
+
+    characters = [
+        Character(campaign_id=campaign.id, name=f"Hero {i}", slug=f"hero-{i}", is_active=i % 5 != 0)
+        for i in range(CHARACTER_COUNT)
+    ]
+    episodes = [
+        Episode(
+            campaign_id=campaign.id, name=f"Episode {i}", slug=f"episode-{i}",
+            season=i // 10 + 1, episode_number=i % 10 + 1, is_published=i % 4 != 0,
+        )
+        for i in range(EPISODE_COUNT)
+    ]
+    db.add_all(characters + episodes)
+    db.flush()
+
+    db.add_all([
+        Event(
+            episode_id=episode.id, name=f"Event {j}", timestamp_in_episode=j * 60,
+            characters_involved=[characters[j % CHARACTER_COUNT].id, characters[(j + 1) % CHARACTER_COUNT].id],
+        )
+        for episode in episodes
+        for j in range(EVENTS_PER_EPISODE)
+    ])
+    db.add_all([
+        CharacterLayout(campaign_id=campaign.id, name="Default", is_default=True),
+        CharacterLayout(campaign_id=campaign.id, name="Alternate", is_default=False),
+    ])
+    db.add(Roster(campaign_id=campaign.id, character_ids=[c.id for c in characters[:4]]))
+    db.commit()
+
+    return campaign, characters[1], episodes[1], user
+
+
+# Aggregates across every campaign by design: only sequential scans are checked
+CROSS_CAMPAIGN_QUERIES = {"public campaign list"}
+
+
+def query_shapes(db, campaign, character, episode):
+    """The statements issued by the public and overlay endpoints"""
+    active_filter = and_(Character.campaign_id == campaign.id, Character.is_active == True)
+    published_filter = and_(Episode.campaign_id == campaign.id, Episode.is_published == True)
+    default_filter = and_(CharacterLayout.campaign_id == campaign.id, CharacterLayout.is_default == True)
+
+    return {
+        "public campaign by slug": campaign_with_counts_query(db).filter(Campaign.slug == campaign.slug).limit(1).statement,
+        "public campaign list": campaigns_with_counts_query(db).order_by(
+            Campaign.created_at.asc(), Campaign.id.asc()
+        ).limit(21).statement,
+        "public characters etag": select(func.max(Character.updated_at), func.count(Character.id)).where(active_filter),
+        "public characters": select(Character).where(active_filter),
+        "public character by slug": select(Character).where(and_(active_filter, Character.slug == character.slug)).limit(1),
+        "public layout": select(CharacterLayout).where(default_filter).limit(1),
+        "public episodes etag": select(func.max(Episode.updated_at), func.count(Episode.id)).where(published_filter),
+        "public episodes": select(Episode).where(published_filter).order_by(Episode.season.desc(), Episode.episode_number.asc()),
+        "public episode by slug": select(Episode).where(and_(published_filter, Episode.slug == episode.slug)).limit(1),
+        "public episode events": select(Event).where(Event.episode_id == episode.id),
+        "overlay campaign + roster": select(Campaign, Roster).outerjoin(
+            Roster, Roster.campaign_id == Campaign.id
+        ).where(Campaign.id == campaign.id).limit(1),
+        "overlay roster characters": overlay_character_query(db).filter(Character.campaign_id == campaign.id).statement,
+        "overlay character": select(Character).where(
+            and_(Character.id == character.id, Character.campaign_id == campaign.id)
+        ).limit(1),
+        "overlay active episode": select(Episode).where(published_filter).order_by(Episode.created_at.desc()).limit(1),
+        "overlay episode timeline": select(Event).where(Event.episode_id == episode.id).order_by(Event.timestamp_in_episode.asc()),
+        "campaign theme": select(CharacterLayout).where(default_filter).limit(1),
+        "character events": select(Event).join(Episode, Episode.id == Event.episode_id).where(
+            and_(Event.characters_involved.contains([character.id]), published_filter)
+        ),
+    }
+
+
+def seq_scans(plan):
+    """Tables read with a Seq Scan anywhere in an EXPLAIN (FORMAT JSON) plan tree"""
+    found = [plan["Relation Name"]] if plan.get("Node Type") == "Seq Scan" else []
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+def full_index_scans(plan):
+    """Indexes read end to end (an index scan with no Index Cond) anywhere in a plan tree"""
+    found = []
+    if plan.get("Node Type") in ("Index Scan", "Index Only Scan", "Bitmap Index Scan") and "Index Cond" not in plan:
+        found.append(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        found.extend(full_index_scans(child))
+    return found
+
+
+def explain(db, statement):
+    sql = str(statement.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True}))
+    result = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]["Plan"]
+
+
+def test_query_plans():
+    print("\n" + "="*70)
+    print("TESTING QUERY PLANS FOR PUBLIC AND OVERLAY QUERIES")
+    print("="*70)
+
+    db = SessionLocal()
+    user = None
+    try:
+        print("\n[Setup] Seeding campaign...")
+        campaign, character, episode, user = seed(db)
+        for table in ("characters", "episodes", "events", "character_layouts", "rosters", "campaigns"):
+            db.execute(text(f"ANALYZE {table}"))
+        print(f"[OK] Campaign {campaign.slug}: {CHARACTER_COUNT} characters, {EPISODE_COUNT} episodes")
+
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+
+        failures = []
+        for name, statement in query_shapes(db, campaign, character, episode).items():
+            plan = explain(db, statement)
+            tables = seq_scans(plan)
+            indexes = full_index_scans(plan) if name not in CROSS_CAMPAIGN_QUERIES else []
+            if tables:
+                failures.append(name)
+                print(f"[FAIL] {name}: Seq Scan on {', '.join(tables)}")
+            elif indexes:
+                failures.append(name)
+                print(f"[FAIL] {name}: full scan of {', '.join(indexes)}")
+            else:
+                print(f"[OK] {name}: {plan['Node Type']}")
+
+        db.rollback()
+
+        if failures:
+            print(f"\n[FAIL] {len(failures)} queries still scan whole tables or indexes")
+            return False
+
+        print("\n" + "="*70)
+        print("ALL QUERY PLAN TESTS PASSED")
+        print("="*70)
+        return True
+
+    finally:
+        # Deleting the user cascades to the campaign and everything in it
+        db.rollback()
+        if user is not None:
+            db.delete(user)
+            db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    try:
+        success = test_query_plans()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n[ERROR] Test failed with exception: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
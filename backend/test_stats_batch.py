@@ -0,0 +1,165 @@
+"""
+Test the batch stat endpoint (PATCH /campaigns/{id}/characters/stats:batch)
+
+Tests:
+1. Deltas and set values are applied to several characters in one request
+2. Other stats are kept and unknown stat keys are ignored
+3. The whole batch arrives as one CHARS_UPDATED message
+4. Unknown characters return 404 and nothing is written
+5. Duplicate characters return 400
+6. A null value removes the stat
+"""
+import asyncio
+import json
+import random
+import string
+import uuid
+
+import requests
+import websockets
+
+BASE_URL = "http://localhost:8001"
+WS_URL = BASE_URL.replace("http://", "ws://")
+
+
+async def receive(ws, timeout=5):
+    """Next JSON message (skips heartbeat pings and pongs)"""
+    while True:
+        raw = await asyncio.wait_for(ws.recv(), timeout=timeout)
+        if raw not in ("ping", "pong"):
+            return json.loads(raw)
+
+
+def batch(campaign_id, admin_token, updates):
+    return requests.patch(
+        f"{BASE_URL}/campaigns/{campaign_id}/characters/stats:batch",
+        json={"updates": updates},
+        headers={"X-Token": admin_token}
+    )
+
+
+async def run_batch_checks(campaign_id, admin_token, character_ids):
+    fighter, wizard, rogue = character_ids
+
+    async with websockets.connect(f"{WS_URL}/campaigns/{campaign_id}/ws") as ws:
+        await receive(ws)  # BOOTSTRAP
+
+        # Test 1: AoE damage plus one set value
+        print("\n[1] Applying a fireball to two characters and healing a third...")
+        response = batch(campaign_id, admin_token, [
+            {"character_id": fighter, "deltas": {"hp": -8}},
+            {"character_id": wizard, "deltas": {"hp": -8}},
+            {"character_id": rogue, "stats": {"hp": 25, "mana": 3}},
+        ])
+        if response.status_code != 200:
+            print(f"[FAIL] {response.status_code} {response.text}")
+            return False
+        stats = {c["id"]: c["stats"] for c in response.json()["characters"]}
+        if [stats[cid]["hp"] for cid in character_ids] != [12, 12, 25]:
+            print(f"[FAIL] Unexpected hp: {stats}")
+            return False
+        print(f"[OK] hp: {[stats[cid]['hp'] for cid in character_ids]}")
+
+        # Test 2: Merge semantics
+        if stats[fighter].get("ac") != 14 or "mana" in stats[rogue]:
+            print(f"[FAIL] Unexpected stats: {stats}")
+            return False
+        print("[OK] ac kept, unknown key ignored")
+
+        # Test 3: One broadcast
+        print("\n[3] Waiting for CHARS_UPDATED...")
+        message = await receive(ws)
+        patched = sorted(p["id"] for p in message.get("characters", []))
+        if message["type"] != "CHARS_UPDATED" or patched != sorted(character_ids):
+            print(f"[FAIL] Unexpected message: {message}")
+            return False
+        print(f"[OK] One CHARS_UPDATED for {len(patched)} characters")
+
+    # Test 4: Unknown character
+    print("\n[4] Including an unknown character...")
+    response = batch(campaign_id, admin_token, [
+        {"character_id": fighter, "deltas": {"hp": -100}},
+        {"character_id": str(uuid.uuid4()), "deltas": {"hp": -100}},
+    ])
+    fighter_hp = requests.get(f"{BASE_URL}/campaigns/{campaign_id}/characters/{fighter}").json()["stats"]["hp"]
+    if response.status_code != 404 or fighter_hp != 12:
+        print(f"[FAIL] Expected 404 and no change, got {response.status_code} hp={fighter_hp}")
+        return False
+    print("[OK] 404, fighter unchanged")
+
+    # Test 5: Duplicates
+    print("\n[5] Listing a character twice...")
+    response = batch(campaign_id, admin_token, [
+        {"character_id": fighter, "deltas": {"hp": -1}},
+        {"character_id": fighter, "deltas": {"hp": -1}},
+    ])
+    if response.status_code != 400:
+        print(f"[FAIL] Expected 400, got {response.status_code}")
+        return False
+    print(f"[OK] 400: {response.json()['detail']}")
+
+    # Test 6: Clearing a stat
+    print("\n[6] Clearing the wizard's ac...")
+    response = batch(campaign_id, admin_token, [
+        {"character_id": wizard, "stats": {"ac": None}},
+    ])
+    if response.status_code != 200:
+        print(f"[FAIL] {response.status_code} {response.text}")
+        return False
+    wizard_stats = requests.get(f"{BASE_URL}/campaigns/{campaign_id}/characters/{wizard}").json()["stats"]
+    if "ac" in wizard_stats or wizard_stats.get("hp") != 12:
+        print(f"[FAIL] Unexpected stats: {wizard_stats}")
+        return False
+    print(f"[OK] ac removed, hp kept: {wizard_stats}")
+
+    return True
+
+
+def test_stats_batch():
+    print("\n" + "="*70)
+    print("TESTING BATCH STAT UPDATES")
+    print("="*70)
+
+    # Setup: Create test data
+    print("\n[Setup] Creating test user, campaign, and characters...")
+    rand_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    email = f"statsbatch{rand_str}@example.com"
+
+    signup = requests.post(f'{BASE_URL}/auth/signup', json={'email': email, 'password': 'testpass123'})
+    user_id = signup.json()['id']
+
+    campaign = requests.post(
+        f'{BASE_URL}/campaigns',
+        json={'slug': f'statsbatch-{rand_str}', 'name': 'Stats Batch Campaign'},
+        headers={'Authorization': user_id}
+    )
+    campaign_id = campaign.json()['id']
+    admin_token = campaign.json()['admin_token']
+
+    character_ids = [
+        requests.post(
+            f'{BASE_URL}/campaigns/{campaign_id}/characters',
+            json={'name': name, 'stats': {'hp': 20, 'ac': 14}},
+            headers={'X-Token': admin_token}
+        ).json()['id']
+        for name in ('Batch Fighter', 'Batch Wizard', 'Batch Rogue')
+    ]
+    print(f"[OK] Campaign {campaign_id}, characters {character_ids}")
+
+    success = asyncio.run(run_batch_checks(campaign_id, admin_token, character_ids))
+    if success:
+        print("\n" + "="*70)
+        print("ALL BATCH STAT TESTS PASSED")
+        print("="*70)
+    return success
+
+
+if __name__ == "__main__":
+    try:
+        success = test_stats_batch()
+        exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n[ERROR] Test failed with exception: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
@@ -0,0 +1,133 @@
+"""
+Test coalescing of rapid character updates into CHARS_UPDATED broadcasts
+
+Tests:
+1. A burst of stat updates for two characters arrives as CHARS_UPDATED patches
+2. Patches carry only the changed fields (plus id)
+3. The last value of each character wins
+4. /metrics counts every update and never more messages than updates
+"""
+import asyncio
+import json
+import random
+import string
+
+import requests
+import websockets
+
+BASE_URL = "http://localhost:8001"
+WS_URL = BASE_URL.replace("http://", "ws://")
+
+
+async def receive(ws, timeout=5):
+    """Next JSON message (skips heartbeat pings and pongs)"""
+    while True:
+        raw = await asyncio.wait_for(ws.recv(), timeout=timeout)
+        if raw not in ("ping", "pong"):
+            return json.loads(raw)
+
+
+def coalescing_stats():
+    return requests.get(f"{BASE_URL}/metrics").json()["websockets"]["coalescing"]
+
+
+async def run_coalesce_checks(campaign_id, admin_token, character_ids):
+    async with websockets.connect(f"{WS_URL}/campaigns/{campaign_id}/ws") as ws:
+        await receive(ws)  # BOOTSTRAP
+        before = coalescing_stats()
+
+        # Test 1: Burst of updates
+        print("\n[1] Sending 10 stat updates for two characters back to back...")
+        updates = [(character_ids[i % 2], {"hp": 20 + i, "ac": 14}) for i in range(10)]
+
+        session = requests.Session()
+        final_hp = {}
+        for character_id, stats in updates:
+            session.patch(
+                f"{BASE_URL}/campaigns/{campaign_id}/characters/{character_id}/stats",
+                json=stats,
+                headers={"X-Token": admin_token}
+            )
+            final_hp[character_id] = stats["hp"]
+
+        received = {}
+        messages = 0
+        while received != final_hp:
+            message = await receive(ws)
+            if message["type"] != "CHARS_UPDATED":
+                print(f"[FAIL] Unexpected message type: {message['type']}")
+                return False
+            messages += 1
+            for patch in message["characters"]:
+                # Test 2: Only changed fields
+                if not set(patch) <= {"id", "stats", "updated_at"}:
+                    print(f"[FAIL] Patch carries unchanged fields: {sorted(patch)}")
+                    return False
+                received[patch["id"]] = patch["stats"]["hp"]
+        print(f"[OK] {len(updates)} updates arrived in {messages} CHARS_UPDATED message(s)")
+        print("[OK] Patches carry only id, stats and updated_at")
+
+        # Test 3: Last value wins
+        print(f"[OK] Final hp per character: {received}")
+
+        # Test 4: Metrics
+        print("\n[4] Checking /metrics...")
+        after = coalescing_stats()
+        sent = after["messages"] - before["messages"]
+        merged = after["updates"] - before["updates"]
+        if merged < len(updates) or sent > merged:
+            print(f"[FAIL] Unexpected counters: {before} -> {after}")
+            return False
+        print(f"[OK] window={after['window_ms']}ms updates={merged} messages={sent}")
+
+    return True
+
+
+def test_ws_coalesce():
+    print("\n" + "="*70)
+    print("TESTING CHARACTER UPDATE COALESCING")
+    print("="*70)
+
+    # Setup: Create test data
+    print("\n[Setup] Creating test user, campaign, and characters...")
+    rand_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    email = f"wscoalesce{rand_str}@example.com"
+
+    signup = requests.post(f'{BASE_URL}/auth/signup', json={'email': email, 'password': 'testpass123'})
+    user_id = signup.json()['id']
+
+    campaign = requests.post(
+        f'{BASE_URL}/campaigns',
+        json={'slug': f'wscoalesce-{rand_str}', 'name': 'WS Coalesce Campaign'},
+        headers={'Authorization': user_id}
+    )
+    campaign_id = campaign.json()['id']
+    admin_token = campaign.json()['admin_token']
+
+    character_ids = [
+        requests.post(
+            f'{BASE_URL}/campaigns/{campaign_id}/characters',
+            json={'name': name, 'stats': {'hp': 10, 'ac': 14}},
+            headers={'X-Token': admin_token}
+        ).json()['id']
+        for name in ('Coalesce Fighter', 'Coalesce Wizard')
+    ]
+    print(f"[OK] Campaign {campaign_id}, characters {character_ids}")
+
+    success = asyncio.run(run_coalesce_checks(campaign_id, admin_token, character_ids))
+    if success:
+        print("\n" + "="*70)
+        print("ALL COALESCING TESTS PASSED")
+        print("="*70)
+    return success
+
+
+if __name__ == "__main__":
+    try:
+        success = test_ws_coalesce()
+        exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n[ERROR] Test failed with exception: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
@@ -0,0 +1,112 @@
+"""
+Test the server-side WebSocket heartbeat and connection accounting
+
+Tests:
+1. Live connections are reported per campaign in /metrics
+2. The server pings idle clients, and answering "pong" keeps the socket open
+3. Closed sockets are removed from the counts
+4. Client "ping" is still answered with "pong"
+"""
+import asyncio
+import json
+import random
+import string
+
+import requests
+import websockets
+
+BASE_URL = "http://localhost:8001"
+WS_URL = BASE_URL.replace("http://", "ws://")
+
+
+def campaign_connection_count(campaign_id):
+    stats = requests.get(f"{BASE_URL}/metrics").json()["websockets"]["campaign"]
+    return stats["by_campaign"].get(campaign_id, 0)
+
+
+async def run_heartbeat_checks(campaign_id):
+    ws_url = f"{WS_URL}/campaigns/{campaign_id}/ws"
+
+    async with websockets.connect(ws_url) as first, websockets.connect(ws_url) as second:
+        json.loads(await first.recv())
+        json.loads(await second.recv())
+
+        # Test 1: Live counts
+        print("\n[1] Checking /metrics with two open sockets...")
+        count = campaign_connection_count(campaign_id)
+        if count != 2:
+            print(f"[FAIL] Expected 2 connections, got {count}")
+            return False
+        print(f"[OK] {count} connections")
+
+        # Test 2: Server ping
+        stats = requests.get(f"{BASE_URL}/metrics").json()["websockets"]["campaign"]
+        print(f"\n[2] Waiting up to {stats['ping_interval'] + 5}s for a server ping...")
+        ping = await asyncio.wait_for(first.recv(), timeout=stats["ping_interval"] + 5)
+        if ping != "ping":
+            print(f"[FAIL] Expected 'ping', got {ping!r}")
+            return False
+        await first.send("pong")
+        print("[OK] Received 'ping', answered 'pong'")
+
+    # Test 3: Disconnects are counted
+    print("\n[3] Checking /metrics after closing both sockets...")
+    await asyncio.sleep(0.5)
+    count = campaign_connection_count(campaign_id)
+    if count != 0:
+        print(f"[FAIL] Expected 0 connections, got {count}")
+        return False
+    print("[OK] 0 connections")
+
+    # Test 4: Client ping
+    print("\n[4] Sending a client ping...")
+    async with websockets.connect(ws_url) as ws:
+        json.loads(await ws.recv())
+        await ws.send("ping")
+        reply = await asyncio.wait_for(ws.recv(), timeout=5)
+        if reply != "pong":
+            print(f"[FAIL] Expected 'pong', got {reply!r}")
+            return False
+        print("[OK] Received 'pong'")
+
+    return True
+
+
+def test_ws_heartbeat():
+    print("\n" + "="*70)
+    print("TESTING WEBSOCKET HEARTBEAT AND CONNECTION COUNTS")
+    print("="*70)
+
+    # Setup: Create test data
+    print("\n[Setup] Creating test user and campaign...")
+    rand_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    email = f"wsheartbeat{rand_str}@example.com"
+
+    signup = requests.post(f'{BASE_URL}/auth/signup', json={'email': email, 'password': 'testpass123'})
+    user_id = signup.json()['id']
+
+    campaign = requests.post(
+        f'{BASE_URL}/campaigns',
+        json={'slug': f'wsheartbeat-{rand_str}', 'name': 'WS Heartbeat Campaign'},
+        headers={'Authorization': user_id}
+    )
+    campaign_id = campaign.json()['id']
+    print(f"[OK] Campaign {campaign_id}")
+
+    success = asyncio.run(run_heartbeat_checks(campaign_id))
+    if success:
+        print("\n" + "="*70)
+        print("ALL HEARTBEAT TESTS PASSED")
+        print("="*70)
+    return success
+
+
+if __name__ == "__main__":
+    try:
+        success = test_ws_heartbeat()
+        exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n[ERROR] Test failed with exception: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
@@ -0,0 +1,123 @@
+"""
+Test field-level patches on character broadcasts
+
+Tests:
+1. PATCH /characters/{id} broadcasts only the changed columns (no backstory)
+2. Setting a field to its current value is not reported as a change
+3. Clients connected with ?full=true receive the full character instead
+4. The BOOTSTRAP snapshot has the patched values merged in
+"""
+import asyncio
+import json
+import random
+import string
+
+import requests
+import websockets
+
+BASE_URL = "http://localhost:8001"
+WS_URL = BASE_URL.replace("http://", "ws://")
+
+
+async def receive(ws, timeout=5):
+    """Next JSON message (skips heartbeat pings and pongs)"""
+    while True:
+        raw = await asyncio.wait_for(ws.recv(), timeout=timeout)
+        if raw not in ("ping", "pong"):
+            return json.loads(raw)
+
+
+def update_character(campaign_id, admin_token, character_id, data):
+    return requests.patch(
+        f"{BASE_URL}/campaigns/{campaign_id}/characters/{character_id}",
+        json=data,
+        headers={"X-Token": admin_token}
+    )
+
+
+async def run_patch_checks(campaign_id, admin_token, character_id):
+    ws_url = f"{WS_URL}/campaigns/{campaign_id}/ws"
+
+    async with websockets.connect(ws_url) as patch_ws, websockets.connect(f"{ws_url}?full=true") as full_ws:
+        await receive(patch_ws)  # BOOTSTRAP
+        await receive(full_ws)
+
+        # Test 1 & 2: Only changed columns
+        print("\n[1] Renaming the character (level unchanged)...")
+        update_character(campaign_id, admin_token, character_id, {"name": "Patched Hero", "level": 3})
+        message = await receive(patch_ws)
+        patch = message["characters"][0]
+        if message["type"] != "CHARS_UPDATED" or set(patch) != {"id", "name", "updated_at"}:
+            print(f"[FAIL] Unexpected patch: {message}")
+            return False
+        print(f"[OK] Patch fields: {sorted(patch)} (no backstory, level unchanged)")
+
+        # Test 3: Full objects on request
+        print("\n[3] Checking the ?full=true client...")
+        full = await receive(full_ws)
+        character = full["characters"][0]
+        if full["seq"] != message["seq"] or character["name"] != "Patched Hero" or "backstory" not in character:
+            print(f"[FAIL] Unexpected full message: {full}")
+            return False
+        print(f"[OK] Full character with {len(character)} fields, same seq {full['seq']}")
+
+    # Test 4: Snapshot
+    print("\n[4] Reconnecting for a BOOTSTRAP...")
+    async with websockets.connect(ws_url) as ws:
+        bootstrap = await receive(ws)
+        hero = next(c for c in bootstrap["characters"] if c["id"] == character_id)
+        if hero["name"] != "Patched Hero" or hero["backstory"] != "A very long backstory":
+            print(f"[FAIL] Snapshot not merged: {hero}")
+            return False
+        print("[OK] Snapshot has the new name and keeps the backstory")
+
+    return True
+
+
+def test_ws_patches():
+    print("\n" + "="*70)
+    print("TESTING FIELD-LEVEL CHARACTER PATCHES")
+    print("="*70)
+
+    # Setup: Create test data
+    print("\n[Setup] Creating test user, campaign, and character...")
+    rand_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    email = f"wspatches{rand_str}@example.com"
+
+    signup = requests.post(f'{BASE_URL}/auth/signup', json={'email': email, 'password': 'testpass123'})
+    user_id = signup.json()['id']
+
+    campaign = requests.post(
+        f'{BASE_URL}/campaigns',
+        json={'slug': f'wspatches-{rand_str}', 'name': 'WS Patches Campaign'},
+        headers={'Authorization': user_id}
+    )
+    campaign_id = campaign.json()['id']
+    admin_token = campaign.json()['admin_token']
+
+    character = requests.post(
+        f'{BASE_URL}/campaigns/{campaign_id}/characters',
+        json={'name': 'Patch Hero', 'backstory': 'A very long backstory', 'stats': {'hp': 10}},
+        headers={'X-Token': admin_token}
+    )
+    character_id = character.json()['id']
+    update_character(campaign_id, admin_token, character_id, {"level": 3})
+    print(f"[OK] Campaign {campaign_id}, character {character_id}")
+
+    success = asyncio.run(run_patch_checks(campaign_id, admin_token, character_id))
+    if success:
+        print("\n" + "="*70)
+        print("ALL PATCH TESTS PASSED")
+        print("="*70)
+    return success
+
+
+if __name__ == "__main__":
+    try:
+        success = test_ws_patches()
+        exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n[ERROR] Test failed with exception: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
@@ -0,0 +1,138 @@
+"""
+Test the cached BOOTSTRAP snapshot and "deltas since N" resume on /campaigns/{id}/ws
+
+Tests:
+1. BOOTSTRAP carries seq and epoch
+2. Every broadcast carries the next sequence number
+3. Reconnecting with ?since=N&epoch=E replays only the missed messages after a RESUME
+4. An unknown epoch falls back to a full BOOTSTRAP built from the cached, updated snapshot
+"""
+import asyncio
+import json
+import random
+import string
+
+import requests
+import websockets
+
+BASE_URL = "http://localhost:8001"
+WS_URL = BASE_URL.replace("http://", "ws://")
+
+
+async def receive(ws, timeout=5):
+    """Next JSON message (skips heartbeat pings and pongs)"""
+    while True:
+        raw = await asyncio.wait_for(ws.recv(), timeout=timeout)
+        if raw not in ("ping", "pong"):
+            return json.loads(raw)
+
+
+def update_stats(campaign_id, admin_token, character_id, hp):
+    return requests.patch(
+        f"{BASE_URL}/campaigns/{campaign_id}/characters/{character_id}/stats",
+        json={"hp": hp},
+        headers={"X-Token": admin_token}
+    )
+
+
+async def run_resume_checks(campaign_id, admin_token, character_id):
+    ws_url = f"{WS_URL}/campaigns/{campaign_id}/ws"
+
+    async with websockets.connect(ws_url) as ws:
+        # Test 1: Bootstrap
+        print("\n[1] Waiting for BOOTSTRAP...")
+        bootstrap = await receive(ws)
+        if bootstrap.get("type") != "BOOTSTRAP" or "seq" not in bootstrap or "epoch" not in bootstrap:
+            print(f"[ERROR] Unexpected first message: {bootstrap}")
+            return False
+        epoch = bootstrap["epoch"]
+        print(f"[OK] BOOTSTRAP seq={bootstrap['seq']} epoch={epoch} characters={len(bootstrap['characters'])}")
+
+        # Test 2: Sequence numbers
+        print("\n[2] Sending two stat updates...")
+        update_stats(campaign_id, admin_token, character_id, 11)
+        first = await receive(ws)
+        update_stats(campaign_id, admin_token, character_id, 12)
+        second = await receive(ws)
+        if (first["seq"], second["seq"]) != (bootstrap["seq"] + 1, bootstrap["seq"] + 2):
+            print(f"[ERROR] Unexpected sequence numbers: {first['seq']}, {second['seq']}")
+            return False
+        last_seen = second["seq"]
+        print(f"[OK] seq {first['seq']} -> {second['seq']}")
+
+    # Changes while disconnected
+    update_stats(campaign_id, admin_token, character_id, 13)
+    update_stats(campaign_id, admin_token, character_id, 14)
+
+    # Test 3: Resume
+    print(f"\n[3] Reconnecting with since={last_seen}...")
+    async with websockets.connect(f"{ws_url}?since={last_seen}&epoch={epoch}") as ws:
+        resume = await receive(ws)
+        if resume.get("type") != "RESUME" or resume["since"] != last_seen:
+            print(f"[ERROR] Expected RESUME, got: {resume.get('type')}")
+            return False
+        missed = [await receive(ws) for _ in range(resume["seq"] - last_seen)]
+        # The two updates may have been coalesced into one CHARS_UPDATED
+        hps = [m["characters"][0]["stats"]["hp"] for m in missed]
+        if [m["seq"] for m in missed] != list(range(last_seen + 1, resume["seq"] + 1)) or hps[-1] != 14:
+            print(f"[ERROR] Unexpected replay: {[(m['seq'], m['type']) for m in missed]}")
+            return False
+        print(f"[OK] Replayed seq {missed[0]['seq']}..{missed[-1]['seq']} (hp {hps})")
+
+    # Test 4: Unknown epoch
+    print("\n[4] Reconnecting with a stale epoch...")
+    async with websockets.connect(f"{ws_url}?since={last_seen}&epoch=stale") as ws:
+        bootstrap = await receive(ws)
+        if bootstrap.get("type") != "BOOTSTRAP":
+            print(f"[ERROR] Expected BOOTSTRAP, got: {bootstrap.get('type')}")
+            return False
+        hero = next(c for c in bootstrap["characters"] if c["id"] == character_id)
+        if hero["stats"]["hp"] != 14:
+            print(f"[ERROR] Snapshot is stale: hp={hero['stats']['hp']}")
+            return False
+        print(f"[OK] Full BOOTSTRAP with current state (hp={hero['stats']['hp']})")
+
+    return True
+
+
+def test_ws_resume():
+    print("\n" + "="*70)
+    print("TESTING WEBSOCKET BOOTSTRAP SNAPSHOT AND RESUME")
+    print("="*70)
+
+    # Setup: Create test data
+    print("\n[Setup] Creating test user, campaign, and character...")
+    rand_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    email = f"wsresume{rand_str}@example.com"
+
+    signup = requests.post(f'{BASE_URL}/auth/signup', json={'email': email, 'password': 'testpass123'})
+    user_id = signup.json()['id']
+
+    campaign = requests.post(
+        f'{BASE_URL}/campaigns',
+        json={'slug': f'wsresume-{rand_str}', 'name': 'WS Resume Campaign'},
+        headers={'Authorization': user_id}
+    )
+    campaign_id = campaign.json()['id']
+    admin_token = campaign.json()['admin_token']
+
+    character = requests.post(
+        f'{BASE_URL}/campaigns/{campaign_id}/characters',
+        json={'name': 'Resume Hero', 'stats': {'hp': 10, 'ac': 14}},
+        headers={'X-Token': admin_token}
+    )
+    character_id = character.json()['id']
+    print(f"[OK] Campaign {campaign_id}, character {character_id}")
+
+    return asyncio.run(run_resume_checks(campaign_id, admin_token, character_id))
+
+
+if __name__ == "__main__":
+    try:
+        success = test_ws_resume()
+        exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n[ERROR] Test failed with exception: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
@@ -5,7 +5,7 @@ import { useParams, useRouter } from 'next/navigation';
 import { ProtectedRoute } from '@/components/ProtectedRoute';
 import { AdminHeader } from '@/components/AdminHeader';
 import { useAuth } from '@/hooks/useAuth';
-import { getCharacters, getCampaignLayouts, updateCharacter, Character } from '@/lib/api';
+import { getCharacters, getCampaignLayouts, updateCharacterStatsBatch, Character } from '@/lib/api';
 
 interface StatValue {
   [characterId: string]: {
@@ -73,7 +73,8 @@ function QuickStatsContent() {
   }, [campaignId]);
 
   const handleStatChange = (characterId: string, statKey: string, value: string) => {
-    const numValue = value === '' ? undefined : parseInt(value);
+    const parsed = parseInt(value);
+    const numValue = isNaN(parsed) ? undefined : parsed;
     setStatValues((prev) => ({
       ...prev,
       [characterId]: {
@@ -93,27 +94,26 @@ function QuickStatsContent() {
       // Get admin token from localStorage
       const adminToken = localStorage.getItem(`campaign_${campaignId}_token`) || '';
 
-      // Update each character individually
-      const updatePromises = characters.map(async (character) => {
-        const characterStats = statValues[character.id];
-
-        // Only update if there are changes
-        const hasCharacterChanges = Object.keys(characterStats).some(
-          (key) => characterStats[key] !== character.stats?.[key]
-        );
-
-        if (hasCharacterChanges) {
-          await updateCharacter(
-            campaignId,
-            character.id,
-            { stats: characterStats },
-            undefined,
-            adminToken
+      // Only send characters with changes
+      const updates = characters
+        .filter((character) => {
+          const characterStats = statValues[character.id];
+          return Object.keys(characterStats).some(
+            (key) => characterStats[key] !== character.stats?.[key]
           );
-        }
-      });
+        })
+        .map((character) => ({
+          character_id: character.id,
+          // Cleared fields are sent as null so the stat is removed, not kept
+          stats: Object.fromEntries(
+            Object.entries(statValues[character.id]).map(([key, value]) => [key, value ?? null])
+          ),
+        }));
 
-      await Promise.all(updatePromises);
+      // All characters in one request (one transaction, one broadcast)
+      if (updates.length > 0) {
+        await updateCharacterStatsBatch(campaignId, updates, adminToken);
+      }
 
       setHasChanges(false);
       setSuccess(true);
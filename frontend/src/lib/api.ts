@@ -366,6 +366,45 @@ export const updateCharacter = async (
   }
 };
 
+export interface CharacterStatsBatchUpdate {
+  character_id: string;
+  stats?: { [key: string]: number | null };
+  deltas?: { [key: string]: number };
+}
+
+/**
+ * Update the stats of several characters in one request (one transaction, one broadcast)
+ * `stats` sets values (null removes a stat), `deltas` adds to the current values (e.g. { hp: -8 })
+ */
+export const updateCharacterStatsBatch = async (
+  campaignId: string,
+  updates: CharacterStatsBatchUpdate[],
+  adminToken?: string
+): Promise<{ characters: Array<{ id: string; stats: Record<string, number>; updated_at: string }> }> => {
+  try {
+    // Use campaign admin token for this request if provided
+    const config = adminToken ? { headers: { 'X-Token': adminToken } } : {};
+
+    const response = await apiClient.patch(
+      `/campaigns/${campaignId}/characters/stats:batch`,
+      { updates },
+      config
+    );
+    return response.data;
+  } catch (error: any) {
+    if (error.response?.status === 404) {
+      throw new Error('Character not found');
+    }
+    if (error.response?.status === 403) {
+      throw new Error('You do not have permission to update these characters');
+    }
+    if (error.response?.data?.detail) {
+      throw new Error(error.response.data.detail);
+    }
+    throw new Error('Failed to update character stats');
+  }
+};
+
 /**
  * Delete a character
  */